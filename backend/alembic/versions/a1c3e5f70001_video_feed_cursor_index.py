@@ -0,0 +1,32 @@
+"""Add composite (created_at, id) index for video feed keyset pagination
+
+Revision ID: a1c3e5f70001
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are created by the application on startup, so only add the index
+    # when it is missing.
+    op.create_index(
+        "ix_videos_created_at_id",
+        "videos",
+        ["created_at", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_videos_created_at_id", table_name="videos", if_exists=True)
@@ -0,0 +1,38 @@
+"""Add composite sort-key indexes for cursor pagination of list endpoints
+
+Revision ID: a1c3e5f70002
+Revises: a1c3e5f70001
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70002"
+down_revision: Union[str, None] = "a1c3e5f70001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ("ix_music_tracks_created_at_id", "music_tracks", ["created_at", "id"]),
+    ("ix_video_comments_video_id_created_at_id", "video_comments", ["video_id", "created_at", "id"]),
+    ("ix_cultural_events_start_at_id", "cultural_events", ["start_at", "id"]),
+    ("ix_archive_entries_upvotes_created_at_id", "archive_entries", ["community_upvotes", "created_at", "id"]),
+    ("ix_community_profiles_priority_created_at_id", "community_profiles", ["priority", "created_at", "id"]),
+    ("ix_messages_thread_id_created_at_id", "messages", ["thread_id", "created_at", "id"]),
+    ("ix_feedback_created_at_id", "feedback", ["created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,66 @@
+"""Add generated tsvector columns and GIN indexes for video and music search
+
+Revision ID: a1c3e5f70003
+Revises: a1c3e5f70002
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70003"
+down_revision: Union[str, None] = "a1c3e5f70002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+VIDEO_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(title_en, '')), 'A') || "
+    "setweight(to_tsvector('french', coalesce(title_fr, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(creator_handle, '') || ' ' || "
+    "coalesce(creator_name_en, '') || ' ' || coalesce(creator_name_fr, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description_en, '')), 'C') || "
+    "setweight(to_tsvector('french', coalesce(description_fr, '')), 'C')"
+)
+
+MUSIC_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(artist, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Tables may already have been created with these columns by the
+    # application on startup, hence IF NOT EXISTS throughout.
+    op.execute(
+        "ALTER TABLE videos ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({VIDEO_SEARCH_DOCUMENT}) STORED"
+    )
+    op.execute(
+        "ALTER TABLE music_tracks ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({MUSIC_SEARCH_DOCUMENT}) STORED"
+    )
+    op.create_index(
+        "ix_videos_search_vector",
+        "videos",
+        ["search_vector"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_music_tracks_search_vector",
+        "music_tracks",
+        ["search_vector"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_music_tracks_search_vector", table_name="music_tracks", if_exists=True)
+    op.drop_index("ix_videos_search_vector", table_name="videos", if_exists=True)
+    op.execute("ALTER TABLE music_tracks DROP COLUMN IF EXISTS search_vector")
+    op.execute("ALTER TABLE videos DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,71 @@
+"""Add trigram-indexed search text for cultural events and community profiles
+
+Revision ID: a1c3e5f70004
+Revises: a1c3e5f70003
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70004"
+down_revision: Union[str, None] = "a1c3e5f70003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+EVENT_SEARCH_TEXT = (
+    "lower(coalesce(title->>'en', '') || ' ' || coalesce(title->>'fr', '') || ' ' || "
+    "coalesce(description->>'en', '') || ' ' || coalesce(description->>'fr', '') || ' ' || "
+    "coalesce(location->>'en', '') || ' ' || coalesce(location->>'fr', ''))"
+)
+
+COMMUNITY_SEARCH_TEXT = (
+    "lower(coalesce(space->>'en', '') || ' ' || coalesce(space->>'fr', '') || ' ' || region)"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE cultural_events ADD COLUMN IF NOT EXISTS search_text text "
+        f"GENERATED ALWAYS AS ({EVENT_SEARCH_TEXT}) STORED"
+    )
+    op.execute(
+        "ALTER TABLE community_profiles ADD COLUMN IF NOT EXISTS search_text text "
+        f"GENERATED ALWAYS AS ({COMMUNITY_SEARCH_TEXT}) STORED"
+    )
+    op.create_index(
+        "ix_cultural_events_search_text_trgm",
+        "cultural_events",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_community_profiles_search_text_trgm",
+        "community_profiles",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_community_profiles_languages",
+        "community_profiles",
+        ["languages"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_community_profiles_languages", table_name="community_profiles", if_exists=True)
+    op.drop_index("ix_community_profiles_search_text_trgm", table_name="community_profiles", if_exists=True)
+    op.drop_index("ix_cultural_events_search_text_trgm", table_name="cultural_events", if_exists=True)
+    op.execute("ALTER TABLE community_profiles DROP COLUMN IF EXISTS search_text")
+    op.execute("ALTER TABLE cultural_events DROP COLUMN IF EXISTS search_text")
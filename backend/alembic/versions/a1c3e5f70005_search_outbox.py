@@ -0,0 +1,33 @@
+"""Add search_outbox table for transactional search-index updates
+
+Revision ID: a1c3e5f70005
+Revises: a1c3e5f70004
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70005"
+down_revision: Union[str, None] = "a1c3e5f70004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "search_outbox",
+        sa.Column("id", sa.BigInteger(), sa.Identity(start=1), primary_key=True),
+        sa.Column("index_type", sa.String(), nullable=False),
+        sa.Column("document_id", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("search_outbox", if_exists=True)
@@ -0,0 +1,47 @@
+"""Add media_uploads table for presigned direct-to-S3 uploads
+
+Revision ID: a1c3e5f70006
+Revises: a1c3e5f70005
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70006"
+down_revision: Union[str, None] = "a1c3e5f70005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "media_uploads",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("file_type", sa.String(), nullable=False),
+        sa.Column("object_key", sa.Text(), nullable=False, unique=True),
+        sa.Column("content_type", sa.String(), nullable=False),
+        sa.Column("multipart_upload_id", sa.Text(), nullable=True),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_index("ix_media_uploads_user_id", "media_uploads", ["user_id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_media_uploads_user_id", table_name="media_uploads", if_exists=True)
+    op.drop_table("media_uploads", if_exists=True)
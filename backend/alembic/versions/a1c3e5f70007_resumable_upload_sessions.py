@@ -0,0 +1,42 @@
+"""Add media_upload_parts and part_size for resumable upload sessions
+
+Revision ID: a1c3e5f70007
+Revises: a1c3e5f70006
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70007"
+down_revision: Union[str, None] = "a1c3e5f70006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE media_uploads ADD COLUMN IF NOT EXISTS part_size INTEGER")
+    op.create_table(
+        "media_upload_parts",
+        sa.Column(
+            "upload_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("media_uploads.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("part_number", sa.Integer(), primary_key=True),
+        sa.Column("etag", sa.Text(), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("media_upload_parts", if_exists=True)
+    op.execute("ALTER TABLE media_uploads DROP COLUMN IF EXISTS part_size")
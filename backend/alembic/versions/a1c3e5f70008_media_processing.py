@@ -0,0 +1,51 @@
+"""Add media_jobs table and processing columns on videos
+
+Revision ID: a1c3e5f70008
+Revises: a1c3e5f70007
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70008"
+down_revision: Union[str, None] = "a1c3e5f70007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE videos ADD COLUMN IF NOT EXISTS duration_seconds NUMERIC(10, 3)")
+    op.execute("ALTER TABLE videos ADD COLUMN IF NOT EXISTS hls_url TEXT")
+    op.execute("ALTER TABLE videos ADD COLUMN IF NOT EXISTS processing_status VARCHAR")
+    op.create_table(
+        "media_jobs",
+        sa.Column("id", sa.BigInteger(), sa.Identity(start=1), primary_key=True),
+        sa.Column(
+            "video_id",
+            sa.String(),
+            sa.ForeignKey("videos.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("source_url", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_index("ix_media_jobs_status_id", "media_jobs", ["status", "id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_media_jobs_status_id", table_name="media_jobs", if_exists=True)
+    op.drop_table("media_jobs", if_exists=True)
+    op.execute("ALTER TABLE videos DROP COLUMN IF EXISTS processing_status")
+    op.execute("ALTER TABLE videos DROP COLUMN IF EXISTS hls_url")
+    op.execute("ALTER TABLE videos DROP COLUMN IF EXISTS duration_seconds")
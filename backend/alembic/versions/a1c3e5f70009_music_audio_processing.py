@@ -0,0 +1,47 @@
+"""Add audio processing columns on music_tracks and music jobs
+
+Revision ID: a1c3e5f70009
+Revises: a1c3e5f70008
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70009"
+down_revision: Union[str, None] = "a1c3e5f70008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE music_tracks ADD COLUMN IF NOT EXISTS audio_url TEXT")
+    op.execute("ALTER TABLE music_tracks ADD COLUMN IF NOT EXISTS preview_opus_url TEXT")
+    op.execute("ALTER TABLE music_tracks ADD COLUMN IF NOT EXISTS waveform_peaks BYTEA")
+    op.execute("ALTER TABLE music_tracks ADD COLUMN IF NOT EXISTS processing_status VARCHAR")
+
+    op.execute(
+        "ALTER TABLE media_jobs ADD COLUMN IF NOT EXISTS music_track_id VARCHAR "
+        "REFERENCES music_tracks (id) ON DELETE CASCADE"
+    )
+    op.execute("ALTER TABLE media_jobs ALTER COLUMN video_id DROP NOT NULL")
+    op.execute("ALTER TABLE media_jobs DROP CONSTRAINT IF EXISTS ck_media_jobs_one_target")
+    op.execute(
+        "ALTER TABLE media_jobs ADD CONSTRAINT ck_media_jobs_one_target "
+        "CHECK ((video_id IS NULL) <> (music_track_id IS NULL))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM media_jobs WHERE music_track_id IS NOT NULL")
+    op.execute("ALTER TABLE media_jobs DROP CONSTRAINT IF EXISTS ck_media_jobs_one_target")
+    op.execute("ALTER TABLE media_jobs ALTER COLUMN video_id SET NOT NULL")
+    op.execute("ALTER TABLE media_jobs DROP COLUMN IF EXISTS music_track_id")
+
+    op.execute("ALTER TABLE music_tracks DROP COLUMN IF EXISTS processing_status")
+    op.execute("ALTER TABLE music_tracks DROP COLUMN IF EXISTS waveform_peaks")
+    op.execute("ALTER TABLE music_tracks DROP COLUMN IF EXISTS preview_opus_url")
+    op.execute("ALTER TABLE music_tracks DROP COLUMN IF EXISTS audio_url")
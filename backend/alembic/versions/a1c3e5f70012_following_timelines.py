@@ -0,0 +1,72 @@
+"""Add materialized following timelines and their fan-out queue
+
+Revision ID: a1c3e5f70012
+Revises: a1c3e5f70011
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70012"
+down_revision: Union[str, None] = "a1c3e5f70011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "timeline_entries",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("video_id", sa.String(), sa.ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("creator_handle", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_timeline_entries_user_id_created_at_video_id",
+        "timeline_entries",
+        ["user_id", "created_at", "video_id"],
+        if_not_exists=True,
+    )
+
+    op.create_table(
+        "timeline_fanout_jobs",
+        sa.Column("id", sa.BigInteger(), sa.Identity(start=1), primary_key=True),
+        sa.Column("video_id", sa.String(), sa.ForeignKey("videos.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("last_user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        if_not_exists=True,
+    )
+
+    op.create_table(
+        "timeline_pull_creators",
+        sa.Column("creator_handle", sa.String(), primary_key=True),
+        sa.Column("follower_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        if_not_exists=True,
+    )
+
+    op.create_index(
+        "ix_videos_creator_handle_created_at_id",
+        "videos",
+        ["creator_handle", "created_at", "id"],
+        if_not_exists=True,
+    )
+    op.create_index("ix_creator_followers_user_id", "creator_followers", ["user_id"], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_creator_followers_user_id", table_name="creator_followers", if_exists=True)
+    op.drop_index("ix_videos_creator_handle_created_at_id", table_name="videos", if_exists=True)
+    op.drop_table("timeline_pull_creators", if_exists=True)
+    op.drop_table("timeline_fanout_jobs", if_exists=True)
+    op.drop_index(
+        "ix_timeline_entries_user_id_created_at_video_id", table_name="timeline_entries", if_exists=True
+    )
+    op.drop_table("timeline_entries", if_exists=True)
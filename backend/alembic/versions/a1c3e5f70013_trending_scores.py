@@ -0,0 +1,53 @@
+"""Add time-decayed trending scores to videos and events
+
+Revision ID: a1c3e5f70013
+Revises: a1c3e5f70012
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70013"
+down_revision: Union[str, None] = "a1c3e5f70012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Seed scores as if all existing engagement happened when the row was created,
+# with the 24 hour half-life (services.trending.TRENDING_HALF_LIFE_HOURS)
+_SEED_SCORE = (
+    "ln({gain}) + ln(2) / 86400 * extract(epoch FROM created_at - TIMESTAMP '2026-01-01 00:00:00')"
+)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE videos ADD COLUMN IF NOT EXISTS trending_score DOUBLE PRECISION")
+    op.execute("ALTER TABLE cultural_events ADD COLUMN IF NOT EXISTS trending_score DOUBLE PRECISION")
+
+    video_gain = "0.6 * likes + 0.4 * comments + 1.1 * shares"
+    op.execute(
+        f"UPDATE videos SET trending_score = {_SEED_SCORE.format(gain=video_gain)} "
+        f"WHERE trending_score IS NULL AND {video_gain} > 0"
+    )
+    op.execute(
+        f"UPDATE cultural_events SET trending_score = {_SEED_SCORE.format(gain='interested_count')} "
+        "WHERE trending_score IS NULL AND interested_count > 0"
+    )
+
+    op.create_index("ix_videos_trending_score_id", "videos", ["trending_score", "id"], if_not_exists=True)
+    op.create_index(
+        "ix_cultural_events_trending_score_id",
+        "cultural_events",
+        ["trending_score", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cultural_events_trending_score_id", table_name="cultural_events", if_exists=True)
+    op.drop_index("ix_videos_trending_score_id", table_name="videos", if_exists=True)
+    op.execute("ALTER TABLE cultural_events DROP COLUMN IF EXISTS trending_score")
+    op.execute("ALTER TABLE videos DROP COLUMN IF EXISTS trending_score")
@@ -0,0 +1,40 @@
+"""Track row updates and sync watermarks for incremental search syncs
+
+Revision ID: a1c3e5f70014
+Revises: a1c3e5f70013
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70014"
+down_revision: Union[str, None] = "a1c3e5f70013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("music_tracks", "cultural_events", "community_profiles")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP")
+        op.execute(f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN updated_at SET NOT NULL")
+
+    op.create_table(
+        "search_sync_watermarks",
+        sa.Column("index_type", sa.String(), primary_key=True),
+        sa.Column("synced_at", sa.DateTime(), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("search_sync_watermarks", if_exists=True)
+    for table in reversed(_TABLES):
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS updated_at")
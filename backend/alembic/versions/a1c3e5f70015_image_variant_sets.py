@@ -0,0 +1,33 @@
+"""Add image_variant_sets table recording generated image derivatives
+
+Revision ID: a1c3e5f70015
+Revises: a1c3e5f70014
+Create Date: 2026-10-18 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70015"
+down_revision: Union[str, None] = "a1c3e5f70014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "image_variant_sets",
+        sa.Column("object_key", sa.Text(), primary_key=True),
+        sa.Column("variants", postgresql.JSONB(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("image_variant_sets", if_exists=True)
@@ -0,0 +1,42 @@
+"""Add engagement_counter_flushes table making shared counter flushes idempotent
+
+Revision ID: a1c3e5f70016
+Revises: a1c3e5f70015
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70016"
+down_revision: Union[str, None] = "a1c3e5f70015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "engagement_counter_flushes",
+        sa.Column("batch_id", sa.String(), primary_key=True),
+        sa.Column("applied_at", sa.DateTime(timezone=True), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_engagement_counter_flushes_applied_at",
+        "engagement_counter_flushes",
+        ["applied_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_engagement_counter_flushes_applied_at",
+        table_name="engagement_counter_flushes",
+        if_exists=True,
+    )
+    op.drop_table("engagement_counter_flushes", if_exists=True)
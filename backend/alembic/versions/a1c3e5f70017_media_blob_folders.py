@@ -0,0 +1,37 @@
+"""Scope media_blobs dedup to the upload folder
+
+Revision ID: a1c3e5f70017
+Revises: a1c3e5f70016
+Create Date: 2026-10-19 00:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c3e5f70017"
+down_revision: Union[str, None] = "a1c3e5f70016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE media_blobs ADD COLUMN IF NOT EXISTS folder TEXT")
+    # Existing objects stay in the folder they were first uploaded to
+    op.execute("UPDATE media_blobs SET folder = regexp_replace(object_key, '/[^/]*$', '') WHERE folder IS NULL")
+    op.execute("ALTER TABLE media_blobs ALTER COLUMN folder SET NOT NULL")
+    op.execute("ALTER TABLE media_blobs DROP CONSTRAINT IF EXISTS media_blobs_pkey")
+    op.execute("ALTER TABLE media_blobs ADD PRIMARY KEY (folder, sha256)")
+
+
+def downgrade() -> None:
+    # Keep one row per content, the most referenced one
+    op.execute(
+        "DELETE FROM media_blobs a USING media_blobs b "
+        "WHERE a.sha256 = b.sha256 AND (a.ref_count, a.folder) < (b.ref_count, b.folder)"
+    )
+    op.execute("ALTER TABLE media_blobs DROP CONSTRAINT IF EXISTS media_blobs_pkey")
+    op.execute("ALTER TABLE media_blobs ADD PRIMARY KEY (sha256)")
+    op.execute("ALTER TABLE media_blobs DROP COLUMN IF EXISTS folder")
@@ -0,0 +1,134 @@
+"""Benchmark trending score maintenance against a large table.
+
+Compares the incremental update done by the engagement counter flush (only
+rows with new engagement are written) with recomputing every row's score,
+and times the trending page query, on a scratch copy of the ``videos``
+counter columns in a temporary table. Nothing outside the temporary table
+is touched.
+
+    cd backend
+    DATABASE_URL=postgresql+asyncpg://... python scripts/benchmark_trending.py --rows 10000000
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, case, column, func, literal, text, update, values
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql.expression import ColumnElement, FromClause
+
+from thala_backend.db.session import engine
+from thala_backend.models.media import Video
+from thala_backend.services.trending import TRENDING_WEIGHTS, epoch_offset, trending_score_expression
+
+COUNTERS = sorted(TRENDING_WEIGHTS[Video])
+
+bench_videos = Table(
+    "bench_trending_videos",
+    MetaData(),
+    Column("id", String, primary_key=True),
+    *(Column(key, Integer, nullable=False) for key in COUNTERS),
+    Column("trending_score", Float, nullable=True),
+    prefixes=["TEMPORARY"],
+)
+
+
+def _gain(source: FromClause) -> ColumnElement[float]:
+    weights = TRENDING_WEIGHTS[Video]
+    terms = [source.c[key] * literal(weights[key], Float) for key in COUNTERS]
+    return sum(terms[1:], terms[0])
+
+
+async def _timed(conn: AsyncConnection, label: str, statement: Any) -> float:
+    started = time.perf_counter()
+    await conn.execute(statement)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<48} {elapsed * 1000:>10.1f} ms")
+    return elapsed
+
+
+async def _seed(conn: AsyncConnection, rows: int, engaged: float) -> None:
+    await conn.run_sync(bench_videos.metadata.create_all)
+    started = time.perf_counter()
+    await conn.execute(
+        text(
+            f"INSERT INTO {bench_videos.name} (id, {', '.join(COUNTERS)}, trending_score) "
+            f"SELECT 'v' || n, {', '.join('(random() * 1000)::int' for _ in COUNTERS)}, "
+            "CASE WHEN random() < :engaged THEN random() * 200 END "
+            "FROM generate_series(1, :rows) AS n"
+        ),
+        {"rows": rows, "engaged": engaged},
+    )
+    await conn.execute(text(f"CREATE INDEX ON {bench_videos.name} (trending_score, id)"))
+    await conn.execute(text(f"ANALYZE {bench_videos.name}"))
+    print(f"Seeded {rows:,} rows in {time.perf_counter() - started:.1f} s")
+
+
+async def _flush(conn: AsyncConnection, rows: int, touched: int, batch_size: int) -> float:
+    """One counter flush touching ``touched`` random rows, batched like the aggregator."""
+    ids = sorted(f"v{n}" for n in random.sample(range(1, rows + 1), touched))
+    now = datetime.now(timezone.utc)
+    elapsed = 0.0
+    for start in range(0, len(ids), batch_size):
+        batch = values(
+            column("id", String),
+            *(column(key, Integer) for key in COUNTERS),
+            name="deltas",
+        ).data([(row_id, *(random.randint(-1, 3) for _ in COUNTERS)) for row_id in ids[start:start + batch_size]])
+        assignments = {key: func.greatest(bench_videos.c[key] + batch.c[key], 0) for key in COUNTERS}
+        assignments["trending_score"] = trending_score_expression(bench_videos.c.trending_score, _gain(batch), now)
+        started = time.perf_counter()
+        await conn.execute(update(bench_videos).where(bench_videos.c.id == batch.c.id).values(assignments))
+        elapsed += time.perf_counter() - started
+    print(f"{f'Incremental flush, {touched:,} rows':<48} {elapsed * 1000:>10.1f} ms")
+    return elapsed
+
+
+async def main(rows: int, engaged: float, touched: list[int], batch_size: int) -> None:
+    async with engine.connect() as conn:
+        await _seed(conn, rows, engaged)
+        await conn.commit()
+
+        for count in touched:
+            await _flush(conn, rows, min(count, rows), batch_size)
+            await conn.commit()
+
+        page = text(
+            f"SELECT id FROM {bench_videos.name} WHERE trending_score IS NOT NULL "
+            "ORDER BY trending_score DESC, id DESC LIMIT 20"
+        )
+        await _timed(conn, "Trending page (LIMIT 20)", page)
+
+        # What a periodic job rescoring every row would write on each run
+        now = datetime.now(timezone.utc)
+        await _timed(
+            conn,
+            f"Full recompute, {rows:,} rows",
+            update(bench_videos).values(
+                trending_score=case(
+                    (_gain(bench_videos) > 0, func.ln(_gain(bench_videos)) + literal(epoch_offset(now), Float))
+                )
+            ),
+        )
+        await conn.commit()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Rows in the scratch table")
+    parser.add_argument("--engaged", type=float, default=0.3, help="Share of rows that already have a score")
+    parser.add_argument(
+        "--touched",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Rows receiving engagement per simulated flush",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per UPDATE, as in the aggregator")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.engaged, args.touched, args.batch_size))
@@ -0,0 +1,44 @@
+"""Sync the MeiliSearch indexes from the database.
+
+Each run only sends rows updated since the previous run of the same index,
+as recorded in ``search_sync_watermarks``. ``--full`` re-sends every row and
+removes documents whose row was deleted; the first run of an index is always
+full. Day-to-day changes reach the indexes through the search outbox, so this
+is for backfills and periodic reconciliation.
+
+    cd backend
+    DATABASE_URL=postgresql+asyncpg://... python scripts/sync_search.py --index music events
+"""
+import argparse
+import asyncio
+
+from thala_backend.db.session import AsyncSessionLocal, engine
+from thala_backend.services.search_service import SearchService, close_search_client, get_search_service
+
+INDEX_TYPES = [
+    SearchService.INDEX_VIDEOS,
+    SearchService.INDEX_MUSIC,
+    SearchService.INDEX_EVENTS,
+    SearchService.INDEX_COMMUNITIES,
+]
+
+
+async def main(index_types: list[str], full: bool, batch_size: int) -> None:
+    try:
+        async with AsyncSessionLocal() as session:
+            search = get_search_service(session)
+            for index_type in index_types:
+                synced = await search.sync_index(index_type, full=full, batch_size=batch_size)
+                print(f"{index_type:<12} {synced:>10,} documents synced")
+    finally:
+        await close_search_client()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--index", nargs="+", choices=INDEX_TYPES, default=INDEX_TYPES, help="Indexes to sync")
+    parser.add_argument("--full", action="store_true", help="Re-send every row and prune deleted documents")
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows fetched and documents sent per batch")
+    args = parser.parse_args()
+    asyncio.run(main(args.index, args.full, args.batch_size))
@@ -0,0 +1,269 @@
+"""HTTP conditional requests (ETag / Last-Modified) and Cache-Control policies."""
+import hashlib
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Headers a 304 repeats from the full response (RFC 9110 section 15.4.5)
+_NOT_MODIFIED_HEADERS = ("cache-control", "content-location", "date", "etag", "expires", "last-modified", "vary")
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from the values a representation depends on.
+
+    Args:
+        parts: Row ids, versions, ``updated_at`` timestamps, etc.
+
+    Returns:
+        ETag header value, e.g. ``W/"3f2a..."``
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(repr(part).encode())
+        digest.update(b"\x1f")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def http_date(value: datetime) -> str:
+    """Format a timestamp for Last-Modified; naive timestamps are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an ETag against an If-None-Match list."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def is_not_modified(headers: Headers, etag: Optional[str], last_modified: Optional[str]) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against a representation's validators.
+
+    If-None-Match takes precedence; If-Modified-Since is only used without it.
+
+    Args:
+        headers: Request headers
+        etag: ETag of the current representation
+        last_modified: Last-Modified of the current representation (HTTP date)
+
+    Returns:
+        True if the client's copy is still current
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def not_modified_response(
+    request: Request,
+    etag: Optional[str] = None,
+    updated_at: Optional[datetime] = None,
+) -> Optional[Response]:
+    """
+    Return a 304 response when the client's copy is current, before any serialization.
+
+    Routes call this as soon as they know the validators (typically after
+    loading one row) and return the 304 if there is one; otherwise they pass
+    the same validators to ``set_validators``.
+
+    Args:
+        request: Incoming request
+        etag: ETag of the representation (see ``weak_etag``)
+        updated_at: Last modification time of the representation
+
+    Returns:
+        304 response, or None if the full response must be sent
+    """
+    if request.method not in ("GET", "HEAD"):
+        return None
+    last_modified = http_date(updated_at) if updated_at else None
+    if not is_not_modified(request.headers, etag, last_modified):
+        return None
+
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, updated_at)
+    return response
+
+
+def set_validators(response: Response, etag: Optional[str] = None, updated_at: Optional[datetime] = None) -> None:
+    """Set the ETag and Last-Modified headers of a response."""
+    if etag:
+        response.headers["ETag"] = etag
+    if updated_at:
+        response.headers["Last-Modified"] = http_date(updated_at)
+
+
+def validator_headers(etag: Optional[str] = None, updated_at: Optional[datetime] = None) -> dict[str, str]:
+    """ETag and Last-Modified as a header dict, for responses built ahead of time."""
+    headers = {}
+    if etag:
+        headers["ETag"] = etag
+    if updated_at:
+        headers["Last-Modified"] = http_date(updated_at)
+    return headers
+
+
+def cache_control_route(policy: str) -> type[APIRoute]:
+    """
+    Route class adding a Cache-Control policy to a router's successful GET responses.
+
+    Use as ``APIRouter(route_class=cache_control_route("public, max-age=60"))``.
+    Routes that set their own Cache-Control keep it.
+
+    Args:
+        policy: Cache-Control header value
+
+    Returns:
+        APIRoute subclass
+    """
+
+    class CacheControlRoute(APIRoute):
+        def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            handler = super().get_route_handler()
+
+            async def route_handler(request: Request) -> Response:
+                response = await handler(request)
+                if (
+                    request.method in ("GET", "HEAD")
+                    and response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED)
+                    and "cache-control" not in response.headers
+                ):
+                    response.headers["Cache-Control"] = policy
+                return response
+
+            return route_handler
+
+    return CacheControlRoute
+
+
+class ConditionalRequestMiddleware:
+    """
+    Answer conditional GET/HEAD requests with 304 Not Modified.
+
+    Responses carrying validators (set by the route or cached with the
+    response) are compared as-is. Other successful responses up to
+    ``max_body_size`` are given a weak ETag hashed from their body, which
+    saves the transfer even where the route cannot compute a cheaper one.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_size: int = 1024 * 1024):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: ASGI application
+            max_body_size: Largest body buffered to compute an ETag, in bytes
+        """
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        start: Optional[Message] = None
+        body: list[bytes] = []
+        size = 0
+        # buffer: holding the response back; passthrough: forwarding it as is;
+        # swallow: a 304 was sent, drop the rest of the body
+        mode = "buffer"
+
+        async def send_conditional(message: Message) -> None:
+            nonlocal start, size, mode
+
+            if mode == "passthrough":
+                await send(message)
+                return
+            if mode == "swallow":
+                return
+
+            if message["type"] == "http.response.start":
+                start = message
+                if message["status"] != status.HTTP_200_OK:
+                    mode = "passthrough"
+                    await send(message)
+                return
+
+            assert start is not None
+            response_headers = MutableHeaders(raw=start["headers"])
+            more_body = message.get("more_body", False)
+
+            if message["type"] != "http.response.body" or "no-store" in response_headers.get("cache-control", ""):
+                mode = "passthrough"
+                await send(start)
+                await send(message)
+                return
+
+            if "etag" in response_headers:
+                # Validators are already known: no need to look at the body
+                if is_not_modified(request_headers, response_headers["etag"], response_headers.get("last-modified")):
+                    await self._send_not_modified(start, send)
+                    mode = "swallow"
+                else:
+                    mode = "passthrough"
+                    await send(start)
+                    await send(message)
+                return
+
+            if scope["method"] == "HEAD":
+                # No body to hash
+                mode = "passthrough"
+                await send(start)
+                await send(message)
+                return
+
+            body.append(message.get("body", b""))
+            size += len(body[-1])
+            if size > self.max_body_size:
+                mode = "passthrough"
+                await send(start)
+                await send({"type": "http.response.body", "body": b"".join(body), "more_body": more_body})
+                return
+            if more_body:
+                return
+
+            content = b"".join(body)
+            response_headers["ETag"] = weak_etag(content)
+            if is_not_modified(request_headers, response_headers["etag"], response_headers.get("last-modified")):
+                await self._send_not_modified(start, send)
+                return
+            await send(start)
+            await send({"type": "http.response.body", "body": content})
+
+        await self.app(scope, receive, send_conditional)
+
+    async def _send_not_modified(self, start: Message, send: Send) -> None:
+        headers = Headers(raw=start["headers"])
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.HTTP_304_NOT_MODIFIED,
+                "headers": [
+                    (name.encode("latin-1"), value.encode("latin-1"))
+                    for name, value in headers.items()
+                    if name in _NOT_MODIFIED_HEADERS
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,147 @@
+"""Keyset (cursor) pagination shared by the list endpoints."""
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Select, and_, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import ColumnElement, UnaryExpression
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+CURSOR_DESCRIPTION = (
+    f"Opaque cursor from a previous page's {NEXT_CURSOR_HEADER} header (takes precedence over the offset)"
+)
+
+
+def _sort_key(clause: Any) -> tuple[ColumnElement[Any], bool]:
+    """Split an ORDER BY clause into its column and whether it sorts descending."""
+
+    if isinstance(clause, UnaryExpression) and clause.modifier in (operators.desc_op, operators.asc_op):
+        return clause.element, clause.modifier is operators.desc_op
+    return clause, False
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        ((tag, raw),) = value.items()
+        if tag == "dt":
+            return datetime.fromisoformat(raw)
+        if tag == "uuid":
+            return UUID(raw)
+        if tag == "dec":
+            return Decimal(raw)
+        raise ValueError(f"Unknown cursor value tag: {tag}")
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of a row as an opaque, URL-safe cursor."""
+
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Raises:
+        HTTPException: If the cursor is malformed or does not match the sort keys
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(raw, list) or len(raw) != size:
+            raise ValueError("Cursor does not match sort keys")
+        return [_decode_value(v) for v in raw]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        ) from exc
+
+
+def _after(keys: Sequence[tuple[ColumnElement[Any], bool]], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Build the predicate selecting rows strictly after ``values`` in sort order."""
+
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1:
+        # Uniform direction: a single row-value comparison, which Postgres
+        # matches directly against a composite index.
+        columns = tuple_(*(column for column, _ in keys))
+        bound = tuple_(*values)
+        return columns < bound if directions.pop() else columns > bound
+
+    clauses = []
+    for i, (column, descending) in enumerate(keys):
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*(keys[j][0] == values[j] for j in range(i)), step))
+    return or_(*clauses)
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select[Any],
+    order_by: Sequence[Any],
+    *,
+    limit: int,
+    cursor: str | None = None,
+    offset: int = 0,
+) -> tuple[list[Any], str | None]:
+    """
+    Execute ``stmt`` as one keyset-paginated page.
+
+    Args:
+        session: Database session
+        stmt: Select of a single ORM entity, with filters but no ordering
+        order_by: Ordering clauses (e.g. ``Video.created_at.desc()``); the last
+            one must be a unique tie-breaker such as the primary key
+        limit: Page size
+        cursor: Cursor of the previous page, or None for the first page
+        offset: Legacy offset, only applied when no cursor is given
+
+    Returns:
+        The page items and the cursor for the next page (None on the last page)
+    """
+    keys = [_sort_key(clause) for clause in order_by]
+
+    stmt = stmt.order_by(*order_by).limit(limit)
+    if cursor:
+        stmt = stmt.where(_after(keys, decode_cursor(cursor, len(keys))))
+    elif offset:
+        stmt = stmt.offset(offset)
+
+    result = await session.execute(stmt)
+    items = list(result.scalars().all())
+
+    next_cursor = None
+    if len(items) == limit:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column, _ in keys])
+
+    return items, next_cursor
+
+
+def set_next_cursor(response: Response, next_cursor: str | None) -> None:
+    """Expose the next-page cursor on the response, if there is one."""
+
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -7,11 +7,16 @@ from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route
 from ...api.deps import get_current_user
 from ...db.session import get_db
 from ...models.user import User
 
-router = APIRouter(prefix="/admin", tags=["admin"])
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    route_class=cache_control_route("no-store"),
+)
 
 
 class SQLQueryRequest(BaseModel):
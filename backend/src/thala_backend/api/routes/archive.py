@@ -1,44 +1,76 @@
 """Cultural archive endpoints for the Thala backend."""
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route
 from ...api.deps import get_current_user
+from ...api.pagination import CURSOR_DESCRIPTION, NEXT_CURSOR_HEADER, paginate
 from ...db.session import get_db
 from ...models.archive import ArchiveEntry
 from ...models.user import User
 from ...schemas.archive import ArchiveEntryResponse
+from ...services.engagement_counters import get_engagement_counters
+from ...services.image_derivatives import attach_image_variants
+from ...services.response_cache import (
+    CACHE_TAG_ARCHIVE,
+    CachedResponse,
+    cached_response,
+    invalidate_cached_responses,
+)
 
-router = APIRouter(prefix="/archive", tags=["archive"])
+router = APIRouter(
+    prefix="/archive",
+    tags=["archive"],
+    route_class=cache_control_route("public, max-age=60"),
+)
+
+ARCHIVE_COUNTERS = (ArchiveEntry.community_upvotes, ArchiveEntry.registered_users)
 
 
 @router.get("", response_model=list[ArchiveEntryResponse])
 async def list_archive_entries(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     category: str | None = Query(None, description="Filter by category"),
-    session: AsyncSession = Depends(get_db),
-) -> list[ArchiveEntryResponse]:
+) -> Response:
     """List archive entries with pagination and optional category filter."""
 
-    stmt = select(ArchiveEntry)
-
-    # Apply category filter if provided
-    if category:
-        stmt = stmt.where(ArchiveEntry.category == category)
+    async def build(session: AsyncSession) -> CachedResponse:
+        stmt = select(ArchiveEntry)
+
+        # Apply category filter if provided
+        if category:
+            stmt = stmt.where(ArchiveEntry.category == category)
+
+        entries, next_cursor = await paginate(
+            session,
+            stmt,
+            (
+                ArchiveEntry.community_upvotes.desc(),
+                ArchiveEntry.created_at.desc(),
+                ArchiveEntry.id.desc(),
+            ),
+            limit=limit,
+            cursor=cursor,
+            offset=skip,
+        )
+        responses = [ArchiveEntryResponse.model_validate(entry) for entry in entries]
+        await get_engagement_counters().merge_pending(responses, *ARCHIVE_COUNTERS)
+        await attach_image_variants(session, responses)
+        return CachedResponse.from_content(
+            responses,
+            headers={NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None,
+        )
 
-    stmt = (
-        stmt
-        .offset(skip)
-        .limit(limit)
-        .order_by(ArchiveEntry.community_upvotes.desc(), ArchiveEntry.created_at.desc())
+    return await cached_response(
+        "archive:list",
+        {"skip": skip, "limit": limit, "cursor": cursor, "category": category},
+        tags=(CACHE_TAG_ARCHIVE,),
+        build=build,
     )
 
-    result = await session.execute(stmt)
-    entries = result.scalars().all()
-
-    return [ArchiveEntryResponse.model_validate(entry) for entry in entries]
-
 
 @router.get("/{entry_id}", response_model=ArchiveEntryResponse)
 async def get_archive_entry(
@@ -57,7 +89,10 @@ async def get_archive_entry(
             detail=f"Archive entry with id '{entry_id}' not found"
         )
 
-    return ArchiveEntryResponse.model_validate(entry)
+    response = ArchiveEntryResponse.model_validate(entry)
+    await get_engagement_counters().merge_pending([response], *ARCHIVE_COUNTERS)
+    await attach_image_variants(session, [response])
+    return response
 
 
 @router.post("", response_model=ArchiveEntryResponse, status_code=status.HTTP_201_CREATED)
@@ -92,6 +127,7 @@ async def create_archive_entry(
 
     session.add(entry)
     await session.commit()
+    await invalidate_cached_responses(CACHE_TAG_ARCHIVE)
     await session.refresh(entry)
 
     return ArchiveEntryResponse.model_validate(entry)
@@ -118,12 +154,16 @@ async def upvote_archive_entry(
     # Increment upvote counts
     # In a full implementation, you'd track individual user upvotes in a separate table
     # to prevent duplicate upvotes. This is a simplified version.
-    entry.community_upvotes += 1
-    entry.registered_users += 1
-
-    await session.commit()
+    # Cached lists pick the new counts up when they expire.
+    counters = get_engagement_counters()
+    await counters.increment(ArchiveEntry.community_upvotes, entry_id)
+    await counters.increment(ArchiveEntry.registered_users, entry_id)
 
     return {
-        "community_upvotes": entry.community_upvotes,
-        "registered_users": entry.registered_users
+        "community_upvotes": await counters.current(
+            ArchiveEntry.community_upvotes, entry_id, entry.community_upvotes
+        ),
+        "registered_users": await counters.current(
+            ArchiveEntry.registered_users, entry_id, entry.registered_users
+        ),
     }
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route
 from ...api.deps import get_current_user
 from ...core import security
 from ...core.config import settings
@@ -18,8 +19,13 @@ from ...schemas.auth import (
 )
 from ...schemas.user import UserResponse
 from ...services.google_oauth import verify_google_token
+from ...services.image_derivatives import attach_image_variants
 
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(
+    prefix="/auth",
+    tags=["auth"],
+    route_class=cache_control_route("no-store"),
+)
 
 
 @router.post("/google", response_model=TokenResponse)
@@ -127,6 +133,8 @@ async def get_current_user_profile(
     user: User = Depends(get_current_user),
 ) -> UserResponse:
     """Get the currently authenticated user's profile."""
-    return UserResponse.model_validate(user)
+    response = UserResponse.model_validate(user)
+    await attach_image_variants(session, [response])
+    return response
 
 
@@ -1,11 +1,14 @@
 """Community profiles and spaces endpoints for the Thala backend."""
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route
 from ...api.deps import get_current_user
+from ...api.pagination import CURSOR_DESCRIPTION, NEXT_CURSOR_HEADER, paginate
+from ...core.config import settings
 from ...db.session import get_db
 from ...models.community import CommunityHostRequest, CommunityProfile, CommunityView
 from ...models.user import User
@@ -15,29 +18,49 @@ from ...schemas.community import (
     CommunityProfileResponse,
     CommunityViewCreate,
 )
+from ...services.response_cache import CACHE_TAG_COMMUNITY_PROFILES, CachedResponse, cached_response
 
-router = APIRouter(prefix="/community", tags=["community"])
+router = APIRouter(
+    prefix="/community",
+    tags=["community"],
+    route_class=cache_control_route("public, max-age=300"),
+)
 
 
 @router.get("/profiles", response_model=list[CommunityProfileResponse])
 async def list_community_profiles(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
-    session: AsyncSession = Depends(get_db),
-) -> list[CommunityProfileResponse]:
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+) -> Response:
     """List community profiles with pagination, ordered by priority."""
 
-    stmt = (
-        select(CommunityProfile)
-        .offset(skip)
-        .limit(limit)
-        .order_by(CommunityProfile.priority.desc(), CommunityProfile.created_at.desc())
-    )
-
-    result = await session.execute(stmt)
-    profiles = result.scalars().all()
+    async def build(session: AsyncSession) -> CachedResponse:
+        profiles, next_cursor = await paginate(
+            session,
+            select(CommunityProfile),
+            (
+                CommunityProfile.priority.desc(),
+                CommunityProfile.created_at.desc(),
+                CommunityProfile.id.desc(),
+            ),
+            limit=limit,
+            cursor=cursor,
+            offset=skip,
+        )
+        return CachedResponse.from_content(
+            [CommunityProfileResponse.model_validate(profile) for profile in profiles],
+            headers={NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None,
+        )
 
-    return [CommunityProfileResponse.model_validate(profile) for profile in profiles]
+    # Profiles are only edited out of band, so they are cached longer
+    return await cached_response(
+        "community:profiles",
+        {"skip": skip, "limit": limit, "cursor": cursor},
+        tags=(CACHE_TAG_COMMUNITY_PROFILES,),
+        build=build,
+        ttl=settings.response_cache_static_ttl_seconds,
+    )
 
 
 @router.get("/profiles/{profile_id}", response_model=CommunityProfileResponse)
@@ -113,6 +136,7 @@ async def submit_host_request(
 
 @router.get("/host-requests", response_model=list[CommunityHostRequestResponse])
 async def list_host_requests(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of items to return"),
     status_filter: Optional[str] = Query(None, description="Filter by status (pending, reviewed, approved, rejected)"),
@@ -137,4 +161,6 @@ async def list_host_requests(
     result = await session.execute(stmt)
     requests = result.scalars().all()
 
+    # Applicants' contact details: never stored in shared caches
+    response.headers["Cache-Control"] = "private, no-cache"
     return [CommunityHostRequestResponse.model_validate(req) for req in requests]
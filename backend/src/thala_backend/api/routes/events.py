@@ -1,24 +1,36 @@
 """Cultural events endpoints for the Thala backend."""
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route
 from ...api.deps import get_current_user
+from ...api.pagination import CURSOR_DESCRIPTION, paginate, set_next_cursor
 from ...db.session import get_db
 from ...models.event import CulturalEvent, EventInterest
 from ...models.user import User
 from ...schemas.event import CulturalEventResponse
 from ...schemas.user import UserProfile
+from ...services.engagement_counters import get_engagement_counters
+from ...services.image_derivatives import attach_image_variants
+from ...services.search_outbox import enqueue_search_refresh
+from ...services.search_service import SearchService
 
-router = APIRouter(prefix="/events", tags=["events"])
+router = APIRouter(
+    prefix="/events",
+    tags=["events"],
+    route_class=cache_control_route("public, max-age=60"),
+)
 
 
 @router.get("", response_model=list[CulturalEventResponse])
 async def list_events(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     upcoming_only: bool = Query(True, description="Only show upcoming events"),
     session: AsyncSession = Depends(get_db),
 ) -> list[CulturalEventResponse]:
@@ -31,17 +43,50 @@ async def list_events(
         now = datetime.utcnow()
         stmt = stmt.where(CulturalEvent.start_at >= now)
 
-    stmt = (
-        stmt
-        .offset(skip)
-        .limit(limit)
-        .order_by(CulturalEvent.start_at.asc())
+    events, next_cursor = await paginate(
+        session,
+        stmt,
+        (CulturalEvent.start_at.asc(), CulturalEvent.id.asc()),
+        limit=limit,
+        cursor=cursor,
+        offset=skip,
     )
+    set_next_cursor(response, next_cursor)
 
-    result = await session.execute(stmt)
-    events = result.scalars().all()
+    responses = [CulturalEventResponse.model_validate(event) for event in events]
+    await get_engagement_counters().merge_pending(responses, CulturalEvent.interested_count)
+    await attach_image_variants(session, responses)
+    return responses
 
-    return [CulturalEventResponse.model_validate(event) for event in events]
+
+@router.get("/trending", response_model=list[CulturalEventResponse])
+async def list_trending_events(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+    session: AsyncSession = Depends(get_db),
+) -> list[CulturalEventResponse]:
+    """List upcoming events by time-decayed interest, hottest first."""
+
+    now = datetime.utcnow()
+    stmt = select(CulturalEvent).where(
+        CulturalEvent.trending_score.is_not(None),
+        CulturalEvent.start_at >= now,
+    )
+
+    events, next_cursor = await paginate(
+        session,
+        stmt,
+        (CulturalEvent.trending_score.desc(), CulturalEvent.id.desc()),
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
+
+    responses = [CulturalEventResponse.model_validate(event) for event in events]
+    await get_engagement_counters().merge_pending(responses, CulturalEvent.interested_count)
+    await attach_image_variants(session, responses)
+    return responses
 
 
 @router.get("/{event_id}", response_model=CulturalEventResponse)
@@ -61,7 +106,10 @@ async def get_event(
             detail=f"Event with id '{event_id}' not found"
         )
 
-    return CulturalEventResponse.model_validate(event)
+    response = CulturalEventResponse.model_validate(event)
+    await get_engagement_counters().merge_pending([response], CulturalEvent.interested_count)
+    await attach_image_variants(session, [response])
+    return response
 
 
 @router.post("", response_model=CulturalEventResponse, status_code=status.HTTP_201_CREATED)
@@ -100,6 +148,7 @@ async def create_event(
     )
 
     session.add(event)
+    enqueue_search_refresh(session, SearchService.INDEX_EVENTS, event.id)
     await session.commit()
     await session.refresh(event)
 
@@ -140,6 +189,7 @@ async def update_event(
     event.background_colors = event_data.background_colors
     event.hero_image_url = event_data.hero_image_url
 
+    enqueue_search_refresh(session, SearchService.INDEX_EVENTS, event.id)
     await session.commit()
     await session.refresh(event)
 
@@ -165,6 +215,7 @@ async def delete_event(
         )
 
     await session.delete(event)
+    enqueue_search_refresh(session, SearchService.INDEX_EVENTS, event.id)
     await session.commit()
 
 
@@ -198,22 +249,24 @@ async def toggle_event_interest(
     if existing_interest is not None:
         # Remove interest
         await session.delete(existing_interest)
-        event.interested_count = max(0, event.interested_count - 1)
         is_interested = False
     else:
         # Add interest
         new_interest = EventInterest(event_id=event_id, user_id=user.id)
         session.add(new_interest)
-        event.interested_count += 1
         is_interested = True
 
     await session.commit()
-    await session.refresh(event)
+
+    counters = get_engagement_counters()
+    await counters.increment(CulturalEvent.interested_count, event_id, 1 if is_interested else -1)
 
     return {
         "event_id": event_id,
         "is_interested": is_interested,
-        "interested_count": event.interested_count
+        "interested_count": await counters.current(
+            CulturalEvent.interested_count, event_id, event.interested_count
+        )
     }
 
 
@@ -252,4 +305,6 @@ async def get_interested_users(
     result = await session.execute(stmt)
     users = result.scalars().all()
 
-    return [UserProfile.model_validate(user) for user in users]
+    profiles = [UserProfile.model_validate(user) for user in users]
+    await attach_image_variants(session, profiles)
+    return profiles
@@ -2,17 +2,23 @@
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import desc, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route, not_modified_response, set_validators, weak_etag
 from ...api.deps import get_current_user
+from ...api.pagination import CURSOR_DESCRIPTION, paginate, set_next_cursor
 from ...db.session import get_db
 from ...models.feedback import Feedback, FeedbackStatus, FeedbackType
 from ...models.user import User
 from ...schemas.feedback import FeedbackCreate, FeedbackResponse, FeedbackUpdate
 
-router = APIRouter(prefix="/feedback", tags=["feedback"])
+router = APIRouter(
+    prefix="/feedback",
+    tags=["feedback"],
+    route_class=cache_control_route("private, no-cache"),
+)
 
 
 @router.post("", response_model=FeedbackResponse, status_code=status.HTTP_201_CREATED)
@@ -47,12 +53,14 @@ async def create_feedback(
 
 @router.get("", response_model=list[FeedbackResponse])
 async def list_feedback(
+    response: Response,
     feedback_type: Optional[FeedbackType] = Query(None, description="Filter by feedback type"),
     status_filter: Optional[FeedbackStatus] = Query(None, description="Filter by status"),
     platform: Optional[str] = Query(None, description="Filter by platform"),
     is_public: Optional[bool] = Query(None, description="Filter by public visibility"),
     limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     session: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user),
 ) -> list[FeedbackResponse]:
@@ -88,14 +96,16 @@ async def list_feedback(
     if is_public is not None:
         query = query.where(Feedback.is_public == is_public)
 
-    # Order by most recent first
-    query = query.order_by(desc(Feedback.created_at))
-
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
-
-    result = await session.execute(query)
-    feedback_list = result.scalars().all()
+    # Most recent first, paginated by keyset when a cursor is given
+    feedback_list, next_cursor = await paginate(
+        session,
+        query,
+        (Feedback.created_at.desc(), Feedback.id.desc()),
+        limit=limit,
+        cursor=cursor,
+        offset=offset,
+    )
+    set_next_cursor(response, next_cursor)
 
     return [FeedbackResponse.model_validate(f) for f in feedback_list]
 
@@ -103,9 +113,11 @@ async def list_feedback(
 @router.get("/{feedback_id}", response_model=FeedbackResponse)
 async def get_feedback(
     feedback_id: UUID,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user),
-) -> FeedbackResponse:
+) -> FeedbackResponse | Response:
     """Get a specific feedback entry by ID."""
 
     result = await session.execute(select(Feedback).where(Feedback.id == feedback_id))
@@ -130,6 +142,11 @@ async def get_feedback(
                 detail="You do not have permission to view this feedback",
             )
 
+    etag = weak_etag(feedback.id, feedback.updated_at)
+    if not_modified := not_modified_response(request, etag, feedback.updated_at):
+        return not_modified
+    set_validators(response, etag, feedback.updated_at)
+
     return FeedbackResponse.model_validate(feedback)
 
 
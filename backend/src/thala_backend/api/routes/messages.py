@@ -1,11 +1,13 @@
 """Messaging endpoints for the Thala backend."""
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route, not_modified_response, set_validators, weak_etag
 from ...api.deps import get_current_user
+from ...api.pagination import CURSOR_DESCRIPTION, paginate, set_next_cursor
 from ...db.session import get_db
-from ...models.message import Message, MessageThread
+from ...models.message import Message, MessageThread, utcnow
 from ...models.user import User
 from ...schemas.message import (
     ContactHandleResponse,
@@ -14,16 +16,22 @@ from ...schemas.message import (
     MessageThreadResponse,
 )
 
-router = APIRouter(prefix="/messages", tags=["messages"])
+router = APIRouter(
+    prefix="/messages",
+    tags=["messages"],
+    route_class=cache_control_route("private, no-cache"),
+)
 
 
 @router.get("/threads", response_model=list[MessageThreadResponse])
 async def list_message_threads(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of items to return"),
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
-) -> list[MessageThreadResponse]:
+) -> list[MessageThreadResponse] | Response:
     """List message threads for the authenticated user."""
 
     # In a full implementation, you'd filter threads where the user is a participant
@@ -38,15 +46,22 @@ async def list_message_threads(
     result = await session.execute(stmt)
     threads = result.scalars().all()
 
+    etag = weak_etag(*((thread.id, thread.updated_at) for thread in threads))
+    if not_modified := not_modified_response(request, etag):
+        return not_modified
+    set_validators(response, etag)
+
     return [MessageThreadResponse.model_validate(thread) for thread in threads]
 
 
 @router.get("/threads/{thread_id}", response_model=MessageThreadResponse)
 async def get_message_thread(
     thread_id: str,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
-) -> MessageThreadResponse:
+) -> MessageThreadResponse | Response:
     """Get a message thread with its details."""
 
     stmt = select(MessageThread).where(MessageThread.id == thread_id)
@@ -61,39 +76,57 @@ async def get_message_thread(
 
     # In a full implementation, verify user is a participant
 
+    etag = weak_etag(thread.id, thread.updated_at)
+    if not_modified := not_modified_response(request, etag, thread.updated_at):
+        return not_modified
+    set_validators(response, etag, thread.updated_at)
+
     return MessageThreadResponse.model_validate(thread)
 
 
 @router.get("/threads/{thread_id}/messages", response_model=list[MessageResponse])
 async def list_thread_messages(
     thread_id: str,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=200, description="Number of items to return"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     session: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
-) -> list[MessageResponse]:
-    """Get messages in a thread."""
+) -> list[MessageResponse] | Response:
+    """
+    Get messages in a thread.
+
+    Sending a message bumps the thread's ``updated_at``, so repeat fetches of
+    an unchanged thread get a 304 without loading its messages.
+    """
 
     # Verify thread exists
     thread_stmt = select(MessageThread).where(MessageThread.id == thread_id)
     thread_result = await session.execute(thread_stmt)
-    if thread_result.scalar_one_or_none() is None:
+    thread = thread_result.scalar_one_or_none()
+    if thread is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Thread with id '{thread_id}' not found"
         )
 
+    etag = weak_etag(thread.id, thread.updated_at)
+    if not_modified := not_modified_response(request, etag, thread.updated_at):
+        return not_modified
+    set_validators(response, etag, thread.updated_at)
+
     # Get messages
-    stmt = (
-        select(Message)
-        .where(Message.thread_id == thread_id)
-        .offset(skip)
-        .limit(limit)
-        .order_by(Message.created_at.asc())
+    messages, next_cursor = await paginate(
+        session,
+        select(Message).where(Message.thread_id == thread_id),
+        (Message.created_at.asc(), Message.id.asc()),
+        limit=limit,
+        cursor=cursor,
+        offset=skip,
     )
-
-    result = await session.execute(stmt)
-    messages = result.scalars().all()
+    set_next_cursor(response, next_cursor)
 
     return [MessageResponse.model_validate(msg) for msg in messages]
 
@@ -193,6 +226,9 @@ async def send_message(
 
     thread.last_message_en = preview
     thread.last_message_fr = preview
+    # Set explicitly: an unchanged preview emits no UPDATE, so onupdate would not
+    # fire and the thread's ETag would hide the new message
+    thread.updated_at = utcnow()
 
     await session.commit()
     await session.refresh(message)
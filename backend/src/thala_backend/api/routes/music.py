@@ -1,36 +1,63 @@
 """Music library endpoints for the Thala backend."""
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route
 from ...api.deps import get_current_user
+from ...api.pagination import CURSOR_DESCRIPTION, NEXT_CURSOR_HEADER, paginate
 from ...db.session import get_db
 from ...models.media import MusicTrack
 from ...models.user import User
 from ...schemas.music import MusicTrackCreate, MusicTrackResponse
-
-router = APIRouter(prefix="/music", tags=["music"])
+from ...services.image_derivatives import attach_image_variants
+from ...services.media_jobs import enqueue_audio_processing
+from ...services.response_cache import (
+    CACHE_TAG_MUSIC,
+    CachedResponse,
+    cached_response,
+    invalidate_cached_responses,
+)
+from ...services.search_outbox import enqueue_search_refresh
+from ...services.search_service import SearchService
+
+router = APIRouter(
+    prefix="/music",
+    tags=["music"],
+    route_class=cache_control_route("public, max-age=60"),
+)
 
 
 @router.get("", response_model=list[MusicTrackResponse])
 async def list_music_tracks(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of items to return"),
-    session: AsyncSession = Depends(get_db),
-) -> list[MusicTrackResponse]:
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+) -> Response:
     """List all music tracks with pagination."""
 
-    stmt = (
-        select(MusicTrack)
-        .offset(skip)
-        .limit(limit)
-        .order_by(MusicTrack.created_at.desc())
-    )
-
-    result = await session.execute(stmt)
-    tracks = result.scalars().all()
+    async def build(session: AsyncSession) -> CachedResponse:
+        tracks, next_cursor = await paginate(
+            session,
+            select(MusicTrack),
+            (MusicTrack.created_at.desc(), MusicTrack.id.desc()),
+            limit=limit,
+            cursor=cursor,
+            offset=skip,
+        )
+        responses = [MusicTrackResponse.model_validate(track) for track in tracks]
+        await attach_image_variants(session, responses)
+        return CachedResponse.from_content(
+            responses,
+            headers={NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None,
+        )
 
-    return [MusicTrackResponse.model_validate(track) for track in tracks]
+    return await cached_response(
+        "music:list",
+        {"skip": skip, "limit": limit, "cursor": cursor},
+        tags=(CACHE_TAG_MUSIC,),
+        build=build,
+    )
 
 
 @router.get("/{track_id}", response_model=MusicTrackResponse)
@@ -50,7 +77,47 @@ async def get_music_track(
             detail=f"Music track with id '{track_id}' not found"
         )
 
-    return MusicTrackResponse.model_validate(track)
+    response = MusicTrackResponse.model_validate(track)
+    await attach_image_variants(session, [response])
+    return response
+
+
+@router.get(
+    "/{track_id}/waveform",
+    response_class=Response,
+    responses={200: {"content": {"application/octet-stream": {}}}},
+)
+async def get_music_track_waveform(
+    track_id: str,
+    session: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Get a track's precomputed waveform.
+
+    The body holds one byte (0-255) per bucket, scaled to the loudest bucket,
+    so clients can draw the waveform without decoding the audio.
+    """
+
+    stmt = select(MusicTrack.waveform_peaks).where(MusicTrack.id == track_id)
+    result = await session.execute(stmt)
+    row = result.one_or_none()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Music track with id '{track_id}' not found"
+        )
+    if row.waveform_peaks is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Waveform for music track '{track_id}' is not available"
+        )
+
+    return Response(
+        content=row.waveform_peaks,
+        media_type="application/octet-stream",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
 
 
 @router.post("", response_model=MusicTrackResponse, status_code=status.HTTP_201_CREATED)
@@ -78,10 +145,14 @@ async def create_music_track(
         artwork_url=track_data.artwork_url,
         duration_seconds=track_data.duration_seconds,
         preview_url=track_data.preview_url,
+        audio_url=track_data.audio_url,
     )
 
     session.add(track)
+    enqueue_search_refresh(session, SearchService.INDEX_MUSIC, track.id)
+    enqueue_audio_processing(session, track)
     await session.commit()
+    await invalidate_cached_responses(CACHE_TAG_MUSIC)
     await session.refresh(track)
 
     return MusicTrackResponse.model_validate(track)
@@ -110,10 +181,21 @@ async def update_music_track(
     track.title = track_data.title
     track.artist = track_data.artist
     track.artwork_url = track_data.artwork_url
-    track.duration_seconds = track_data.duration_seconds
-    track.preview_url = track_data.preview_url
-
+    # Omitted values keep what was computed from the uploaded audio
+    if "duration_seconds" in track_data.model_fields_set:
+        track.duration_seconds = track_data.duration_seconds
+    if "preview_url" in track_data.model_fields_set:
+        track.preview_url = track_data.preview_url
+    if "audio_url" in track_data.model_fields_set and track_data.audio_url != track.audio_url:
+        track.audio_url = track_data.audio_url
+        track.preview_opus_url = None
+        track.waveform_peaks = None
+        track.processing_status = None
+        enqueue_audio_processing(session, track)
+
+    enqueue_search_refresh(session, SearchService.INDEX_MUSIC, track.id)
     await session.commit()
+    await invalidate_cached_responses(CACHE_TAG_MUSIC)
     await session.refresh(track)
 
     return MusicTrackResponse.model_validate(track)
@@ -138,4 +220,6 @@ async def delete_music_track(
         )
 
     await session.delete(track)
+    enqueue_search_refresh(session, SearchService.INDEX_MUSIC, track.id)
     await session.commit()
+    await invalidate_cached_responses(CACHE_TAG_MUSIC)
@@ -1,12 +1,18 @@
 """Search endpoints for the Thala backend."""
+import asyncio
+import logging
+import re
+from collections.abc import Awaitable, Sequence
 from typing import Any
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import or_, select
+from sqlalchemy import ARRAY, ColumnElement, Select, Text, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ...db.session import get_db
+from ...api.conditional import cache_control_route
+from ...core.config import settings
+from ...db.session import AsyncSessionLocal, get_db
 from ...models.archive import ArchiveEntry
 from ...models.community import CommunityProfile
 from ...models.event import CulturalEvent
@@ -16,81 +22,281 @@ from ...schemas.community import CommunityProfileResponse
 from ...schemas.event import CulturalEventResponse
 from ...schemas.music import MusicTrackResponse
 from ...schemas.video import VideoResponse
+from ...services.image_derivatives import attach_image_variants
+from ...services.search_service import SearchService, get_search_service
 
-router = APIRouter(prefix="/search", tags=["search"])
+logger = logging.getLogger(__name__)
 
+router = APIRouter(
+    prefix="/search",
+    tags=["search"],
+    route_class=cache_control_route("public, max-age=30"),
+)
 
-@router.get("", response_model=dict[str, Any])
-async def universal_search(
-    q: str = Query(..., min_length=1, description="Search query"),
-    limit: int = Query(10, ge=1, le=50, description="Max results per category"),
-    session: AsyncSession = Depends(get_db),
-) -> dict[str, Any]:
-    """Universal search across all content types."""
+# Bounds the pooled connections universal searches hold at once, so bursts of
+# keystrokes queue here instead of draining the pool other endpoints need
+_category_slots = asyncio.Semaphore(settings.search_max_concurrent_queries)
+
+
+def _prefix_query_text(q: str) -> str | None:
+    """
+    Turn ``q`` into ``to_tsquery`` syntax whose last word matches as a prefix.
+
+    Only word characters are kept, so the result never contains operators
+    the user typed. Returns None if ``q`` has no words.
+    """
+
+    words = re.findall(r"\w+", q.lower())
+    if not words:
+        return None
+    return " & ".join([*words[:-1], f"{words[-1]}:*"])
+
+
+def _text_query(q: str) -> ColumnElement[Any]:
+    """
+    Build a tsquery matching ``q`` with English, French and unstemmed parsing.
 
-    search_term = f"%{q}%"
+    The last word also matches as a prefix, so partially typed queries
+    ("imz" for "imzad") find results while the user is still typing.
+    """
 
-    # Search videos
-    video_stmt = (
+    query = (
+        func.websearch_to_tsquery("english", q)
+        .op("||")(func.websearch_to_tsquery("french", q))
+        .op("||")(func.websearch_to_tsquery("simple", q))
+    )
+    prefix = _prefix_query_text(q)
+    if prefix is not None:
+        query = query.op("||")(func.to_tsquery("simple", prefix))
+    return query
+
+
+def _like_pattern(q: str) -> str:
+    """Escape ``q`` for use as a substring pattern in (I)LIKE."""
+
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _video_search_stmt(q: str, limit: int) -> Select[Any]:
+    """Full-text search over videos, best matches first."""
+
+    query = _text_query(q)
+    return (
         select(Video)
-        .where(
-            or_(
-                Video.title_en.ilike(search_term),
-                Video.title_fr.ilike(search_term),
-                Video.description_en.ilike(search_term),
-                Video.description_fr.ilike(search_term),
-                Video.creator_handle.ilike(search_term),
-            )
-        )
+        .where(Video.search_vector.bool_op("@@")(query))
         .options(
             selectinload(Video.music_track),
             selectinload(Video.effect),
         )
+        .order_by(func.ts_rank(Video.search_vector, query).desc(), Video.created_at.desc())
         .limit(limit)
     )
-    video_result = await session.execute(video_stmt)
-    videos = [VideoResponse.model_validate(v) for v in video_result.scalars().all()]
 
-    # Search music
-    music_stmt = (
+
+def _music_search_stmt(q: str, limit: int) -> Select[Any]:
+    """Full-text search over music tracks, best matches first."""
+
+    query = _text_query(q)
+    return (
         select(MusicTrack)
+        .where(MusicTrack.search_vector.bool_op("@@")(query))
+        .order_by(func.ts_rank(MusicTrack.search_vector, query).desc(), MusicTrack.created_at.desc())
+        .limit(limit)
+    )
+
+
+def _event_search_stmt(q: str, limit: int) -> Select[Any]:
+    """Substring search over event titles, descriptions and locations."""
+
+    return (
+        select(CulturalEvent)
+        .where(CulturalEvent.search_text.ilike(_like_pattern(q), escape="\\"))
+        .order_by(CulturalEvent.start_at.asc(), CulturalEvent.id.asc())
+        .limit(limit)
+    )
+
+
+def _community_search_stmt(q: str, limit: int) -> Select[Any]:
+    """Substring search over community space names and regions, or an exact language."""
+
+    return (
+        select(CommunityProfile)
         .where(
             or_(
-                MusicTrack.title.ilike(search_term),
-                MusicTrack.artist.ilike(search_term),
+                CommunityProfile.search_text.ilike(_like_pattern(q), escape="\\"),
+                CommunityProfile.languages.bool_op("&&")(
+                    cast([q, q.lower(), q.capitalize()], ARRAY(Text))
+                ),
             )
         )
+        .order_by(CommunityProfile.priority.desc(), CommunityProfile.id.asc())
         .limit(limit)
     )
-    music_result = await session.execute(music_stmt)
-    music = [MusicTrackResponse.model_validate(m) for m in music_result.scalars().all()]
 
-    # Search events
-    # Note: JSONB fields need special handling, simplified here
-    event_stmt = select(CulturalEvent).limit(limit)
-    event_result = await session.execute(event_stmt)
-    events = [CulturalEventResponse.model_validate(e) for e in event_result.scalars().all()]
 
-    # Search communities
-    community_stmt = select(CommunityProfile).limit(limit)
-    community_result = await session.execute(community_stmt)
-    communities = [CommunityProfileResponse.model_validate(c) for c in community_result.scalars().all()]
+def _optional_search_service(session: AsyncSession) -> SearchService | None:
+    """Return the MeiliSearch service when it is configured, otherwise None."""
+
+    if not settings.meilisearch_host:
+        return None
+    return get_search_service(session)
+
+
+async def _meilisearch_call(call: Awaitable[Any]) -> Any | None:
+    """
+    Await a MeiliSearch call within its time budget.
+
+    Returns:
+        The call's result, or None if MeiliSearch was slow or failed and the
+        caller should fall back to Postgres
+    """
+    try:
+        return await asyncio.wait_for(call, timeout=settings.meilisearch_timeout_seconds)
+    except Exception as exc:
+        logger.warning(f"MeiliSearch unavailable, falling back to Postgres search: {exc!r}")
+        return None
 
-    # Search archive
-    archive_stmt = select(ArchiveEntry).limit(limit)
-    archive_result = await session.execute(archive_stmt)
-    archive = [ArchiveEntryResponse.model_validate(a) for a in archive_result.scalars().all()]
+
+def _hydrate_stmt(model: Any, ids: Sequence[str]) -> Select[Any]:
+    """Load the rows behind a list of search hits by primary key."""
+
+    stmt = select(model).where(model.id.in_(ids))
+    if model is Video:
+        stmt = stmt.options(
+            selectinload(Video.music_track),
+            selectinload(Video.effect),
+        )
+    return stmt
+
+
+def _in_rank_order(rows: Sequence[Any], ids: Sequence[str]) -> list[Any]:
+    """Reorder rows loaded by ID to follow the search engine's ranking."""
+
+    by_id = {row.id: row for row in rows}
+    return [by_id[i] for i in ids if i in by_id]
+
+
+async def _meilisearch_rows(session: AsyncSession, model: Any, call: Awaitable[Any]) -> list[Any] | None:
+    """Run a MeiliSearch query and load its hits, or return None to fall back."""
+
+    results = await _meilisearch_call(call)
+    if results is None:
+        return None
+
+    ids = [hit["id"] for hit in results.hits]
+    if not ids:
+        return []
+    result = await session.execute(_hydrate_stmt(model, ids))
+    return _in_rank_order(result.scalars().all(), ids)
+
+
+async def _search_category(
+    name: str,
+    stmt: Select[Any],
+    schema: type[Any],
+    ranked_ids: Sequence[str] | None = None,
+) -> list[Any] | None:
+    """
+    Run one category of a universal search on its own pooled connection.
+
+    At most ``SEARCH_MAX_CONCURRENT_QUERIES`` categories hold a connection at
+    once. Waiting for a slot and running the query each get the category's
+    time budget, so a busy pool does not eat into the query's own.
+
+    Args:
+        name: Category name, for logging
+        stmt: Statement producing the category's rows
+        schema: Response schema for the rows
+        ranked_ids: When the rows come from MeiliSearch hits, their ranking
+
+    Returns:
+        The validated results, or None if the category ran past its time budget
+    """
+
+    if ranked_ids is not None and not ranked_ids:
+        return []
+
+    async def run() -> list[Any]:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(stmt)
+            rows = result.scalars().all()
+            if ranked_ids is not None:
+                rows = _in_rank_order(rows, ranked_ids)
+            responses = [schema.model_validate(row) for row in rows]
+            await attach_image_variants(session, responses)
+            return responses
+
+    timeout = settings.search_category_timeout_seconds
+    try:
+        await asyncio.wait_for(_category_slots.acquire(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Search category '{name}' got no database slot in time, returning partial results")
+        return None
+
+    try:
+        return await asyncio.wait_for(run(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Search category '{name}' timed out, returning partial results")
+        return None
+    finally:
+        _category_slots.release()
+
+
+@router.get("", response_model=dict[str, Any])
+async def universal_search(
+    q: str = Query(..., min_length=1, description="Search query"),
+    limit: int = Query(10, ge=1, le=50, description="Max results per category"),
+    session: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """
+    Universal search across all content types.
+
+    With MeiliSearch configured, videos, music, events and communities are
+    matched in one multi-search request and only loaded from Postgres by ID;
+    otherwise (or if MeiliSearch is slow or down) they are matched in Postgres.
+    Categories are loaded concurrently, each within its own time budget. A
+    category that runs out of time comes back empty and is listed under
+    ``timed_out`` so clients can tell partial results from empty ones.
+    """
+
+    categories: dict[str, tuple[Select[Any], type[Any], Sequence[str] | None]] = {
+        "videos": (_video_search_stmt(q, limit), VideoResponse, None),
+        "music": (_music_search_stmt(q, limit), MusicTrackResponse, None),
+        "events": (_event_search_stmt(q, limit), CulturalEventResponse, None),
+        "communities": (_community_search_stmt(q, limit), CommunityProfileResponse, None),
+        "archive": (select(ArchiveEntry).limit(limit), ArchiveEntryResponse, None),
+    }
+
+    search_service = _optional_search_service(session)
+    if search_service is not None:
+        hits = await _meilisearch_call(search_service.multi_search(q, limit=limit))
+        if hits is not None:
+            models = {
+                "videos": (Video, SearchService.INDEX_VIDEOS),
+                "music": (MusicTrack, SearchService.INDEX_MUSIC),
+                "events": (CulturalEvent, SearchService.INDEX_EVENTS),
+                "communities": (CommunityProfile, SearchService.INDEX_COMMUNITIES),
+            }
+            for name, (model, index_type) in models.items():
+                ids = hits[index_type]
+                categories[name] = (_hydrate_stmt(model, ids), categories[name][1], ids)
+
+    outcomes = await asyncio.gather(
+        *(
+            _search_category(name, stmt, schema, ranked_ids)
+            for name, (stmt, schema, ranked_ids) in categories.items()
+        )
+    )
+
+    results = {name: outcome or [] for name, outcome in zip(categories, outcomes)}
+    timed_out = [name for name, outcome in zip(categories, outcomes) if outcome is None]
 
     return {
         "query": q,
-        "results": {
-            "videos": videos,
-            "music": music,
-            "events": events,
-            "communities": communities,
-            "archive": archive,
-        },
-        "total_results": len(videos) + len(music) + len(events) + len(communities) + len(archive)
+        "results": results,
+        "total_results": sum(len(items) for items in results.values()),
+        "timed_out": timed_out,
     }
 
 
@@ -100,35 +306,20 @@ async def search_videos(
     limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
     session: AsyncSession = Depends(get_db),
 ) -> list[VideoResponse]:
-    """Search videos by title, description, creator, or tags."""
+    """Search videos by title, description or creator, ranked by relevance."""
 
-    search_term = f"%{q}%"
+    search_service = _optional_search_service(session)
+    videos = None
+    if search_service is not None:
+        videos = await _meilisearch_rows(session, Video, search_service.search_videos(q, limit=limit))
 
-    stmt = (
-        select(Video)
-        .where(
-            or_(
-                Video.title_en.ilike(search_term),
-                Video.title_fr.ilike(search_term),
-                Video.description_en.ilike(search_term),
-                Video.description_fr.ilike(search_term),
-                Video.creator_handle.ilike(search_term),
-                Video.creator_name_en.ilike(search_term),
-                Video.creator_name_fr.ilike(search_term),
-            )
-        )
-        .options(
-            selectinload(Video.music_track),
-            selectinload(Video.effect),
-        )
-        .limit(limit)
-        .order_by(Video.created_at.desc())
-    )
-
-    result = await session.execute(stmt)
-    videos = result.scalars().all()
+    if videos is None:
+        result = await session.execute(_video_search_stmt(q, limit))
+        videos = result.scalars().all()
 
-    return [VideoResponse.model_validate(video) for video in videos]
+    responses = [VideoResponse.model_validate(video) for video in videos]
+    await attach_image_variants(session, responses)
+    return responses
 
 
 @router.get("/music", response_model=list[MusicTrackResponse])
@@ -137,26 +328,20 @@ async def search_music(
     limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
     session: AsyncSession = Depends(get_db),
 ) -> list[MusicTrackResponse]:
-    """Search music tracks by title or artist."""
+    """Search music tracks by title or artist, ranked by relevance."""
 
-    search_term = f"%{q}%"
+    search_service = _optional_search_service(session)
+    tracks = None
+    if search_service is not None:
+        tracks = await _meilisearch_rows(session, MusicTrack, search_service.search_music(q, limit=limit))
 
-    stmt = (
-        select(MusicTrack)
-        .where(
-            or_(
-                MusicTrack.title.ilike(search_term),
-                MusicTrack.artist.ilike(search_term),
-            )
-        )
-        .limit(limit)
-        .order_by(MusicTrack.created_at.desc())
-    )
+    if tracks is None:
+        result = await session.execute(_music_search_stmt(q, limit))
+        tracks = result.scalars().all()
 
-    result = await session.execute(stmt)
-    tracks = result.scalars().all()
-
-    return [MusicTrackResponse.model_validate(track) for track in tracks]
+    responses = [MusicTrackResponse.model_validate(track) for track in tracks]
+    await attach_image_variants(session, responses)
+    return responses
 
 
 @router.get("/events", response_model=list[CulturalEventResponse])
@@ -165,35 +350,20 @@ async def search_events(
     limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
     session: AsyncSession = Depends(get_db),
 ) -> list[CulturalEventResponse]:
-    """Search cultural events."""
-
-    # Note: Searching JSONB fields requires special PostgreSQL syntax
-    # This is a simplified version that returns all events
-    # In production, you'd use JSONB operators like @>, ?, etc.
+    """Search cultural events by title, description or location."""
 
-    stmt = (
-        select(CulturalEvent)
-        .limit(limit)
-        .order_by(CulturalEvent.start_at.asc())
-    )
+    search_service = _optional_search_service(session)
+    events = None
+    if search_service is not None:
+        events = await _meilisearch_rows(session, CulturalEvent, search_service.search_events(q, limit=limit))
 
-    result = await session.execute(stmt)
-    events = result.scalars().all()
+    if events is None:
+        result = await session.execute(_event_search_stmt(q, limit))
+        events = result.scalars().all()
 
-    # Filter in Python for simplicity (not optimal for large datasets)
-    search_term_lower = q.lower()
-    filtered_events = []
-
-    for event in events:
-        # Check if search term appears in any localized field
-        if (
-            search_term_lower in str(event.title).lower() or
-            search_term_lower in str(event.description).lower() or
-            search_term_lower in str(event.location).lower()
-        ):
-            filtered_events.append(event)
-
-    return [CulturalEventResponse.model_validate(event) for event in filtered_events[:limit]]
+    responses = [CulturalEventResponse.model_validate(event) for event in events]
+    await attach_image_variants(session, responses)
+    return responses
 
 
 @router.get("/communities", response_model=list[CommunityProfileResponse])
@@ -202,32 +372,15 @@ async def search_communities(
     limit: int = Query(20, ge=1, le=100, description="Number of results to return"),
     session: AsyncSession = Depends(get_db),
 ) -> list[CommunityProfileResponse]:
-    """Search community profiles."""
-
-    # Note: Searching JSONB fields requires special PostgreSQL syntax
-    # This is a simplified version that returns all communities
-    # In production, you'd use JSONB operators
-
-    stmt = (
-        select(CommunityProfile)
-        .limit(limit)
-        .order_by(CommunityProfile.priority.desc())
-    )
-
-    result = await session.execute(stmt)
-    profiles = result.scalars().all()
+    """Search community profiles by space name, region or language."""
 
-    # Filter in Python for simplicity
-    search_term_lower = q.lower()
-    filtered_profiles = []
+    search_service = _optional_search_service(session)
+    profiles = None
+    if search_service is not None:
+        profiles = await _meilisearch_rows(session, CommunityProfile, search_service.search_communities(q, limit=limit))
 
-    for profile in profiles:
-        # Check if search term appears in any field
-        if (
-            search_term_lower in str(profile.space).lower() or
-            search_term_lower in profile.region.lower() or
-            any(search_term_lower in lang.lower() for lang in profile.languages)
-        ):
-            filtered_profiles.append(profile)
+    if profiles is None:
+        result = await session.execute(_community_search_stmt(q, limit))
+        profiles = result.scalars().all()
 
-    return [CommunityProfileResponse.model_validate(profile) for profile in filtered_profiles[:limit]]
+    return [CommunityProfileResponse.model_validate(profile) for profile in profiles]
@@ -1,40 +1,157 @@
 """Media upload endpoints for the Thala backend."""
+import math
+import mimetypes
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from typing import Literal
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, UploadFile, status
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route
 from ...api.deps import get_current_user
 from ...core.config import settings
+from ...db.session import get_db
+from ...models.upload import MediaUpload, MediaUploadPart
 from ...models.user import User
+from ...schemas.upload import (
+    ByteRange,
+    MediaFileType,
+    MediaUploadResponse,
+    MultipartUploadCreate,
+    MultipartUploadResponse,
+    PresignedUploadResponse,
+    UploadCompleteRequest,
+    UploadPartURL,
+    UploadSessionResponse,
+)
+from ...services.image_derivatives import generate_image_variants_safely
+from ...services.storage_service import StorageService, get_storage_service
+
+router = APIRouter(
+    prefix="/upload",
+    tags=["upload"],
+    route_class=cache_control_route("no-store"),
+)
+
+PRESIGNED_URL_EXPIRATION_MINUTES = 60
+
+# S3 allows at most 10,000 parts per multipart upload
+MAX_MULTIPART_PARTS = 10_000
+
+ALLOWED_CONTENT_TYPES: dict[str, set[str]] = {
+    "video": StorageService.SUPPORTED_VIDEO_TYPES,
+    "image": StorageService.SUPPORTED_IMAGE_TYPES,
+    "audio": StorageService.SUPPORTED_AUDIO_TYPES,
+}
+
+MAX_UPLOAD_SIZE_MB: dict[str, int] = {
+    "video": 500,
+    "image": 10,
+    "audio": 50,
+}
+
+
+def _validate_direct_upload(file_type: str, content_type: str, size_bytes: int | None) -> None:
+    """Check the declared content type and size of a direct upload."""
+    if content_type not in ALLOWED_CONTENT_TYPES[file_type]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported file type: {content_type}"
+        )
+    max_size_mb = MAX_UPLOAD_SIZE_MB[file_type]
+    if size_bytes is not None and size_bytes > max_size_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File size exceeds maximum of {max_size_mb}MB"
+        )
 
-router = APIRouter(prefix="/upload", tags=["upload"])
 
+def _new_file_key(file_type: str, user: User, file_extension: str) -> str:
+    return f"{file_type}s/{user.id}/{uuid.uuid4()}.{file_extension.lstrip('.').lower()}"
 
-def generate_s3_url(file_key: str) -> str:
-    """Generate a mock S3 URL for uploaded files."""
-    if settings.aws_s3_bucket and settings.aws_region:
-        return f"https://{settings.aws_s3_bucket}.s3.{settings.aws_region}.amazonaws.com/{file_key}"
-    return f"https://storage.example.com/{file_key}"
 
+def _upload_response(upload: MediaUpload, storage: StorageService) -> MediaUploadResponse:
+    return MediaUploadResponse(
+        id=upload.id,
+        file_type=upload.file_type,
+        file_key=upload.object_key,
+        content_type=upload.content_type,
+        size_bytes=upload.size_bytes,
+        status=upload.status,
+        final_url=storage.get_public_url(upload.object_key),
+        created_at=upload.created_at,
+        completed_at=upload.completed_at,
+    )
 
-def generate_presigned_url(file_key: str, expiration: int = 3600) -> str:
-    """Generate a presigned URL for direct S3 uploads."""
-    # In a real implementation, this would use boto3 to generate actual presigned URLs
-    # For now, return a mock URL
-    if settings.aws_s3_bucket and settings.aws_region:
-        expires = datetime.utcnow() + timedelta(seconds=expiration)
-        return f"https://{settings.aws_s3_bucket}.s3.{settings.aws_region}.amazonaws.com/{file_key}?X-Amz-Expires={expiration}"
-    return f"https://storage.example.com/presigned/{file_key}?expires={expiration}"
+
+async def _get_user_upload(session: AsyncSession, upload_id: UUID, user: User) -> MediaUpload:
+    result = await session.execute(
+        select(MediaUpload).where(MediaUpload.id == upload_id, MediaUpload.user_id == user.id)
+    )
+    upload = result.scalar_one_or_none()
+    if not upload:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload not found"
+        )
+    return upload
+
+
+async def _finish_upload(
+    session: AsyncSession,
+    storage: StorageService,
+    background_tasks: BackgroundTasks,
+    upload: MediaUpload,
+    parts: list[tuple[int, str]] | None,
+) -> None:
+    """Assemble multipart uploads, verify the object exists and mark the upload completed."""
+    if upload.multipart_upload_id:
+        await storage.complete_multipart_upload(upload.object_key, upload.multipart_upload_id, parts or [])
+        upload.multipart_upload_id = None
+
+    metadata = await storage.get_file_metadata(upload.object_key)
+    if metadata is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded file not found in storage"
+        )
+
+    # Presigned part URLs do not bind the part sizes, so the declared size and
+    # type are only enforced by checking what was actually assembled
+    size_mismatch = upload.size_bytes is not None and metadata["content_length"] != upload.size_bytes
+    if size_mismatch or metadata["content_type"] != upload.content_type:
+        await storage.delete_file(upload.object_key)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Uploaded file does not match the declared size and content type"
+        )
+
+    upload.status = "completed"
+    upload.completed_at = datetime.now(timezone.utc)
+    await session.commit()
+    await session.refresh(upload)
+
+    if upload.file_type == "image":
+        background_tasks.add_task(generate_image_variants_safely, upload.object_key)
 
 
 @router.post("/video", response_model=dict[str, str])
 async def upload_video(
     file: UploadFile = File(..., description="Video file to upload"),
     user: User = Depends(get_current_user),
+    storage: StorageService = Depends(get_storage_service),
+    session: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
-    """Upload a video file (authenticated users only)."""
+    """
+    Upload a video file (authenticated users only).
+
+    The file is streamed to storage (in parts for large videos). Pass the
+    returned video_url when creating the video to have it processed.
+    """
 
     # Validate file type
     if not file.content_type or not file.content_type.startswith("video/"):
@@ -43,33 +160,33 @@ async def upload_video(
             detail="File must be a video"
         )
 
-    # Generate unique file key
-    file_extension = file.filename.split(".")[-1] if file.filename and "." in file.filename else "mp4"
-    file_key = f"videos/{user.id}/{uuid.uuid4()}.{file_extension}"
-
-    # In a real implementation, you would:
-    # 1. Read the file contents: contents = await file.read()
-    # 2. Upload to S3 using boto3
-    # 3. Generate thumbnail
-    # 4. Return actual S3 URL
-
-    # For now, return a mock URL
-    video_url = generate_s3_url(file_key)
+    file_key = await storage.upload_file(
+        file,
+        folder=f"videos/{user.id}",
+        allowed_types=ALLOWED_CONTENT_TYPES["video"],
+        max_size_mb=MAX_UPLOAD_SIZE_MB["video"],
+        session=session,
+    )
 
+    # Commits the reference on a deduplicated object only once the upload succeeded
+    await session.commit()
     return {
-        "video_url": video_url,
+        "video_url": storage.get_public_url(file_key),
         "file_key": file_key,
         "content_type": file.content_type,
-        "message": "Video uploaded successfully (mock)"
+        "message": "Video uploaded successfully"
     }
 
 
 @router.post("/image", response_model=dict[str, str])
 async def upload_image(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="Image file to upload"),
     user: User = Depends(get_current_user),
+    storage: StorageService = Depends(get_storage_service),
+    session: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
-    """Upload an image file (authenticated users only)."""
+    """Upload an image file (authenticated users only); resized variants are generated in the background."""
 
     # Validate file type
     if not file.content_type or not file.content_type.startswith("image/"):
@@ -78,23 +195,22 @@ async def upload_image(
             detail="File must be an image"
         )
 
-    # Generate unique file key
-    file_extension = file.filename.split(".")[-1] if file.filename and "." in file.filename else "jpg"
-    file_key = f"images/{user.id}/{uuid.uuid4()}.{file_extension}"
-
-    # In a real implementation, you would:
-    # 1. Read the file contents
-    # 2. Optionally resize/optimize the image
-    # 3. Upload to S3
-    # 4. Return actual S3 URL
-
-    image_url = generate_s3_url(file_key)
-
+    file_key = await storage.upload_file(
+        file,
+        folder=f"images/{user.id}",
+        allowed_types=ALLOWED_CONTENT_TYPES["image"],
+        max_size_mb=MAX_UPLOAD_SIZE_MB["image"],
+        session=session,
+    )
+    background_tasks.add_task(generate_image_variants_safely, file_key)
+
+    # Commits the reference on a deduplicated object only once the upload succeeded
+    await session.commit()
     return {
-        "image_url": image_url,
+        "image_url": storage.get_public_url(file_key),
         "file_key": file_key,
         "content_type": file.content_type,
-        "message": "Image uploaded successfully (mock)"
+        "message": "Image uploaded successfully"
     }
 
 
@@ -102,8 +218,15 @@ async def upload_image(
 async def upload_audio(
     file: UploadFile = File(..., description="Audio file to upload"),
     user: User = Depends(get_current_user),
+    storage: StorageService = Depends(get_storage_service),
+    session: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
-    """Upload an audio file (authenticated users only)."""
+    """
+    Upload an audio file (authenticated users only).
+
+    Pass the returned audio_url as a music track's audio_url to have it
+    transcoded to AAC/Opus previews with a precomputed waveform.
+    """
 
     # Validate file type
     if not file.content_type or not file.content_type.startswith("audio/"):
@@ -112,54 +235,395 @@ async def upload_audio(
             detail="File must be an audio file"
         )
 
-    # Generate unique file key
-    file_extension = file.filename.split(".")[-1] if file.filename and "." in file.filename else "mp3"
-    file_key = f"audio/{user.id}/{uuid.uuid4()}.{file_extension}"
-
-    # In a real implementation, you would:
-    # 1. Read the file contents
-    # 2. Optionally transcode/optimize the audio
-    # 3. Upload to S3
-    # 4. Return actual S3 URL
-
-    audio_url = generate_s3_url(file_key)
+    file_key = await storage.upload_file(
+        file,
+        folder=f"audio/{user.id}",
+        allowed_types=ALLOWED_CONTENT_TYPES["audio"],
+        max_size_mb=MAX_UPLOAD_SIZE_MB["audio"],
+        session=session,
+    )
 
+    # Commits the reference on a deduplicated object only once the upload succeeded
+    await session.commit()
     return {
-        "audio_url": audio_url,
+        "audio_url": storage.get_public_url(file_key),
         "file_key": file_key,
         "content_type": file.content_type,
-        "message": "Audio uploaded successfully (mock)"
+        "message": "Audio uploaded successfully"
     }
 
 
-@router.get("/presigned-url", response_model=dict[str, str])
+@router.get("/presigned-url", response_model=PresignedUploadResponse)
 async def get_presigned_upload_url(
-    file_type: Literal["video", "image", "audio"] = Query(..., description="Type of file to upload"),
+    file_type: MediaFileType = Query(..., description="Type of file to upload"),
     file_extension: str = Query(..., description="File extension (e.g., 'mp4', 'jpg', 'mp3')"),
+    content_type: str | None = Query(None, description="MIME type of the file (guessed from the extension if omitted)"),
+    method: Literal["POST", "PUT"] = Query("POST", description="POST (form upload) or PUT (raw body)"),
+    size_bytes: int | None = Query(None, gt=0, description="Exact file size in bytes (required for PUT)"),
     user: User = Depends(get_current_user),
-) -> dict[str, str]:
+    session: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+) -> PresignedUploadResponse:
     """
     Get a presigned URL for direct client-side upload to S3.
 
     This allows clients to upload files directly to S3 without going through the API server,
-    which is more efficient for large files.
+    which is more efficient for large files. Call the completion endpoint once the upload is done.
     """
 
-    # Generate unique file key based on file type
-    file_key = f"{file_type}s/{user.id}/{uuid.uuid4()}.{file_extension}"
+    content_type = content_type or mimetypes.guess_type(f"file.{file_extension}")[0] or ""
+    _validate_direct_upload(file_type, content_type, size_bytes)
 
-    # In a real implementation, you would:
-    # 1. Use boto3.client('s3').generate_presigned_post() or generate_presigned_url()
-    # 2. Set appropriate permissions and expiration
-    # 3. Return the actual presigned URL and required fields
+    file_key = _new_file_key(file_type, user, file_extension)
 
-    presigned_url = generate_presigned_url(file_key, expiration=3600)
-    final_url = generate_s3_url(file_key)
+    fields: dict[str, str] = {}
+    if method == "PUT":
+        if size_bytes is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="size_bytes is required for PUT uploads"
+            )
+        presigned_url = await storage.generate_presigned_put_url(
+            file_key, content_type, size_bytes, expiration_minutes=PRESIGNED_URL_EXPIRATION_MINUTES
+        )
+    else:
+        presigned_post = await storage.generate_presigned_post(
+            file_key,
+            content_type,
+            MAX_UPLOAD_SIZE_MB[file_type],
+            expiration_minutes=PRESIGNED_URL_EXPIRATION_MINUTES,
+        )
+        presigned_url = presigned_post["url"]
+        fields = presigned_post["fields"]
+
+    upload = MediaUpload(
+        user_id=user.id,
+        file_type=file_type,
+        object_key=file_key,
+        content_type=content_type,
+        size_bytes=size_bytes,
+    )
+    session.add(upload)
+    await session.commit()
+
+    return PresignedUploadResponse(
+        upload_id=upload.id,
+        method=method,
+        presigned_url=presigned_url,
+        fields=fields,
+        file_key=file_key,
+        final_url=storage.get_public_url(file_key),
+        expiration_seconds=PRESIGNED_URL_EXPIRATION_MINUTES * 60,
+    )
+
+
+@router.post("/multipart", response_model=MultipartUploadResponse, status_code=status.HTTP_201_CREATED)
+async def create_multipart_upload(
+    payload: MultipartUploadCreate,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+) -> MultipartUploadResponse:
+    """
+    Start a presigned multipart upload for a large file.
 
-    return {
-        "presigned_url": presigned_url,
-        "file_key": file_key,
-        "final_url": final_url,
-        "expiration_seconds": 3600,
-        "message": "Presigned URL generated successfully (mock)"
-    }
+    The client PUTs each part to its URL, keeps the returned ETag headers and
+    sends them to the completion endpoint.
+    """
+
+    _validate_direct_upload(payload.file_type, payload.content_type, payload.size_bytes)
+
+    part_size = settings.s3_multipart_part_size_mb * 1024 * 1024
+    part_count = math.ceil(payload.size_bytes / part_size)
+    if part_count > MAX_MULTIPART_PARTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File has too many parts for a multipart upload"
+        )
+
+    file_key = _new_file_key(payload.file_type, user, payload.file_extension)
+    multipart_upload_id = await storage.create_multipart_upload(file_key, payload.content_type)
+    part_urls = await storage.generate_presigned_part_urls(
+        file_key,
+        multipart_upload_id,
+        range(1, part_count + 1),
+        expiration_minutes=PRESIGNED_URL_EXPIRATION_MINUTES,
+    )
+
+    upload = MediaUpload(
+        user_id=user.id,
+        file_type=payload.file_type,
+        object_key=file_key,
+        content_type=payload.content_type,
+        multipart_upload_id=multipart_upload_id,
+        size_bytes=payload.size_bytes,
+    )
+    session.add(upload)
+    await session.commit()
+
+    return MultipartUploadResponse(
+        upload_id=upload.id,
+        file_key=file_key,
+        part_size=part_size,
+        parts=[UploadPartURL(part_number=number, url=url) for number, url in part_urls.items()],
+        final_url=storage.get_public_url(file_key),
+        expiration_seconds=PRESIGNED_URL_EXPIRATION_MINUTES * 60,
+    )
+
+
+@router.post("/{upload_id}/complete", response_model=MediaUploadResponse)
+async def complete_upload(
+    upload_id: UUID,
+    background_tasks: BackgroundTasks,
+    payload: UploadCompleteRequest | None = None,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+) -> MediaUploadResponse:
+    """Confirm a direct upload once the client has sent the file to S3."""
+
+    upload = await _get_user_upload(session, upload_id, user)
+
+    if upload.status == "completed":
+        return _upload_response(upload, storage)
+
+    parts = None
+    if upload.multipart_upload_id:
+        if not payload or not payload.parts:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Uploaded parts are required to complete a multipart upload"
+            )
+        part_count = math.ceil(upload.size_bytes / (settings.s3_multipart_part_size_mb * 1024 * 1024))
+        if any(not 1 <= part.part_number <= part_count for part in payload.parts):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Part numbers must be between 1 and {part_count}"
+            )
+        parts = [(part.part_number, part.etag) for part in payload.parts]
+
+    await _finish_upload(session, storage, background_tasks, upload, parts)
+
+    return _upload_response(upload, storage)
+
+
+def _chunk_count(upload: MediaUpload) -> int:
+    return math.ceil(upload.size_bytes / upload.part_size)
+
+
+def _chunk_size(upload: MediaUpload, chunk_number: int) -> int:
+    """Expected size of a chunk: the session chunk size, or the remainder for the last one."""
+    return min(upload.part_size, upload.size_bytes - (chunk_number - 1) * upload.part_size)
+
+
+async def _get_upload_session(session: AsyncSession, upload_id: UUID, user: User) -> MediaUpload:
+    upload = await _get_user_upload(session, upload_id, user)
+    if upload.part_size is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload session not found"
+        )
+    return upload
+
+
+async def _received_parts(session: AsyncSession, upload: MediaUpload) -> list[MediaUploadPart]:
+    result = await session.execute(
+        select(MediaUploadPart)
+        .where(MediaUploadPart.upload_id == upload.id)
+        .order_by(MediaUploadPart.part_number)
+    )
+    return list(result.scalars().all())
+
+
+def _session_response(
+    upload: MediaUpload, parts: list[MediaUploadPart], storage: StorageService
+) -> UploadSessionResponse:
+    chunk_count = _chunk_count(upload)
+    received = [part.part_number for part in parts]
+
+    # Merge consecutive chunks into contiguous byte ranges
+    ranges: list[ByteRange] = []
+    for part in parts:
+        start = (part.part_number - 1) * upload.part_size
+        end = start + part.size_bytes
+        if ranges and ranges[-1].end == start:
+            ranges[-1].end = end
+        else:
+            ranges.append(ByteRange(start=start, end=end))
+
+    received_set = set(received)
+    return UploadSessionResponse(
+        upload_id=upload.id,
+        file_key=upload.object_key,
+        status=upload.status,
+        size_bytes=upload.size_bytes,
+        chunk_size=upload.part_size,
+        chunk_count=chunk_count,
+        received_chunks=received,
+        missing_chunks=[n for n in range(1, chunk_count + 1) if n not in received_set],
+        received_ranges=ranges,
+        final_url=storage.get_public_url(upload.object_key),
+    )
+
+
+@router.post("/sessions", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED)
+async def create_upload_session(
+    payload: MultipartUploadCreate,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+) -> UploadSessionResponse:
+    """
+    Start a resumable upload session.
+
+    The client PUTs the file in numbered chunks of ``chunk_size`` bytes, in any
+    order and as many times as needed, then finalizes the session. After a
+    failure it queries the session and resends only the missing chunks.
+    """
+
+    _validate_direct_upload(payload.file_type, payload.content_type, payload.size_bytes)
+
+    part_size = settings.s3_multipart_part_size_mb * 1024 * 1024
+    if math.ceil(payload.size_bytes / part_size) > MAX_MULTIPART_PARTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File has too many parts for a multipart upload"
+        )
+
+    file_key = _new_file_key(payload.file_type, user, payload.file_extension)
+    multipart_upload_id = await storage.create_multipart_upload(file_key, payload.content_type)
+
+    upload = MediaUpload(
+        user_id=user.id,
+        file_type=payload.file_type,
+        object_key=file_key,
+        content_type=payload.content_type,
+        multipart_upload_id=multipart_upload_id,
+        part_size=part_size,
+        size_bytes=payload.size_bytes,
+    )
+    session.add(upload)
+    await session.commit()
+
+    return _session_response(upload, [], storage)
+
+
+@router.get("/sessions/{upload_id}", response_model=UploadSessionResponse)
+async def get_upload_session(
+    upload_id: UUID,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+) -> UploadSessionResponse:
+    """Get the chunks and byte ranges received so far for an upload session."""
+
+    upload = await _get_upload_session(session, upload_id, user)
+    return _session_response(upload, await _received_parts(session, upload), storage)
+
+
+@router.put("/sessions/{upload_id}/chunks/{chunk_number}", response_model=UploadSessionResponse)
+async def upload_session_chunk(
+    upload_id: UUID,
+    chunk_number: int,
+    request: Request,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+) -> UploadSessionResponse:
+    """Upload one chunk of a session as the raw request body (resending a chunk replaces it)."""
+
+    upload = await _get_upload_session(session, upload_id, user)
+    if upload.status == "completed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Upload session is already finalized"
+        )
+    if not 1 <= chunk_number <= _chunk_count(upload):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Chunk number out of range"
+        )
+
+    expected_size = _chunk_size(upload, chunk_number)
+    body = bytearray()
+    async for data in request.stream():
+        body.extend(data)
+        if len(body) > expected_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Chunk {chunk_number} must be {expected_size} bytes"
+            )
+    if len(body) != expected_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Chunk {chunk_number} must be {expected_size} bytes"
+        )
+
+    etag = await storage.upload_part(upload.object_key, upload.multipart_upload_id, chunk_number, bytes(body))
+
+    stmt = insert(MediaUploadPart).values(
+        upload_id=upload.id,
+        part_number=chunk_number,
+        etag=etag,
+        size_bytes=expected_size,
+        created_at=datetime.now(timezone.utc),
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[MediaUploadPart.upload_id, MediaUploadPart.part_number],
+            set_={"etag": stmt.excluded.etag, "created_at": stmt.excluded.created_at},
+        )
+    )
+    await session.commit()
+
+    return _session_response(upload, await _received_parts(session, upload), storage)
+
+
+@router.post("/sessions/{upload_id}/finalize", response_model=MediaUploadResponse)
+async def finalize_upload_session(
+    upload_id: UUID,
+    background_tasks: BackgroundTasks,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+) -> MediaUploadResponse:
+    """Assemble the received chunks into the final file once all of them are stored."""
+
+    upload = await _get_upload_session(session, upload_id, user)
+    if upload.status == "completed":
+        return _upload_response(upload, storage)
+
+    parts = await _received_parts(session, upload)
+    missing = _session_response(upload, parts, storage).missing_chunks
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Missing chunks: {missing}"
+        )
+
+    await _finish_upload(
+        session, storage, background_tasks, upload, [(part.part_number, part.etag) for part in parts]
+    )
+
+    return _upload_response(upload, storage)
+
+
+@router.delete("/sessions/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_upload_session(
+    upload_id: UUID,
+    user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    storage: StorageService = Depends(get_storage_service),
+) -> None:
+    """Abandon an unfinished upload session and discard its chunks."""
+
+    upload = await _get_upload_session(session, upload_id, user)
+    if upload.status == "completed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Upload session is already finalized"
+        )
+
+    await storage.abort_multipart_upload(upload.object_key, upload.multipart_upload_id)
+    await session.delete(upload)
+    await session.commit()
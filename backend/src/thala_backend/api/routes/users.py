@@ -3,12 +3,18 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...api.conditional import cache_control_route
 from ...api.deps import get_current_user
 from ...db.session import get_db
 from ...models.user import User
 from ...schemas.user import UserProfile, UserResponse, UserUpdate
+from ...services.image_derivatives import attach_image_variants
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(
+    prefix="/users",
+    tags=["users"],
+    route_class=cache_control_route("private, no-cache"),
+)
 
 
 @router.get("/profile", response_model=UserResponse)
@@ -17,7 +23,9 @@ async def get_own_profile(
     user: User = Depends(get_current_user),
 ) -> UserResponse:
     """Get the authenticated user's own profile with full details."""
-    return UserResponse.model_validate(user)
+    response = UserResponse.model_validate(user)
+    await attach_image_variants(session, [response])
+    return response
 
 
 @router.put("/profile", response_model=UserResponse)
@@ -65,4 +73,6 @@ async def get_public_user_profile(
             detail=f"User with handle '{handle}' not found"
         )
 
-    return UserProfile.model_validate(user)
+    response = UserProfile.model_validate(user)
+    await attach_image_variants(session, [response])
+    return response
@@ -2,12 +2,22 @@
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from ...api.conditional import cache_control_route, validator_headers, weak_etag
 from ...api.deps import get_current_user
+from ...core.config import settings
+from ...api.pagination import (
+    CURSOR_DESCRIPTION,
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+    set_next_cursor,
+)
 from ...db.session import get_db
 from ...models.media import (
     CreatorFollower,
@@ -27,61 +37,295 @@ from ...schemas.video import (
     VideoResponse,
     VideoUpdate,
 )
+from ...services import timeline, video_likes
+from ...services.engagement_counters import get_engagement_counters
+from ...services.image_derivatives import attach_image_variants
+from ...services.feed_ranking import get_feed_ranker
+from ...services.media_jobs import enqueue_video_processing
+from ...services.response_cache import (
+    CACHE_TAG_MUSIC,
+    CACHE_TAG_VIDEO_EFFECTS,
+    CACHE_TAG_VIDEOS,
+    CachedResponse,
+    cached_response,
+    invalidate_cached_responses,
+    video_cache_tag,
+)
+from ...services.search_outbox import enqueue_search_refresh
+from ...services.search_service import SearchService
+
+router = APIRouter(
+    prefix="/videos",
+    tags=["videos"],
+    route_class=cache_control_route("public, max-age=15"),
+)
 
-router = APIRouter(prefix="/videos", tags=["videos"])
+VIDEO_COUNTERS = (Video.likes, Video.comments, Video.shares)
+
+
+def _video_version(video: VideoResponse) -> tuple[Any, ...]:
+    """What a video's ETag depends on."""
+    return (video.id, video.updated_at, video.likes, video.comments, video.shares)
 
 
 @router.get("", response_model=list[VideoResponse])
 async def list_videos(
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+) -> Response:
+    """
+    List videos for the feed with pagination.
+
+    Pass the ``X-Next-Cursor`` header of a page back as ``cursor`` to fetch the
+    next one. Cursor pages seek on the ``(created_at, id)`` index, so they stay
+    fast at any depth and do not shift when new videos are posted.
+
+    Pages are cached; like, comment and share counts may lag for up to the
+    cache TTL.
+    """
+
+    async def build(session: AsyncSession) -> CachedResponse:
+        stmt = select(Video).options(
+            selectinload(Video.music_track),
+            selectinload(Video.effect),
+        )
+
+        videos, next_cursor = await paginate(
+            session,
+            stmt,
+            (Video.created_at.desc(), Video.id.desc()),
+            limit=limit,
+            cursor=cursor,
+            offset=skip,
+        )
+        responses = [VideoResponse.model_validate(video) for video in videos]
+        await get_engagement_counters().merge_pending(responses, *VIDEO_COUNTERS)
+        await attach_image_variants(session, responses)
+
+        # Row versions (updated_at) plus the counts, which change before they are flushed
+        headers = validator_headers(weak_etag(next_cursor, *map(_video_version, responses)))
+        if next_cursor:
+            headers[NEXT_CURSOR_HEADER] = next_cursor
+        return CachedResponse.from_content(responses, headers=headers)
+
+    return await cached_response(
+        "videos:list",
+        {"skip": skip, "limit": limit, "cursor": cursor},
+        tags=(CACHE_TAG_VIDEOS, CACHE_TAG_MUSIC),
+        build=build,
+    )
+
+
+@router.get("/effects", response_model=list[VideoEffectResponse])
+async def list_video_effects(
+) -> Response:
+    """List all available video effects."""
+
+    async def build(session: AsyncSession) -> CachedResponse:
+        stmt = select(VideoEffect).order_by(VideoEffect.name)
+        result = await session.execute(stmt)
+        effects = result.scalars().all()
+
+        return CachedResponse.from_content([VideoEffectResponse.model_validate(effect) for effect in effects])
+
+    return await cached_response(
+        "videos:effects",
+        {},
+        tags=(CACHE_TAG_VIDEO_EFFECTS,),
+        build=build,
+        ttl=settings.response_cache_static_ttl_seconds,
+    )
+
+
+@router.get("/trending", response_model=list[VideoResponse])
+async def list_trending_videos(
+    limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
+) -> Response:
+    """
+    List videos by time-decayed engagement, hottest first.
+
+    Likes, comments and shares count for less the older they are, so recent
+    activity outranks large but old totals. Scores are updated when engagement
+    counters are flushed and read from the ``(trending_score, id)`` index;
+    videos nobody has interacted with yet are not listed.
+    """
+
+    async def build(session: AsyncSession) -> CachedResponse:
+        stmt = (
+            select(Video)
+            .where(Video.trending_score.is_not(None))
+            .options(
+                selectinload(Video.music_track),
+                selectinload(Video.effect),
+            )
+        )
+
+        videos, next_cursor = await paginate(
+            session,
+            stmt,
+            (Video.trending_score.desc(), Video.id.desc()),
+            limit=limit,
+            cursor=cursor,
+        )
+        responses = [VideoResponse.model_validate(video) for video in videos]
+        await get_engagement_counters().merge_pending(responses, *VIDEO_COUNTERS)
+        await attach_image_variants(session, responses)
+
+        headers = validator_headers(weak_etag(next_cursor, *map(_video_version, responses)))
+        if next_cursor:
+            headers[NEXT_CURSOR_HEADER] = next_cursor
+        return CachedResponse.from_content(responses, headers=headers)
+
+    return await cached_response(
+        "videos:trending",
+        {"limit": limit, "cursor": cursor},
+        tags=(CACHE_TAG_VIDEOS, CACHE_TAG_MUSIC),
+        build=build,
+    )
+
+
+@router.get("/for-you", response_model=list[VideoResponse])
+async def list_personalized_videos(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
 ) -> list[VideoResponse]:
-    """List videos for the feed with pagination."""
+    """
+    List videos ranked for the current user.
 
-    stmt = (
+    Recent videos are scored against the user's preferences, liked content
+    and followed creators, with a freshness decay. The ranking is cached per
+    user for a few minutes; pages are slices of it.
+    """
+
+    offset = decode_cursor(cursor, 1)[0] if cursor else 0
+    if not isinstance(offset, int) or offset < 0:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    ranking = await get_feed_ranker().rank(session, user)
+    page_ids = ranking[offset:offset + limit]
+
+    result = await session.execute(
         select(Video)
+        .where(Video.id.in_(page_ids))
         .options(
             selectinload(Video.music_track),
             selectinload(Video.effect),
         )
-        .offset(skip)
-        .limit(limit)
-        .order_by(Video.created_at.desc())
     )
+    videos = {video.id: video for video in result.scalars()}
+    # Videos deleted since the ranking was computed are skipped
+    responses = [VideoResponse.model_validate(videos[video_id]) for video_id in page_ids if video_id in videos]
+    await get_engagement_counters().merge_pending(responses, *VIDEO_COUNTERS)
+    await attach_image_variants(session, responses)
 
-    result = await session.execute(stmt)
-    videos = result.scalars().all()
-
-    return [VideoResponse.model_validate(video) for video in videos]
+    if offset + limit < len(ranking):
+        set_next_cursor(response, encode_cursor([offset + limit]))
+    response.headers["Cache-Control"] = "private, no-cache"
+    return responses
 
 
-@router.get("/{video_id}", response_model=VideoResponse)
-async def get_video(
-    video_id: str,
+@router.get("/following", response_model=list[VideoResponse])
+async def list_following_videos(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100, description="Number of items to return"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     session: AsyncSession = Depends(get_db),
-) -> VideoResponse:
-    """Get a single video by ID."""
+    user: User = Depends(get_current_user),
+) -> list[VideoResponse]:
+    """
+    List videos from the creators the current user follows, newest first.
 
-    stmt = (
+    Served from the user's materialized timeline (one index range scan),
+    merged with the latest videos of very widely followed creators.
+    """
+
+    after = decode_cursor(cursor, 2) if cursor else None
+    page = await timeline.get_timeline_page(session, user.id, limit, tuple(after) if after else None)
+    page_ids = [video_id for _, video_id in page]
+
+    result = await session.execute(
         select(Video)
-        .where(Video.id == video_id)
+        .where(Video.id.in_(page_ids))
         .options(
             selectinload(Video.music_track),
             selectinload(Video.effect),
         )
     )
+    videos = {video.id: video for video in result.scalars()}
+    responses = [VideoResponse.model_validate(videos[video_id]) for video_id in page_ids if video_id in videos]
+    await get_engagement_counters().merge_pending(responses, *VIDEO_COUNTERS)
+    await attach_image_variants(session, responses)
 
-    result = await session.execute(stmt)
-    video = result.scalar_one_or_none()
+    if len(page) == limit:
+        set_next_cursor(response, encode_cursor(list(page[-1])))
+    response.headers["Cache-Control"] = "private, no-cache"
+    return responses
 
-    if video is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Video with id '{video_id}' not found"
+
+@router.get("/liked", response_model=list[str])
+async def list_liked_videos(
+    response: Response,
+    ids: list[str] = Query(..., max_length=100, description="IDs of the videos on the page"),
+    session: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+) -> list[str]:
+    """
+    Return which of the given videos the current user has liked.
+
+    Feed pages are shared between users, so clients hydrate their viewer
+    state with one call per page: ``GET /videos/liked?ids=a&ids=b``.
+    """
+
+    response.headers["Cache-Control"] = "private, no-cache"
+    liked = await video_likes.get_liked_video_ids(session, user.id, ids)
+    return [video_id for video_id in ids if video_id in liked]
+
+
+@router.get("/{video_id}", response_model=VideoResponse)
+async def get_video(
+    video_id: str,
+) -> Response:
+    """Get a single video by ID."""
+
+    async def build(session: AsyncSession) -> CachedResponse:
+        stmt = (
+            select(Video)
+            .where(Video.id == video_id)
+            .options(
+                selectinload(Video.music_track),
+                selectinload(Video.effect),
+            )
         )
 
-    return VideoResponse.model_validate(video)
+        result = await session.execute(stmt)
+        video = result.scalar_one_or_none()
+
+        if video is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Video with id '{video_id}' not found"
+            )
+
+        response = VideoResponse.model_validate(video)
+        await get_engagement_counters().merge_pending([response], *VIDEO_COUNTERS)
+        await attach_image_variants(session, [response])
+
+        return CachedResponse.from_content(
+            response,
+            headers=validator_headers(weak_etag(_video_version(response)), video.updated_at),
+        )
+
+    return await cached_response(
+        "videos:get",
+        {"video_id": video_id},
+        tags=(video_cache_tag(video_id), CACHE_TAG_MUSIC),
+        build=build,
+    )
 
 
 @router.post("", response_model=VideoResponse, status_code=status.HTTP_201_CREATED)
@@ -148,7 +392,11 @@ async def create_video(
     )
 
     session.add(video)
+    enqueue_search_refresh(session, SearchService.INDEX_VIDEOS, video.id)
+    enqueue_video_processing(session, video)
+    timeline.enqueue_timeline_fanout(session, video)
     await session.commit()
+    await invalidate_cached_responses(CACHE_TAG_VIDEOS)
     await session.refresh(video)
 
     # Load relationships
@@ -197,7 +445,9 @@ async def update_video(
     for field, value in update_data.items():
         setattr(video, field, value)
 
+    enqueue_search_refresh(session, SearchService.INDEX_VIDEOS, video.id)
     await session.commit()
+    await invalidate_cached_responses(CACHE_TAG_VIDEOS, video_cache_tag(video_id))
     await session.refresh(video)
 
     # Load relationships
@@ -241,14 +491,18 @@ async def delete_video(
         )
 
     await session.delete(video)
+    enqueue_search_refresh(session, SearchService.INDEX_VIDEOS, video.id)
     await session.commit()
+    await invalidate_cached_responses(CACHE_TAG_VIDEOS, video_cache_tag(video_id))
 
 
 @router.get("/{video_id}/comments", response_model=list[VideoCommentResponse])
 async def list_video_comments(
     video_id: str,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of items to return"),
+    cursor: str | None = Query(None, description=CURSOR_DESCRIPTION),
     session: AsyncSession = Depends(get_db),
 ) -> list[VideoCommentResponse]:
     """List comments for a video."""
@@ -262,16 +516,17 @@ async def list_video_comments(
             detail=f"Video with id '{video_id}' not found"
         )
 
-    stmt = (
-        select(VideoComment)
-        .where(VideoComment.video_id == video_id)
-        .offset(skip)
-        .limit(limit)
-        .order_by(VideoComment.created_at.desc())
-    )
+    stmt = select(VideoComment).where(VideoComment.video_id == video_id)
 
-    result = await session.execute(stmt)
-    comments = result.scalars().all()
+    comments, next_cursor = await paginate(
+        session,
+        stmt,
+        (VideoComment.created_at.desc(), VideoComment.id.desc()),
+        limit=limit,
+        cursor=cursor,
+        offset=skip,
+    )
+    set_next_cursor(response, next_cursor)
 
     return [VideoCommentResponse.model_validate(comment) for comment in comments]
 
@@ -305,10 +560,8 @@ async def create_video_comment(
 
     session.add(comment)
 
-    # Increment comment count on video
-    video.comments += 1
-
     await session.commit()
+    await get_engagement_counters().increment(Video.comments, video_id)
     await session.refresh(comment)
 
     return VideoCommentResponse.model_validate(comment)
@@ -322,28 +575,23 @@ async def toggle_video_like(
 ) -> dict[str, Any]:
     """Toggle like on a video (like if not liked, unlike if already liked)."""
 
-    # Verify video exists
-    video_stmt = select(Video).where(Video.id == video_id)
-    video_result = await session.execute(video_stmt)
-    video = video_result.scalar_one_or_none()
-
-    if video is None:
+    delta = await video_likes.toggle_video_like(session, video_id, user.id)
+    if delta is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Video with id '{video_id}' not found"
         )
 
-    # For now, just increment/decrement the like count
-    # In a full implementation, you'd track individual user likes in a separate table
-    # This is a simplified version
-    video.likes += 1
-
     await session.commit()
 
+    counters = get_engagement_counters()
+    await counters.increment(Video.likes, video_id, delta)
+    stored_likes = await session.scalar(select(Video.likes).where(Video.id == video_id))
+
     return {
         "video_id": video_id,
-        "liked": True,
-        "likes": video.likes
+        "liked": delta > 0,
+        "likes": await counters.current(Video.likes, video_id, stored_likes or 0)
     }
 
 
@@ -374,14 +622,14 @@ async def record_video_share(
 
     session.add(share)
 
-    # Increment share count on video
-    video.shares += 1
-
     await session.commit()
 
+    counters = get_engagement_counters()
+    await counters.increment(Video.shares, video_id)
+
     return {
         "video_id": video_id,
-        "shares": video.shares
+        "shares": await counters.current(Video.shares, video_id, video.shares)
     }
 
 
@@ -423,8 +671,10 @@ async def follow_creator(
     )
 
     session.add(follower)
+    await timeline.backfill_timeline(session, user.id, video.creator_handle)
     await session.commit()
     await session.refresh(follower)
+    get_feed_ranker().forget(user.id)
 
     return CreatorFollowerResponse.model_validate(follower)
 
@@ -463,17 +713,7 @@ async def unfollow_creator(
         )
 
     await session.delete(follower)
+    await timeline.remove_from_timeline(session, user.id, video.creator_handle)
     await session.commit()
+    get_feed_ranker().forget(user.id)
 
-
-@router.get("/effects", response_model=list[VideoEffectResponse])
-async def list_video_effects(
-    session: AsyncSession = Depends(get_db),
-) -> list[VideoEffectResponse]:
-    """List all available video effects."""
-
-    stmt = select(VideoEffect).order_by(VideoEffect.name)
-    result = await session.execute(stmt)
-    effects = result.scalars().all()
-
-    return [VideoEffectResponse.model_validate(effect) for effect in effects]
@@ -28,6 +28,24 @@ class Settings(BaseSettings):
     aws_access_key_id: Optional[str] = Field(default=None, alias="AWS_ACCESS_KEY_ID")
     aws_secret_access_key: Optional[str] = Field(default=None, alias="AWS_SECRET_ACCESS_KEY")
     s3_endpoint_url: Optional[str] = Field(default=None, alias="S3_ENDPOINT_URL")
+    # Whether objects can be read through their public URL; otherwise reads are presigned
+    s3_public_read: bool = Field(default=True, alias="S3_PUBLIC_READ")
+    s3_max_pool_connections: int = Field(default=50, alias="S3_MAX_POOL_CONNECTIONS")
+    s3_multipart_part_size_mb: int = Field(default=8, alias="S3_MULTIPART_PART_SIZE_MB")
+    s3_multipart_concurrency: int = Field(default=4, alias="S3_MULTIPART_CONCURRENCY")
+    s3_presigned_url_cache_size: int = Field(default=10000, alias="S3_PRESIGNED_URL_CACHE_SIZE")
+    s3_presigned_url_reuse_margin_seconds: float = Field(
+        default=300.0, alias="S3_PRESIGNED_URL_REUSE_MARGIN_SECONDS"
+    )
+
+    # Media processing (ffmpeg thumbnails, probing and HLS renditions)
+    media_processing_enabled: bool = Field(default=False, alias="MEDIA_PROCESSING_ENABLED")
+    media_worker_processes: int = Field(default=2, alias="MEDIA_WORKER_PROCESSES")
+    media_job_max_attempts: int = Field(default=3, alias="MEDIA_JOB_MAX_ATTEMPTS")
+    media_job_timeout_seconds: float = Field(default=1800.0, alias="MEDIA_JOB_TIMEOUT_SECONDS")
+    media_job_stale_after_seconds: float = Field(default=7200.0, alias="MEDIA_JOB_STALE_AFTER_SECONDS")
+    media_job_poll_interval_seconds: float = Field(default=2.0, alias="MEDIA_JOB_POLL_INTERVAL_SECONDS")
+    image_worker_processes: int = Field(default=2, alias="IMAGE_WORKER_PROCESSES")
 
     cors_allowed_origins: Union[str, List[str]] = Field(
         default="",
@@ -51,6 +69,56 @@ class Settings(BaseSettings):
     meilisearch_host: Optional[str] = Field(default=None, alias="MEILISEARCH_HOST")
     meilisearch_api_key: Optional[str] = Field(default=None, alias="MEILISEARCH_API_KEY")
     meilisearch_index_prefix: str = Field(default="thela", alias="MEILISEARCH_INDEX_PREFIX")
+    meilisearch_timeout_seconds: float = Field(default=0.3, alias="MEILISEARCH_TIMEOUT_SECONDS")
+    meilisearch_max_concurrency: int = Field(default=32, alias="MEILISEARCH_MAX_CONCURRENCY")
+
+    # Search settings
+    search_category_timeout_seconds: float = Field(default=0.5, alias="SEARCH_CATEGORY_TIMEOUT_SECONDS")
+    # Category queries of universal searches running at once, across requests;
+    # keep it at or below the database pool size (5) so other endpoints keep
+    # getting connections
+    search_max_concurrent_queries: int = Field(default=4, alias="SEARCH_MAX_CONCURRENT_QUERIES")
+    search_outbox_poll_interval_seconds: float = Field(default=1.0, alias="SEARCH_OUTBOX_POLL_INTERVAL_SECONDS")
+    search_outbox_batch_size: int = Field(default=500, alias="SEARCH_OUTBOX_BATCH_SIZE")
+
+    # Response cache for hot read endpoints; RESPONSE_CACHE_URL adds a shared
+    # Redis-compatible tier (redis://...), or an in-process stand-in (memory://)
+    response_cache_enabled: bool = Field(default=True, alias="RESPONSE_CACHE_ENABLED")
+    response_cache_url: Optional[str] = Field(default=None, alias="RESPONSE_CACHE_URL")
+    response_cache_max_entries: int = Field(default=2048, alias="RESPONSE_CACHE_MAX_ENTRIES")
+    response_cache_ttl_seconds: float = Field(default=30.0, alias="RESPONSE_CACHE_TTL_SECONDS")
+    # Data only changed out of band (effects, community profiles)
+    response_cache_static_ttl_seconds: float = Field(default=300.0, alias="RESPONSE_CACHE_STATIC_TTL_SECONDS")
+    response_cache_key_prefix: str = Field(default="thela:cache:", alias="RESPONSE_CACHE_KEY_PREFIX")
+    response_cache_timeout_seconds: float = Field(default=0.2, alias="RESPONSE_CACHE_TIMEOUT_SECONDS")
+
+    # Engagement counters (likes, comments, shares, interest, upvotes) are
+    # buffered and flushed in batches; ENGAGEMENT_COUNTERS_STORE_URL shares the
+    # pending deltas between processes (redis://... or memory://)
+    engagement_counters_write_behind: bool = Field(default=True, alias="ENGAGEMENT_COUNTERS_WRITE_BEHIND")
+    engagement_counters_flush_interval_seconds: float = Field(
+        default=1.0, alias="ENGAGEMENT_COUNTERS_FLUSH_INTERVAL_SECONDS"
+    )
+    engagement_counters_flush_batch_size: int = Field(default=1000, alias="ENGAGEMENT_COUNTERS_FLUSH_BATCH_SIZE")
+    engagement_counters_store_url: Optional[str] = Field(default=None, alias="ENGAGEMENT_COUNTERS_STORE_URL")
+    engagement_counters_key_prefix: str = Field(default="thela:counters:", alias="ENGAGEMENT_COUNTERS_KEY_PREFIX")
+
+    # Personalized feed: candidates are the most recent videos, reloaded
+    # periodically; each user's ranking is cached for a short while
+    feed_candidate_pool_size: int = Field(default=5000, alias="FEED_CANDIDATE_POOL_SIZE")
+    feed_candidate_refresh_seconds: float = Field(default=60.0, alias="FEED_CANDIDATE_REFRESH_SECONDS")
+    feed_ranking_max_results: int = Field(default=500, alias="FEED_RANKING_MAX_RESULTS")
+    feed_ranking_cache_size: int = Field(default=10000, alias="FEED_RANKING_CACHE_SIZE")
+    feed_ranking_cache_ttl_seconds: float = Field(default=300.0, alias="FEED_RANKING_CACHE_TTL_SECONDS")
+    feed_freshness_half_life_hours: float = Field(default=48.0, alias="FEED_FRESHNESS_HALF_LIFE_HOURS")
+
+    # Following timeline: new videos are fanned out to followers' timelines,
+    # except for creators above TIMELINE_FANOUT_MAX_FOLLOWERS (pulled at read time)
+    timeline_fanout_enabled: bool = Field(default=True, alias="TIMELINE_FANOUT_ENABLED")
+    timeline_fanout_batch_size: int = Field(default=1000, alias="TIMELINE_FANOUT_BATCH_SIZE")
+    timeline_fanout_max_followers: int = Field(default=10000, alias="TIMELINE_FANOUT_MAX_FOLLOWERS")
+    timeline_fanout_poll_interval_seconds: float = Field(default=1.0, alias="TIMELINE_FANOUT_POLL_INTERVAL_SECONDS")
+    timeline_backfill_size: int = Field(default=50, alias="TIMELINE_BACKFILL_SIZE")
 
     # Rate limiting settings
     rate_limit_enabled: bool = Field(default=True, alias="RATE_LIMIT_ENABLED")
@@ -1,3 +1,4 @@
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .base import metadata
@@ -7,4 +8,5 @@ async def init_models(engine: AsyncEngine) -> None:
     """Create database tables at startup if they do not exist."""
 
     async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(metadata.create_all)
@@ -12,11 +12,15 @@ from fastapi.responses import JSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
+from sqlalchemy import text
 
+from .api.conditional import ConditionalRequestMiddleware
+from .api.pagination import NEXT_CURSOR_HEADER
 from .api.routes import api_router
 from .core.config import settings
 from .db.base import Base
 from .db.session import engine
+from .services.response_cache import CACHE_STATUS_HEADER
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +29,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Response headers web clients read. Listed by name: with credentials allowed,
+# browsers take "*" as a literal header name rather than a wildcard.
+CORS_EXPOSED_HEADERS = [NEXT_CURSOR_HEADER, "ETag", CACHE_STATUS_HEADER]
+
 
 # Rate limiter setup
 limiter = Limiter(
@@ -44,6 +52,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Create database tables automatically (plug-and-play)
     try:
         async with engine.begin() as conn:
+            # Trigram indexes back the event and community search
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
             await conn.run_sync(Base.metadata.create_all)
         logger.info("Database schema initialized successfully")
     except Exception as e:
@@ -53,19 +63,74 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize MeiliSearch indexes if configured (optional)
     if settings.meilisearch_host:
         try:
-            from .services.search_service import get_search_service
-            search_service = get_search_service()
-            await search_service.initialize_indexes()
+            from .db.session import AsyncSessionLocal
+            from .services.search_service import get_search_service, open_search_client
+            open_search_client()
+            async with AsyncSessionLocal() as session:
+                await get_search_service(session).initialize_indexes()
             logger.info("MeiliSearch indexes initialized")
         except Exception as e:
             logger.warning(f"MeiliSearch initialization skipped: {e}")
 
+    # Open the shared S3 client if storage is configured (optional)
+    if settings.aws_s3_bucket:
+        try:
+            from .services.storage_service import open_storage_client
+            await open_storage_client()
+            logger.info("S3 client initialized")
+        except Exception as e:
+            logger.warning(f"S3 client initialization skipped: {e}")
+
+    # Drain search index updates recorded by write paths
+    search_outbox_worker = None
+    if settings.meilisearch_host:
+        from .services.search_outbox import SearchOutboxWorker
+        search_outbox_worker = SearchOutboxWorker()
+        search_outbox_worker.start()
+
+    # Process uploaded videos (thumbnails, probing, HLS) off the request path
+    media_job_worker = None
+    if settings.media_processing_enabled:
+        from .services.media_jobs import MediaJobWorker
+        media_job_worker = MediaJobWorker()
+        media_job_worker.start()
+
+    # Copy new videos into followers' timelines
+    timeline_fanout_worker = None
+    if settings.timeline_fanout_enabled:
+        from .services.timeline import TimelineFanoutWorker
+        timeline_fanout_worker = TimelineFanoutWorker()
+        timeline_fanout_worker.start()
+
+    # Flush buffered likes, shares, etc. in batches
+    from .services.engagement_counters import get_engagement_counters
+    get_engagement_counters().start()
+
     logger.info(f"Thala Backend started successfully on {settings.api_v1_prefix}")
 
     yield
 
     # Shutdown
     logger.info("Shutting down Thala Backend...")
+    if search_outbox_worker is not None:
+        await search_outbox_worker.stop()
+    if media_job_worker is not None:
+        await media_job_worker.stop()
+    if timeline_fanout_worker is not None:
+        await timeline_fanout_worker.stop()
+    from .services.engagement_counters import close_engagement_counters
+    await close_engagement_counters()
+    if settings.meilisearch_host:
+        from .services.search_service import close_search_client
+        await close_search_client()
+    if settings.response_cache_url:
+        from .services.response_cache import close_response_cache
+        await close_response_cache()
+    if settings.aws_s3_bucket:
+        from .services.image_derivatives import shutdown_image_pool
+        from .services.storage_service import close_storage_client
+        shutdown_image_pool()
+        await close_storage_client()
     await engine.dispose()
     logger.info("Thala Backend shutdown complete")
 
@@ -97,7 +162,7 @@ def create_app() -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
-            expose_headers=["*"],
+            expose_headers=CORS_EXPOSED_HEADERS,
         )
     else:
         # Development: Allow all origins
@@ -107,8 +172,12 @@ def create_app() -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=CORS_EXPOSED_HEADERS,
         )
 
+    # Conditional requests (added before gzip so ETags hash the uncompressed body)
+    app.add_middleware(ConditionalRequestMiddleware)
+
     # Gzip compression
     app.add_middleware(GZipMiddleware, minimum_size=1000)
 
@@ -7,17 +7,23 @@ from thala_backend.models.community import (
     CommunityView,
 )
 from thala_backend.models.content import ContentProfile
+from thala_backend.models.engagement import EngagementCounterFlush
 from thala_backend.models.event import CulturalEvent
 from thala_backend.models.feedback import Feedback
 from thala_backend.models.media import (
     CreatorFollower,
+    MediaJob,
     MusicTrack,
     Video,
     VideoComment,
     VideoEffect,
+    VideoLike,
     VideoShare,
 )
 from thala_backend.models.message import Message, MessageThread
+from thala_backend.models.search import SearchOutboxEntry, SearchSyncWatermark
+from thala_backend.models.timeline import TimelineEntry, TimelineFanoutJob, TimelinePullCreator
+from thala_backend.models.upload import ImageVariantSet, MediaBlob, MediaUpload, MediaUploadPart
 from thala_backend.models.user import User
 
 __all__ = [
@@ -28,13 +34,25 @@ __all__ = [
     "ContentProfile",
     "CreatorFollower",
     "CulturalEvent",
+    "EngagementCounterFlush",
     "Feedback",
+    "ImageVariantSet",
+    "MediaBlob",
+    "MediaJob",
+    "MediaUpload",
+    "MediaUploadPart",
     "Message",
     "MessageThread",
     "MusicTrack",
+    "SearchOutboxEntry",
+    "SearchSyncWatermark",
+    "TimelineEntry",
+    "TimelineFanoutJob",
+    "TimelinePullCreator",
     "User",
     "Video",
     "VideoComment",
     "VideoEffect",
+    "VideoLike",
     "VideoShare",
 ]
@@ -1,7 +1,7 @@
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import Integer, Numeric, String, Text
+from sqlalchemy import Index, Integer, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -15,6 +15,9 @@ def utcnow() -> datetime:
 class ArchiveEntry(Base):
     """Archive entry model for cultural heritage items."""
     __tablename__ = "archive_entries"
+    __table_args__ = (
+        Index("ix_archive_entries_upvotes_created_at_id", "community_upvotes", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     title: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import ARRAY, BigInteger, ForeignKey, Identity, Numeric, String, Text
+from sqlalchemy import ARRAY, BigInteger, Computed, ForeignKey, Identity, Index, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,6 +14,14 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Flattened space names and region matched by /search/communities through a
+# trigram index. Languages live in an array, which cannot feed a generated
+# column, so they are matched separately through their own GIN index.
+COMMUNITY_SEARCH_TEXT = (
+    "lower(coalesce(space->>'en', '') || ' ' || coalesce(space->>'fr', '') || ' ' || region)"
+)
+
+
 class HostRequestStatus(str, Enum):
     """Community host request status enum."""
     PENDING = "pending"
@@ -66,6 +74,16 @@ class CommunityHostRequest(Base):
 class CommunityProfile(Base):
     """Community profile model with detailed information."""
     __tablename__ = "community_profiles"
+    __table_args__ = (
+        Index("ix_community_profiles_priority_created_at_id", "priority", "created_at", "id"),
+        Index(
+            "ix_community_profiles_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+        Index("ix_community_profiles_languages", "languages", postgresql_using="gin"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     space: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
@@ -74,6 +92,11 @@ class CommunityProfile(Base):
     priority: Mapped[float] = mapped_column(Numeric, nullable=False, default=0)
     cards: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, nullable=False, default=list)
     created_at: Mapped[datetime] = mapped_column(default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow)
+
+    search_text: Mapped[str] = mapped_column(
+        Text, Computed(COMMUNITY_SEARCH_TEXT, persisted=True), deferred=True
+    )
 
     def __repr__(self) -> str:
         return f"<CommunityProfile(id={self.id!r}, region={self.region!r})>"
@@ -0,0 +1,27 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base import Base
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class EngagementCounterFlush(Base):
+    """Batch of shared engagement counter deltas already applied to the counters."""
+    __tablename__ = "engagement_counter_flushes"
+
+    # Written in the same transaction as the counter updates, so a batch
+    # retried after its flush lost the lock is never applied twice
+    batch_id: Mapped[str] = mapped_column(String, primary_key=True)
+    applied_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+    __table_args__ = (
+        Index("ix_engagement_counter_flushes_applied_at", "applied_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<EngagementCounterFlush(batch_id={self.batch_id!r}, applied_at={self.applied_at})>"
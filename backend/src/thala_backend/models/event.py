@@ -3,7 +3,7 @@ from enum import Enum
 from typing import Any
 import uuid
 
-from sqlalchemy import ARRAY, Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import ARRAY, Boolean, Computed, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,6 +14,14 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Flattened bilingual text matched by /search/events through a trigram index.
+EVENT_SEARCH_TEXT = (
+    "lower(coalesce(title->>'en', '') || ' ' || coalesce(title->>'fr', '') || ' ' || "
+    "coalesce(description->>'en', '') || ' ' || coalesce(description->>'fr', '') || ' ' || "
+    "coalesce(location->>'en', '') || ' ' || coalesce(location->>'fr', ''))"
+)
+
+
 class EventMode(str, Enum):
     """Cultural event mode enum."""
     IN_PERSON = "in_person"
@@ -24,6 +32,16 @@ class EventMode(str, Enum):
 class CulturalEvent(Base):
     """Cultural event model for Amazigh events and gatherings."""
     __tablename__ = "cultural_events"
+    __table_args__ = (
+        Index("ix_cultural_events_start_at_id", "start_at", "id"),
+        Index("ix_cultural_events_trending_score_id", "trending_score", "id"),
+        Index(
+            "ix_cultural_events_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     title: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
@@ -47,8 +65,15 @@ class CulturalEvent(Base):
 
     # Interest tracking
     interested_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Time-decayed interest, maintained by the counter flush (see services.trending)
+    trending_score: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow)
+
+    search_text: Mapped[str] = mapped_column(
+        Text, Computed(EVENT_SEARCH_TEXT, persisted=True), deferred=True
+    )
 
     def __repr__(self) -> str:
         return f"<CulturalEvent(id={self.id!r}, mode={self.mode!r}, start_at={self.start_at})>"
@@ -4,7 +4,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, Enum as SQLEnum, String, Text
+from sqlalchemy import Boolean, DateTime, Enum as SQLEnum, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..db.base import Base
@@ -34,6 +34,7 @@ class Feedback(Base):
     """Feedback model for bug reports and feature requests."""
 
     __tablename__ = "feedback"
+    __table_args__ = (Index("ix_feedback_created_at_id", "created_at", "id"),)
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
 
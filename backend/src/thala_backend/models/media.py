@@ -3,8 +3,22 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import ARRAY, ForeignKey, Integer, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    LargeBinary,
+    Numeric,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.schema import CheckConstraint
 
@@ -15,6 +29,23 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Weighted full-text documents backing /search. Bilingual fields are stemmed
+# with their own language; handles, names and music metadata are not stemmed.
+VIDEO_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('english', coalesce(title_en, '')), 'A') || "
+    "setweight(to_tsvector('french', coalesce(title_fr, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(creator_handle, '') || ' ' || "
+    "coalesce(creator_name_en, '') || ' ' || coalesce(creator_name_fr, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description_en, '')), 'C') || "
+    "setweight(to_tsvector('french', coalesce(description_fr, '')), 'C')"
+)
+
+MUSIC_SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(artist, '')), 'B')"
+)
+
+
 class MusicTrack(Base):
     __tablename__ = "music_tracks"
 
@@ -25,6 +56,24 @@ class MusicTrack(Base):
     duration_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
     preview_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow)
+
+    # Uploaded original, transcoded by the media processing pipeline into an
+    # AAC preview (preview_url), an Opus preview, the duration and waveform peaks
+    audio_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    preview_opus_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # One byte (0-255) per bucket, scaled to the loudest bucket
+    waveform_peaks: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True, deferred=True)
+    processing_status: Mapped[str | None] = mapped_column(String, nullable=True)  # pending, processing, ready, failed
+
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR, Computed(MUSIC_SEARCH_DOCUMENT, persisted=True), deferred=True
+    )
+
+    __table_args__ = (
+        Index("ix_music_tracks_created_at_id", "created_at", "id"),
+        Index("ix_music_tracks_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
 
 class VideoEffect(Base):
@@ -57,6 +106,11 @@ class Video(Base):
     aspect_ratio: Mapped[float | None] = mapped_column(Numeric(6, 3), nullable=True)
     thumbnail_url: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Filled in by the media processing pipeline
+    duration_seconds: Mapped[float | None] = mapped_column(Numeric(10, 3), nullable=True)
+    hls_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    processing_status: Mapped[str | None] = mapped_column(String, nullable=True)  # pending, processing, ready, failed
+
     music_track_id: Mapped[str | None] = mapped_column(ForeignKey("music_tracks.id"), nullable=True)
     effect_id: Mapped[str | None] = mapped_column(ForeignKey("video_effects.id"), nullable=True)
 
@@ -71,13 +125,57 @@ class Video(Base):
     comments: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     shares: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     tags: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, default=list)
+    # Time-decayed engagement, maintained by the counter flush (see services.trending)
+    trending_score: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(default=utcnow)
     updated_at: Mapped[datetime] = mapped_column(default=utcnow, onupdate=utcnow)
 
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR, Computed(VIDEO_SEARCH_DOCUMENT, persisted=True), deferred=True
+    )
+
     music_track: Mapped[MusicTrack | None] = relationship("MusicTrack")
     effect: Mapped[VideoEffect | None] = relationship("VideoEffect")
 
+    __table_args__ = (
+        # Backs keyset pagination of the feed (ORDER BY created_at DESC, id DESC).
+        Index("ix_videos_created_at_id", "created_at", "id"),
+        Index("ix_videos_search_vector", "search_vector", postgresql_using="gin"),
+        # Backs per-creator pulls of the following timeline
+        Index("ix_videos_creator_handle_created_at_id", "creator_handle", "created_at", "id"),
+        # Backs the trending feed (ORDER BY trending_score DESC, id DESC)
+        Index("ix_videos_trending_score_id", "trending_score", "id"),
+    )
+
+
+class MediaJob(Base):
+    """Background processing job for an uploaded video or music track."""
+    __tablename__ = "media_jobs"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1), primary_key=True)
+    # Exactly one of video_id and music_track_id is set
+    video_id: Mapped[str | None] = mapped_column(ForeignKey("videos.id", ondelete="CASCADE"), nullable=True)
+    music_track_id: Mapped[str | None] = mapped_column(
+        ForeignKey("music_tracks.id", ondelete="CASCADE"), nullable=True
+    )
+    source_url: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(String, nullable=False, default="pending")  # pending, running, succeeded, failed
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Workers claim the oldest pending job
+        Index("ix_media_jobs_status_id", "status", "id"),
+        CheckConstraint(
+            "(video_id IS NULL) <> (music_track_id IS NULL)",
+            name="ck_media_jobs_one_target",
+        ),
+    )
+
 
 class VideoComment(Base):
     __tablename__ = "video_comments"
@@ -88,6 +186,19 @@ class VideoComment(Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(default=utcnow)
 
+    __table_args__ = (
+        Index("ix_video_comments_video_id_created_at_id", "video_id", "created_at", "id"),
+    )
+
+
+class VideoLike(Base):
+    """One user's like of a video; ``Video.likes`` counts these rows."""
+    __tablename__ = "video_likes"
+
+    video_id: Mapped[str] = mapped_column(ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True)
+    user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
 
 class VideoShare(Base):
     __tablename__ = "video_shares"
@@ -105,4 +216,8 @@ class CreatorFollower(Base):
     user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
     followed_at: Mapped[datetime] = mapped_column(default=utcnow)
 
-    __table_args__ = (CheckConstraint("creator_handle <> ''"),)
+    __table_args__ = (
+        CheckConstraint("creator_handle <> ''"),
+        # The primary key leads with the creator; this serves "who do I follow"
+        Index("ix_creator_followers_user_id", "user_id"),
+    )
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from uuid import UUID
 
-from sqlalchemy import ARRAY, ForeignKey, Integer, String, Text
+from sqlalchemy import ARRAY, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -53,6 +53,9 @@ class MessageThread(Base):
 class Message(Base):
     """Individual message model."""
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_thread_id_created_at_id", "thread_id", "created_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     thread_id: Mapped[str] = mapped_column(
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, Identity, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base import Base
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class SearchOutboxEntry(Base):
+    """Pending search-index refresh, written in the same transaction as the change."""
+    __tablename__ = "search_outbox"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        Identity(start=1),
+        primary_key=True
+    )
+    index_type: Mapped[str] = mapped_column(String, nullable=False)
+    document_id: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow)
+
+    def __repr__(self) -> str:
+        return f"<SearchOutboxEntry(id={self.id}, index_type={self.index_type!r}, document_id={self.document_id!r})>"
+
+
+class SearchSyncWatermark(Base):
+    """Start time of the last completed sync of an index, for incremental syncs."""
+    __tablename__ = "search_sync_watermarks"
+
+    index_type: Mapped[str] = mapped_column(String, primary_key=True)
+    synced_at: Mapped[datetime] = mapped_column(nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SearchSyncWatermark(index_type={self.index_type!r}, synced_at={self.synced_at})>"
@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Identity, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base import Base
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class TimelineEntry(Base):
+    """A video in a follower's materialized "following" timeline."""
+    __tablename__ = "timeline_entries"
+
+    user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    video_id: Mapped[str] = mapped_column(ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True)
+    creator_handle: Mapped[str] = mapped_column(String, nullable=False)
+    # Copy of videos.created_at (same naive UTC type), so timeline and video cursors mix
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+
+    __table_args__ = (
+        # A page of the timeline is one range scan of this index
+        Index("ix_timeline_entries_user_id_created_at_video_id", "user_id", "created_at", "video_id"),
+    )
+
+
+class TimelineFanoutJob(Base):
+    """Pending copy of a new video into its creator's followers' timelines."""
+    __tablename__ = "timeline_fanout_jobs"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(start=1), primary_key=True)
+    video_id: Mapped[str] = mapped_column(ForeignKey("videos.id", ondelete="CASCADE"), nullable=False)
+    # Followers are fanned out to in user_id order, in batches; last one done
+    last_user_id: Mapped[UUID | None] = mapped_column(PGUUID(as_uuid=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+
+class TimelinePullCreator(Base):
+    """
+    Creator with too many followers to fan out to.
+
+    Their videos are not copied into timelines; followers' timeline reads
+    pull them from ``videos`` instead.
+    """
+    __tablename__ = "timeline_pull_creators"
+
+    creator_handle: Mapped[str] = mapped_column(String, primary_key=True)
+    follower_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
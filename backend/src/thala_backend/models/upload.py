@@ -0,0 +1,89 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base import Base
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class MediaUpload(Base):
+    """Object uploaded by a client straight to S3 through a presigned URL."""
+    __tablename__ = "media_uploads"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    file_type: Mapped[str] = mapped_column(String, nullable=False)  # video, image, audio
+    object_key: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    content_type: Mapped[str] = mapped_column(String, nullable=False)
+
+    # Set for multipart uploads until they are completed
+    multipart_upload_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Chunk size of resumable upload sessions
+    part_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    status: Mapped[str] = mapped_column(String, nullable=False, default="pending")  # pending, completed
+    size_bytes: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<MediaUpload(id={self.id}, object_key={self.object_key!r}, status={self.status!r})>"
+
+
+class MediaUploadPart(Base):
+    """Chunk of a resumable upload session, stored as an S3 multipart part."""
+    __tablename__ = "media_upload_parts"
+
+    upload_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("media_uploads.id", ondelete="CASCADE"), primary_key=True
+    )
+    part_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+    etag: Mapped[str] = mapped_column(Text, nullable=False)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+    def __repr__(self) -> str:
+        return f"<MediaUploadPart(upload_id={self.upload_id}, part_number={self.part_number})>"
+
+
+class MediaBlob(Base):
+    """Stored object shared by every upload of the same content to the same folder."""
+    __tablename__ = "media_blobs"
+
+    # Upload folder (one per user and media type), so content is never shared across owners
+    folder: Mapped[str] = mapped_column(Text, primary_key=True)
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)  # hex digest of the content
+    object_key: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content_type: Mapped[str] = mapped_column(String, nullable=False)
+    # Uploads resolved to this object; it is deleted from S3 when this reaches 0
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+    def __repr__(self) -> str:
+        return (
+            f"<MediaBlob(folder={self.folder!r}, sha256={self.sha256!r}, "
+            f"object_key={self.object_key!r}, ref_count={self.ref_count})>"
+        )
+
+
+class ImageVariantSet(Base):
+    """Resized derivatives generated for an image, so only existing ones are advertised."""
+    __tablename__ = "image_variant_sets"
+
+    object_key: Mapped[str] = mapped_column(Text, primary_key=True)  # key of the original image
+    # Widths rendered per format, e.g. {"webp": [320, 640, 1080]}
+    variants: Mapped[dict[str, list[int]]] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow)
+
+    def __repr__(self) -> str:
+        return f"<ImageVariantSet(object_key={self.object_key!r}, variants={self.variants})>"
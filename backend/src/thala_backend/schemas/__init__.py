@@ -31,6 +31,16 @@ from .message import (
 # Music schemas
 from .music import MusicTrackBase, MusicTrackCreate, MusicTrackResponse
 
+# Upload schemas
+from .upload import (
+    MediaUploadResponse,
+    MultipartUploadCreate,
+    MultipartUploadResponse,
+    PresignedUploadResponse,
+    UploadCompleteRequest,
+    UploadSessionResponse,
+)
+
 # User schemas
 from .user import UserCreate, UserProfile, UserResponse, UserUpdate
 
@@ -72,6 +82,13 @@ __all__ = [
     "MusicTrackBase",
     "MusicTrackCreate",
     "MusicTrackResponse",
+    # Upload
+    "MediaUploadResponse",
+    "MultipartUploadCreate",
+    "MultipartUploadResponse",
+    "PresignedUploadResponse",
+    "UploadCompleteRequest",
+    "UploadSessionResponse",
     # User
     "UserCreate",
     "UserProfile",
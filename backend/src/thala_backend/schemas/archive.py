@@ -1,13 +1,17 @@
 """Archive-related Pydantic schemas for the Thala backend."""
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
 
+from .image import IMAGE_VARIANTS_DESCRIPTION, ImageVariants, ImageVariantsMixin
 
-class ArchiveEntryResponse(BaseModel):
+
+class ArchiveEntryResponse(ImageVariantsMixin):
     """Schema for archive entry response."""
 
+    image_variant_fields: ClassVar[dict[str, str]] = {"thumbnail_url": "thumbnail_variants"}
+
     id: str = Field(..., description="Unique archive entry identifier")
     title: dict[str, Any] = Field(
         ...,
@@ -33,6 +37,8 @@ class ArchiveEntryResponse(BaseModel):
     )
     created_at: datetime = Field(..., description="Timestamp when entry was created")
 
+    thumbnail_variants: ImageVariants | None = Field(None, description=IMAGE_VARIANTS_DESCRIPTION)
+
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
@@ -1,13 +1,17 @@
 """Event-related Pydantic schemas for the Thala backend."""
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
 
+from .image import IMAGE_VARIANTS_DESCRIPTION, ImageVariants, ImageVariantsMixin
 
-class CulturalEventResponse(BaseModel):
+
+class CulturalEventResponse(ImageVariantsMixin):
     """Schema for cultural event response."""
 
+    image_variant_fields: ClassVar[dict[str, str]] = {"hero_image_url": "hero_image_variants"}
+
     id: str = Field(..., description="Unique event identifier")
     title: dict[str, Any] = Field(
         ...,
@@ -68,6 +72,8 @@ class CulturalEventResponse(BaseModel):
 
     created_at: datetime = Field(..., description="Timestamp when event was created")
 
+    hero_image_variants: ImageVariants | None = Field(None, description=IMAGE_VARIANTS_DESCRIPTION)
+
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
@@ -0,0 +1,24 @@
+"""Responsive image variant fields shared by the response schemas."""
+from typing import ClassVar
+
+from pydantic import BaseModel
+
+# URL by width, keyed by format (e.g. {"webp": {320: "...", 640: "..."}})
+ImageVariants = dict[str, dict[int, str]]
+
+IMAGE_VARIANTS_DESCRIPTION = (
+    "Resized variants of the image by format and width, "
+    "only present once they have been generated"
+)
+
+
+class ImageVariantsMixin(BaseModel):
+    """
+    Response schema exposing resized variants of its images.
+
+    The variant fields are filled in bulk by
+    ``services.image_derivatives.attach_image_variants`` and stay None otherwise.
+    """
+
+    # Variants field of each field holding an original image URL
+    image_variant_fields: ClassVar[dict[str, str]] = {}
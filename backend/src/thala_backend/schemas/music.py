@@ -1,8 +1,11 @@
 """Music-related Pydantic schemas for the Thala backend."""
 from datetime import datetime
+from typing import ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .image import IMAGE_VARIANTS_DESCRIPTION, ImageVariants, ImageVariantsMixin
+
 
 class MusicTrackBase(BaseModel):
     """Base music track schema with common fields."""
@@ -10,8 +13,15 @@ class MusicTrackBase(BaseModel):
     title: str = Field(..., description="Track title")
     artist: str = Field(..., description="Artist name")
     artwork_url: str | None = Field(None, description="URL to track artwork/cover image")
-    duration_seconds: int = Field(..., ge=0, description="Track duration in seconds")
-    preview_url: str | None = Field(None, description="URL to audio preview/sample")
+    duration_seconds: int = Field(
+        0, ge=0, description="Track duration in seconds (computed when audio_url is processed)"
+    )
+    preview_url: str | None = Field(
+        None, description="URL to audio preview/sample (AAC, generated from audio_url when processed)"
+    )
+    audio_url: str | None = Field(
+        None, description="URL of the uploaded audio file to transcode (see POST /upload/audio)"
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -28,18 +38,27 @@ class MusicTrackCreate(MusicTrackBase):
                 "title": "Imzad Dawn",
                 "artist": "Tassili Ensemble",
                 "artwork_url": "https://images.unsplash.com/photo-1470229722913-7c0e2dbbafd3?auto=format&fit=crop&w=600&q=80",
-                "duration_seconds": 252,
-                "preview_url": "https://example.com/preview/imzad-dawn.mp3"
+                "audio_url": "https://example.com/audio/imzad-dawn.wav"
             }
         }
     )
 
 
-class MusicTrackResponse(MusicTrackBase):
+class MusicTrackResponse(ImageVariantsMixin, MusicTrackBase):
     """Schema for music track response with all fields."""
 
+    image_variant_fields: ClassVar[dict[str, str]] = {"artwork_url": "artwork_variants"}
+
     id: str = Field(..., description="Unique track identifier")
     created_at: datetime = Field(..., description="Timestamp when track was created")
+    preview_opus_url: str | None = Field(None, description="URL to the Opus preview, when processed")
+    processing_status: str | None = Field(
+        None,
+        description="Audio processing status: pending, processing, ready or failed; "
+                    "the waveform is available at /music/{id}/waveform once ready"
+    )
+
+    artwork_variants: ImageVariants | None = Field(None, description=IMAGE_VARIANTS_DESCRIPTION)
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -50,8 +69,11 @@ class MusicTrackResponse(MusicTrackBase):
                 "artist": "Tassili Ensemble",
                 "artwork_url": "https://images.unsplash.com/photo-1470229722913-7c0e2dbbafd3?auto=format&fit=crop&w=600&q=80",
                 "duration_seconds": 252,
-                "preview_url": "https://example.com/preview/imzad-dawn.mp3",
-                "created_at": "2024-01-15T08:00:00Z"
+                "preview_url": "https://example.com/preview/imzad-dawn.m4a",
+                "audio_url": "https://example.com/audio/imzad-dawn.wav",
+                "created_at": "2024-01-15T08:00:00Z",
+                "preview_opus_url": "https://example.com/preview/imzad-dawn.opus",
+                "processing_status": "ready"
             }
         }
     )
@@ -0,0 +1,110 @@
+"""Direct-to-S3 upload schemas for the Thala backend."""
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+MediaFileType = Literal["video", "image", "audio"]
+
+
+class PresignedUploadResponse(BaseModel):
+    """Schema for a presigned single-request upload."""
+
+    upload_id: UUID = Field(..., description="Upload identifier, used to complete the upload")
+    method: Literal["POST", "PUT"] = Field(..., description="HTTP method to send the file with")
+    presigned_url: str = Field(..., description="URL to send the file to")
+    fields: dict[str, str] = Field(
+        default_factory=dict,
+        description="Form fields to post along with the file (POST only)",
+    )
+    file_key: str = Field(..., description="S3 object key of the file")
+    final_url: str = Field(..., description="URL of the file once uploaded")
+    expiration_seconds: int = Field(..., description="Seconds until the presigned URL expires")
+
+
+class MultipartUploadCreate(BaseModel):
+    """Schema for starting a presigned multipart upload."""
+
+    file_type: MediaFileType = Field(..., description="Type of file to upload")
+    file_extension: str = Field(..., min_length=1, max_length=10, description="File extension (e.g., 'mp4')")
+    content_type: str = Field(..., description="MIME type of the file")
+    size_bytes: int = Field(..., gt=0, description="Total file size in bytes")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "file_type": "video",
+                "file_extension": "mp4",
+                "content_type": "video/mp4",
+                "size_bytes": 104857600
+            }
+        }
+    )
+
+
+class ByteRange(BaseModel):
+    """Half-open byte range [start, end) of a file."""
+
+    start: int = Field(..., ge=0, description="First byte of the range")
+    end: int = Field(..., ge=0, description="Byte after the last one of the range")
+
+
+class UploadSessionResponse(BaseModel):
+    """Schema for the state of a resumable upload session."""
+
+    upload_id: UUID = Field(..., description="Upload session identifier")
+    file_key: str = Field(..., description="S3 object key of the file")
+    status: str = Field(..., description="Upload status: pending or completed")
+    size_bytes: int = Field(..., description="Total file size in bytes")
+    chunk_size: int = Field(..., description="Size of every chunk but the last, in bytes")
+    chunk_count: int = Field(..., description="Number of chunks making up the file")
+    received_chunks: list[int] = Field(..., description="Numbers of the chunks stored so far")
+    missing_chunks: list[int] = Field(..., description="Numbers of the chunks still to send")
+    received_ranges: list[ByteRange] = Field(..., description="Byte ranges stored so far")
+    final_url: str = Field(..., description="URL of the file once uploaded")
+
+
+class UploadPartURL(BaseModel):
+    """Presigned URL for one part of a multipart upload."""
+
+    part_number: int = Field(..., ge=1, description="1-based part number")
+    url: str = Field(..., description="Presigned PUT URL for this part")
+
+
+class MultipartUploadResponse(BaseModel):
+    """Schema for a started presigned multipart upload."""
+
+    upload_id: UUID = Field(..., description="Upload identifier, used to complete the upload")
+    file_key: str = Field(..., description="S3 object key of the file")
+    part_size: int = Field(..., description="Size of every part but the last, in bytes")
+    parts: list[UploadPartURL] = Field(..., description="Presigned URL for each part")
+    final_url: str = Field(..., description="URL of the file once uploaded")
+    expiration_seconds: int = Field(..., description="Seconds until the part URLs expire")
+
+
+class UploadedPart(BaseModel):
+    """A part uploaded to S3, as reported by the client."""
+
+    part_number: int = Field(..., ge=1, description="1-based part number")
+    etag: str = Field(..., description="ETag header returned by S3 for the part")
+
+
+class UploadCompleteRequest(BaseModel):
+    """Schema for completing a direct upload."""
+
+    parts: list[UploadedPart] | None = Field(None, description="Uploaded parts (multipart uploads only)")
+
+
+class MediaUploadResponse(BaseModel):
+    """Schema for a recorded direct upload."""
+
+    id: UUID = Field(..., description="Upload identifier")
+    file_type: MediaFileType = Field(..., description="Type of the uploaded file")
+    file_key: str = Field(..., description="S3 object key of the file")
+    content_type: str = Field(..., description="MIME type of the file")
+    size_bytes: int | None = Field(None, description="File size in bytes")
+    status: str = Field(..., description="Upload status: pending or completed")
+    final_url: str = Field(..., description="URL of the uploaded file")
+    created_at: datetime = Field(..., description="Timestamp when the upload was requested")
+    completed_at: datetime | None = Field(None, description="Timestamp when the upload was completed")
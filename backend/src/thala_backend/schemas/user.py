@@ -1,10 +1,12 @@
 """User Pydantic schemas for the Thala backend."""
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from .image import IMAGE_VARIANTS_DESCRIPTION, ImageVariants, ImageVariantsMixin
+
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
@@ -67,14 +69,18 @@ class UserUpdate(BaseModel):
     )
 
 
-class UserResponse(UserBase):
+class UserResponse(ImageVariantsMixin, UserBase):
     """Schema for user response with all fields."""
 
+    image_variant_fields: ClassVar[dict[str, str]] = {"picture": "picture_variants"}
+
     id: UUID = Field(..., description="Unique user identifier")
     created_at: datetime = Field(..., description="Timestamp when user was created")
     updated_at: datetime = Field(..., description="Timestamp when user was last updated")
     last_login_at: datetime | None = Field(None, description="Timestamp of user's last login")
 
+    picture_variants: ImageVariants | None = Field(None, description=IMAGE_VARIANTS_DESCRIPTION)
+
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
@@ -94,14 +100,18 @@ class UserResponse(UserBase):
     )
 
 
-class UserProfile(BaseModel):
+class UserProfile(ImageVariantsMixin):
     """Public user profile schema (limited fields)."""
 
+    image_variant_fields: ClassVar[dict[str, str]] = {"picture": "picture_variants"}
+
     id: UUID = Field(..., description="Unique user identifier")
     full_name: str | None = Field(None, description="User's full name")
     picture: str | None = Field(None, description="URL to user's profile picture")
     profile: dict[str, Any] = Field(default_factory=dict, description="Public profile data")
 
+    picture_variants: ImageVariants | None = Field(None, description=IMAGE_VARIANTS_DESCRIPTION)
+
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
@@ -1,10 +1,12 @@
 """Video and media-related Pydantic schemas for the Thala backend."""
 from datetime import datetime
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .image import IMAGE_VARIANTS_DESCRIPTION, ImageVariants, ImageVariantsMixin
+
 
 class LocalizedText(BaseModel):
     """Helper schema for bilingual text content (English and French)."""
@@ -45,15 +47,20 @@ class VideoEffectResponse(BaseModel):
     )
 
 
-class MusicTrackResponse(BaseModel):
+class MusicTrackResponse(ImageVariantsMixin):
     """Schema for music track response (embedded in video)."""
 
+    image_variant_fields: ClassVar[dict[str, str]] = {"artwork_url": "artwork_variants"}
+
     id: str = Field(..., description="Unique track identifier")
     title: str = Field(..., description="Track title")
     artist: str = Field(..., description="Artist name")
     artwork_url: str | None = Field(None, description="URL to track artwork")
     duration_seconds: int = Field(..., ge=0, description="Track duration in seconds")
     preview_url: str | None = Field(None, description="URL to audio preview")
+    preview_opus_url: str | None = Field(None, description="URL to the Opus audio preview")
+
+    artwork_variants: ImageVariants | None = Field(None, description=IMAGE_VARIANTS_DESCRIPTION)
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -162,9 +169,14 @@ class VideoUpdate(BaseModel):
     thumbnail_url: str | None = None
 
 
-class VideoResponse(VideoBase):
+class VideoResponse(ImageVariantsMixin, VideoBase):
     """Schema for video response with all fields."""
 
+    image_variant_fields: ClassVar[dict[str, str]] = {
+        "thumbnail_url": "thumbnail_variants",
+        "image_url": "image_variants",
+    }
+
     id: str = Field(..., description="Unique video identifier")
     creator_id: UUID | None = Field(None, description="Creator's user ID")
 
@@ -172,12 +184,21 @@ class VideoResponse(VideoBase):
     comments: int = Field(0, ge=0, description="Number of comments")
     shares: int = Field(0, ge=0, description="Number of shares")
 
+    duration_seconds: float | None = Field(None, ge=0, description="Video duration in seconds (set by processing)")
+    hls_url: str | None = Field(None, description="HLS master playlist for adaptive playback (set by processing)")
+    processing_status: str | None = Field(
+        None, description="Media processing status: pending, processing, ready or failed"
+    )
+
     created_at: datetime = Field(..., description="Timestamp when video was created")
     updated_at: datetime = Field(..., description="Timestamp when video was last updated")
 
     music_track: MusicTrackResponse | None = Field(None, description="Associated music track details")
     effect: VideoEffectResponse | None = Field(None, description="Applied video effect details")
 
+    thumbnail_variants: ImageVariants | None = Field(None, description=IMAGE_VARIANTS_DESCRIPTION)
+    image_variants: ImageVariants | None = Field(None, description=IMAGE_VARIANTS_DESCRIPTION)
+
     model_config = ConfigDict(
         from_attributes=True,
         json_schema_extra={
@@ -2,6 +2,8 @@
 
 from .auth_service import AuthService, get_auth_service
 from .google_oauth import verify_google_token
+from .media_jobs import MediaJobWorker, enqueue_audio_processing, enqueue_video_processing
+from .search_outbox import SearchOutboxWorker, enqueue_search_refresh
 from .search_service import SearchService, get_search_service
 from .storage_service import StorageService, get_storage_service
 
@@ -9,6 +11,11 @@ __all__ = [
     "AuthService",
     "get_auth_service",
     "verify_google_token",
+    "MediaJobWorker",
+    "enqueue_audio_processing",
+    "enqueue_video_processing",
+    "SearchOutboxWorker",
+    "enqueue_search_refresh",
     "SearchService",
     "get_search_service",
     "StorageService",
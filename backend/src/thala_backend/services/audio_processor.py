@@ -0,0 +1,172 @@
+"""ffmpeg-based audio processing, run in worker processes.
+
+Like media_processor, everything here is synchronous, CPU-bound and only
+uses the standard library.
+"""
+import json
+import os
+import subprocess
+import sys
+from array import array
+from dataclasses import dataclass
+
+from .media_processor import source_input_args
+
+PREVIEW_AAC_FILENAME = "preview.m4a"
+PREVIEW_OPUS_FILENAME = "preview.opus"
+
+PREVIEW_AAC_BITRATE = "128k"
+PREVIEW_OPUS_BITRATE = "96k"
+
+# Waveforms are computed from a mono 8 kHz decode, which is plenty for peaks
+WAVEFORM_SAMPLE_RATE = 8000
+WAVEFORM_BUCKETS = 512
+
+
+@dataclass
+class ProcessedAudio:
+    """Results of processing one audio file; paths are relative to the output directory."""
+
+    duration_seconds: float
+    preview_aac_path: str
+    preview_opus_path: str
+    waveform_peaks: bytes
+
+
+def probe_audio(source: str, timeout: float) -> float:
+    """
+    Read the duration of an audio file with ffprobe.
+
+    Args:
+        source: HTTP(S) URL of the audio file
+        timeout: Seconds before ffprobe is killed
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        ValueError: If the source is not an HTTP(S) URL or has no audio stream
+        subprocess.SubprocessError: If ffprobe fails or times out
+    """
+    output = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-print_format", "json",
+            "-show_format", "-show_streams",
+            *source_input_args(source),
+        ],
+        check=True,
+        capture_output=True,
+        timeout=timeout,
+    ).stdout
+    info = json.loads(output)
+
+    audio = next((s for s in info.get("streams", []) if s.get("codec_type") == "audio"), None)
+    if audio is None:
+        raise ValueError("Source has no audio stream")
+
+    return float(info.get("format", {}).get("duration") or audio.get("duration") or 0)
+
+
+def _transcode_previews(source: str, aac_path: str, opus_path: str, timeout: float) -> None:
+    """Encode the AAC and Opus previews in a single ffmpeg pass."""
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            *source_input_args(source),
+            "-map", "0:a:0", "-vn",
+            "-c:a", "aac", "-b:a", PREVIEW_AAC_BITRATE,
+            # Moov atom first, so playback starts before the download ends
+            "-movflags", "+faststart",
+            aac_path,
+            "-map", "0:a:0", "-vn",
+            "-c:a", "libopus", "-b:a", PREVIEW_OPUS_BITRATE,
+            opus_path,
+        ],
+        check=True,
+        capture_output=True,
+        timeout=timeout,
+    )
+
+
+def compute_waveform_peaks(samples: array, buckets: int = WAVEFORM_BUCKETS) -> bytes:
+    """
+    Reduce signed 16-bit samples to one peak byte per bucket.
+
+    Peaks are scaled so the loudest bucket is 255; silence stays 0.
+
+    Args:
+        samples: Mono signed 16-bit samples
+        buckets: Number of peaks to produce (fewer for very short inputs)
+
+    Returns:
+        Peak amplitudes, one byte each
+    """
+    if not samples:
+        return b""
+
+    buckets = min(buckets, len(samples))
+    peaks = []
+    for i in range(buckets):
+        chunk = samples[i * len(samples) // buckets:(i + 1) * len(samples) // buckets]
+        peaks.append(max(max(chunk), -min(chunk)))
+
+    loudest = max(peaks)
+    if loudest == 0:
+        return bytes(buckets)
+    return bytes(round(peak * 255 / loudest) for peak in peaks)
+
+
+def _decode_waveform(source: str, timeout: float) -> bytes:
+    """Decode the audio to mono 8 kHz samples and compute its peaks."""
+    pcm = subprocess.run(
+        [
+            "ffmpeg", "-v", "error",
+            *source_input_args(source),
+            "-map", "0:a:0",
+            "-ac", "1", "-ar", str(WAVEFORM_SAMPLE_RATE),
+            "-f", "s16le", "-",
+        ],
+        check=True,
+        capture_output=True,
+        timeout=timeout,
+    ).stdout
+
+    samples = array("h")
+    samples.frombytes(pcm[:len(pcm) - len(pcm) % samples.itemsize])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return compute_waveform_peaks(samples)
+
+
+def process_audio(source: str, output_dir: str, timeout: float) -> ProcessedAudio:
+    """
+    Probe an audio file, encode its previews and compute its waveform.
+
+    Args:
+        source: HTTP(S) URL of the uploaded audio file
+        output_dir: Empty directory receiving the preview files
+        timeout: Seconds allowed for each ffmpeg/ffprobe invocation
+
+    Returns:
+        Duration, waveform peaks and the paths of the generated files
+
+    Raises:
+        ValueError: If the source is not an HTTP(S) URL or has no audio stream
+        subprocess.SubprocessError: If ffmpeg fails or times out
+    """
+    duration = probe_audio(source, timeout)
+
+    _transcode_previews(
+        source,
+        os.path.join(output_dir, PREVIEW_AAC_FILENAME),
+        os.path.join(output_dir, PREVIEW_OPUS_FILENAME),
+        timeout,
+    )
+
+    return ProcessedAudio(
+        duration_seconds=round(duration, 3),
+        preview_aac_path=PREVIEW_AAC_FILENAME,
+        preview_opus_path=PREVIEW_OPUS_FILENAME,
+        waveform_peaks=_decode_waveform(source, timeout),
+    )
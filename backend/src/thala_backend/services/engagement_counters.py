@@ -0,0 +1,505 @@
+"""Write-behind aggregation of hot engagement counters.
+
+Likes, comments, shares, event interest and archive upvotes used to be
+applied by updating the parent row on every interaction, so a viral item
+serialized all of its interactions on one row lock. Instead, interactions
+record a delta here and a background task flushes the accumulated deltas
+every ``ENGAGEMENT_COUNTERS_FLUSH_INTERVAL_SECONDS``, one batched
+``UPDATE ... FROM (VALUES ...)`` per table, which also updates the rows'
+trending scores. Reads add the pending deltas to the stored counts.
+
+Deltas are kept in process unless ``ENGAGEMENT_COUNTERS_STORE_URL`` names a
+shared Redis-compatible store, in which case every process sees (and any
+process may flush) the same pending deltas. Without it, each process only
+merges its own deltas into reads until they are flushed.
+"""
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Protocol, Sequence
+
+from sqlalchemy import Integer, String, column, delete, func, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import InstrumentedAttribute
+
+from ..core.config import settings
+from ..db.session import AsyncSessionLocal
+from ..models.archive import ArchiveEntry
+from ..models.engagement import EngagementCounterFlush
+from ..models.event import CulturalEvent
+from ..models.media import Video
+from .trending import trending_score_update
+
+logger = logging.getLogger(__name__)
+
+# Columns maintained through the aggregator; all belong to tables with a string ``id``
+COUNTER_COLUMNS: tuple[InstrumentedAttribute[int], ...] = (
+    Video.likes,
+    Video.comments,
+    Video.shares,
+    CulturalEvent.interested_count,
+    ArchiveEntry.community_upvotes,
+    ArchiveEntry.registered_users,
+)
+
+
+def _counter_name(counter: InstrumentedAttribute[int]) -> str:
+    return f"{counter.class_.__tablename__}.{counter.key}"
+
+
+_COUNTERS_BY_NAME = {_counter_name(counter): counter for counter in COUNTER_COLUMNS}
+
+# Pending deltas, keyed by (counter name, row id)
+Deltas = dict[tuple[str, str], int]
+
+# Deletes KEYS only while KEYS[1] still holds ARGV[1]: a flush that outlived
+# its lock must not release the lock, or drop the batch, of one that took over
+_COMPARE_AND_DELETE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', unpack(KEYS))
+end
+return 0
+"""
+
+# How long applied batch IDs are remembered; a batch is retried within seconds
+_APPLIED_BATCH_RETENTION = timedelta(days=1)
+
+
+class CounterStore(Protocol):
+    """Operations the shared store must support (a subset of Redis)."""
+
+    async def hincrby(self, name: str, key: str, amount: int) -> int: ...
+
+    async def hmget(self, name: str, keys: list[str]) -> list[Optional[bytes]]: ...
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]: ...
+
+    async def exists(self, *names: str) -> int: ...
+
+    async def get(self, name: str) -> Optional[bytes]: ...
+
+    async def rename(self, src: str, dst: str) -> Any: ...
+
+    async def set(self, name: str, value: str, nx: bool = False, ex: Optional[int] = None) -> Any: ...
+
+    async def delete(self, *names: str) -> int: ...
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: str) -> Any: ...
+
+    async def aclose(self) -> None: ...
+
+
+class MemoryCounterStore:
+    """
+    In-process stand-in for the shared store (``ENGAGEMENT_COUNTERS_STORE_URL=memory://``).
+
+    Implements the same commands as the Redis client, for local development
+    and tests without a Redis server.
+    """
+
+    def __init__(self) -> None:
+        self._hashes: dict[str, dict[str, int]] = {}
+        self._strings: dict[str, str] = {}
+
+    async def hincrby(self, name: str, key: str, amount: int) -> int:
+        fields = self._hashes.setdefault(name, {})
+        fields[key] = fields.get(key, 0) + amount
+        return fields[key]
+
+    async def hmget(self, name: str, keys: list[str]) -> list[Optional[bytes]]:
+        fields = self._hashes.get(name, {})
+        return [str(fields[key]).encode() if key in fields else None for key in keys]
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]:
+        return {key.encode(): str(value).encode() for key, value in self._hashes.get(name, {}).items()}
+
+    async def exists(self, *names: str) -> int:
+        return sum(name in self._hashes or name in self._strings for name in names)
+
+    async def get(self, name: str) -> Optional[bytes]:
+        value = self._strings.get(name)
+        return value.encode() if value is not None else None
+
+    async def rename(self, src: str, dst: str) -> bool:
+        if src not in self._hashes:
+            raise KeyError("no such key")
+        self._hashes[dst] = self._hashes.pop(src)
+        return True
+
+    async def set(self, name: str, value: str, nx: bool = False, ex: Optional[int] = None) -> Optional[bool]:
+        # Expiry is not simulated: locks are always released by their holder here
+        if nx and name in self._strings:
+            return None
+        self._strings[name] = value
+        return True
+
+    async def delete(self, *names: str) -> int:
+        deleted = 0
+        for name in names:
+            deleted += self._hashes.pop(name, None) is not None
+            deleted += self._strings.pop(name, None) is not None
+        return deleted
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: str) -> int:
+        # Scripts are not interpreted: only the flush compare-and-delete is supported
+        if script != _COMPARE_AND_DELETE_SCRIPT:
+            raise NotImplementedError("MemoryCounterStore only runs the flush compare-and-delete script")
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        if self._strings.get(keys[0]) != args[0]:
+            return 0
+        return await self.delete(*keys)
+
+    async def aclose(self) -> None:
+        self._hashes.clear()
+        self._strings.clear()
+
+
+def _decode(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class EngagementCounters:
+    """Collects counter deltas and periodically flushes them to Postgres."""
+
+    def __init__(
+        self,
+        write_behind: bool = settings.engagement_counters_write_behind,
+        flush_interval: float = settings.engagement_counters_flush_interval_seconds,
+        batch_size: int = settings.engagement_counters_flush_batch_size,
+        store: Optional[CounterStore] = None,
+        key_prefix: str = settings.engagement_counters_key_prefix,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            write_behind: Buffer deltas and flush them periodically; if False,
+                every increment is written immediately
+            flush_interval: Seconds between flushes
+            batch_size: Maximum number of rows per UPDATE statement
+            store: Shared store holding the pending deltas, or None to keep them in process
+            key_prefix: Prefix of every key written to the shared store
+        """
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.store = store
+        self._pending_key = f"{key_prefix}pending"
+        self._flushing_key = f"{key_prefix}flushing"
+        self._batch_key = f"{key_prefix}flushing-batch"
+        self._lock_key = f"{key_prefix}flush-lock"
+        self._pending: Deltas = defaultdict(int)
+        # Deltas taken by a flush still in progress; reads keep counting them
+        self._flushing: Deltas = {}
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def increment(self, counter: InstrumentedAttribute[int], row_id: str, delta: int = 1) -> None:
+        """
+        Record a change of a counter.
+
+        Call this after committing the interaction itself (the like row, the
+        comment, ...), so a rolled back interaction leaves the counter alone.
+
+        Args:
+            counter: Counter column, one of ``COUNTER_COLUMNS``
+            row_id: ID of the row holding the counter
+            delta: Amount to add (negative to decrement)
+        """
+        name = _counter_name(counter)
+        if name not in _COUNTERS_BY_NAME:
+            raise ValueError(f"{name} is not an engagement counter")
+        if not delta:
+            return
+
+        if not self.write_behind:
+            await self._apply({(name, row_id): delta})
+            return
+
+        if self.store is not None:
+            try:
+                await self.store.hincrby(self._pending_key, f"{name}:{row_id}", delta)
+                return
+            except Exception as exc:
+                # Never lose an interaction to a store outage: write it through
+                logger.warning(f"Counter store write failed, updating {name} directly: {exc}")
+                await self._apply({(name, row_id): delta})
+                return
+
+        self._pending[(name, row_id)] += delta
+
+    async def pending(self, counter: InstrumentedAttribute[int], row_ids: Sequence[str]) -> dict[str, int]:
+        """
+        Get the deltas of a counter not yet flushed to the database.
+
+        Args:
+            counter: Counter column
+            row_ids: IDs of the rows to look up
+
+        Returns:
+            Pending delta per row ID (rows without one are omitted)
+        """
+        name = _counter_name(counter)
+        deltas: dict[str, int] = defaultdict(int)
+
+        if self.store is not None:
+            fields = [f"{name}:{row_id}" for row_id in row_ids]
+            try:
+                for key in (self._pending_key, self._flushing_key):
+                    for row_id, value in zip(row_ids, await self.store.hmget(key, fields)):
+                        if value is not None:
+                            deltas[row_id] += int(value)
+            except Exception as exc:
+                logger.warning(f"Counter store read failed, serving stored counts: {exc}")
+                return {}
+        else:
+            for row_id in row_ids:
+                delta = self._pending.get((name, row_id), 0) + self._flushing.get((name, row_id), 0)
+                if delta:
+                    deltas[row_id] = delta
+
+        return {row_id: delta for row_id, delta in deltas.items() if delta}
+
+    async def current(self, counter: InstrumentedAttribute[int], row_id: str, stored: int) -> int:
+        """
+        Merge the pending delta of one counter into its stored value.
+
+        Args:
+            counter: Counter column
+            row_id: ID of the row holding the counter
+            stored: Value read from the database
+
+        Returns:
+            Up-to-date count
+        """
+        delta = (await self.pending(counter, [row_id])).get(row_id, 0)
+        return max(0, stored + delta)
+
+    async def merge_pending(self, items: Sequence[Any], *counters: InstrumentedAttribute[int]) -> None:
+        """
+        Add pending deltas to response objects in place.
+
+        Use on response schemas, not on ORM objects (which would then write
+        the merged values back on the next commit).
+
+        Args:
+            items: Objects with an ``id`` and one attribute per counter column
+            counters: Counter columns to merge
+        """
+        if not items:
+            return
+        row_ids = [item.id for item in items]
+        for counter in counters:
+            deltas = await self.pending(counter, row_ids)
+            if not deltas:
+                continue
+            for item in items:
+                delta = deltas.get(item.id)
+                if delta:
+                    setattr(item, counter.key, max(0, getattr(item, counter.key) + delta))
+
+    async def flush(self) -> int:
+        """
+        Write the pending deltas to the database.
+
+        Returns:
+            Number of counters updated
+        """
+        async with self._flush_lock:
+            if self.store is not None:
+                return await self._flush_shared()
+
+            if not self._pending:
+                return 0
+            self._flushing, self._pending = self._pending, defaultdict(int)
+            try:
+                await self._apply(self._flushing)
+            except Exception:
+                # Put the deltas back for the next attempt
+                for key, delta in self._flushing.items():
+                    self._pending[key] += delta
+                raise
+            finally:
+                flushed = len(self._flushing)
+                self._flushing = {}
+            return flushed
+
+    async def _flush_shared(self) -> int:
+        """
+        Flush the shared store's deltas, if no other process is doing so.
+
+        The lock can expire during a slow flush and another process then
+        retries the same batch. Each batch carries an ID recorded in the
+        transaction that applies it, so a retried batch is never applied
+        twice. The batch is deleted as soon as it is applied, whoever holds
+        the lock, so reads never count it on top of the database.
+        """
+        assert self.store is not None
+        lock_ttl = max(30, round(self.flush_interval * 10))
+        token = uuid.uuid4().hex
+        if not await self.store.set(self._lock_key, token, nx=True, ex=lock_ttl):
+            return 0
+        try:
+            # A leftover flushing hash means a flush died before deleting it: retry it first
+            if not await self.store.exists(self._flushing_key):
+                if not await self.store.exists(self._pending_key):
+                    return 0
+                await self.store.rename(self._pending_key, self._flushing_key)
+
+            # Kept across retries of the batch: only set if no earlier attempt did
+            await self.store.set(self._batch_key, uuid.uuid4().hex, nx=True)
+            batch_id = await self.store.get(self._batch_key)
+            if batch_id is None:
+                # Another process took the lock over and finished the batch
+                return 0
+
+            deltas: Deltas = {}
+            for field, value in (await self.store.hgetall(self._flushing_key)).items():
+                name, _, row_id = _decode(field).partition(":")
+                if name in _COUNTERS_BY_NAME and int(value):
+                    deltas[(name, row_id)] = int(value)
+
+            await self._apply(deltas, batch_id=_decode(batch_id))
+            # Keyed on the batch ID rather than the lock: if the lock expired,
+            # a newer batch may already be flushing and must be left alone
+            await self.store.eval(
+                _COMPARE_AND_DELETE_SCRIPT, 2, self._batch_key, self._flushing_key, _decode(batch_id)
+            )
+            return len(deltas)
+        finally:
+            await self.store.eval(_COMPARE_AND_DELETE_SCRIPT, 1, self._lock_key, token)
+
+    async def _apply(self, deltas: Deltas, batch_id: Optional[str] = None) -> None:
+        """
+        Apply deltas and trending scores with one ``UPDATE ... FROM (VALUES ...)`` per table and batch.
+
+        Args:
+            deltas: Deltas to apply
+            batch_id: ID of a shared store batch; if it was already applied,
+                nothing is written
+        """
+        by_model: dict[type, dict[str, dict[str, int]]] = defaultdict(lambda: defaultdict(dict))
+        for (name, row_id), delta in deltas.items():
+            if delta:
+                counter = _COUNTERS_BY_NAME[name]
+                by_model[counter.class_][row_id][counter.key] = delta
+        if not by_model:
+            return
+
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as session:
+            if batch_id is not None:
+                # Waits on a concurrent transaction applying the same batch, then conflicts
+                claimed = await session.execute(
+                    insert(EngagementCounterFlush)
+                    .values(batch_id=batch_id, applied_at=now)
+                    .on_conflict_do_nothing()
+                    .returning(EngagementCounterFlush.batch_id)
+                )
+                if claimed.scalar_one_or_none() is None:
+                    logger.info(f"Engagement counter batch {batch_id} was already applied, skipping it")
+                    return
+                await session.execute(
+                    delete(EngagementCounterFlush).where(
+                        EngagementCounterFlush.applied_at < now - _APPLIED_BATCH_RETENTION
+                    )
+                )
+
+            for model, rows in by_model.items():
+                columns = sorted({key for row in rows.values() for key in row})
+                # Sorted so concurrent flushes from several processes lock rows in the same order
+                items = sorted(rows.items())
+                for start in range(0, len(items), self.batch_size):
+                    batch = values(
+                        column("id", String),
+                        *(column(key, Integer) for key in columns),
+                        name="deltas",
+                    ).data(
+                        [
+                            (row_id, *(row.get(key, 0) for key in columns))
+                            for row_id, row in items[start:start + self.batch_size]
+                        ]
+                    )
+                    assignments = {key: func.greatest(getattr(model, key) + batch.c[key], 0) for key in columns}
+                    trending_score = trending_score_update(model, batch, columns, now)
+                    if trending_score is not None:
+                        assignments["trending_score"] = trending_score
+                    await session.execute(update(model).where(model.id == batch.c.id).values(assignments))
+            await session.commit()
+
+    def start(self) -> None:
+        """Start flushing in the background."""
+        if self.write_behind and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and flush what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as exc:
+            logger.error(f"Final engagement counter flush failed: {exc}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                flushed = await self.flush()
+                if flushed:
+                    logger.debug(f"Flushed {flushed} engagement counters")
+            except Exception as exc:
+                logger.warning(f"Engagement counter flush failed, will retry: {exc}")
+
+
+_engagement_counters: Optional[EngagementCounters] = None
+
+
+def _create_store(url: str) -> Optional[CounterStore]:
+    """Connect the shared store named by ``ENGAGEMENT_COUNTERS_STORE_URL``."""
+    if url.startswith("memory://"):
+        return MemoryCounterStore()
+    try:
+        import redis.asyncio as redis
+    except ImportError:
+        logger.warning(
+            "ENGAGEMENT_COUNTERS_STORE_URL is set but the redis package is not installed; keeping deltas in process"
+        )
+        return None
+    return redis.from_url(url)
+
+
+def get_engagement_counters() -> EngagementCounters:
+    """
+    Return the process-wide counter aggregator, creating it on first use.
+
+    Returns:
+        Shared EngagementCounters
+    """
+    global _engagement_counters
+    if _engagement_counters is None:
+        store = (
+            _create_store(settings.engagement_counters_store_url)
+            if settings.engagement_counters_store_url
+            else None
+        )
+        _engagement_counters = EngagementCounters(store=store)
+    return _engagement_counters
+
+
+async def close_engagement_counters() -> None:
+    """Flush the pending deltas and close the shared store (called at application shutdown)."""
+    global _engagement_counters
+    if _engagement_counters is None:
+        return
+    await _engagement_counters.stop()
+    if _engagement_counters.store is not None:
+        await _engagement_counters.store.aclose()
+    _engagement_counters = None
@@ -0,0 +1,408 @@
+"""Personalized "for you" feed ranking.
+
+The most recent videos and their content profiles are loaded once per
+refresh into NumPy arrays shared by every user: a feature matrix (one column
+per cultural family, region, language, topic and energy), creator indices,
+popularity, guardian boosts and creation times. Ranking a user is then a
+matrix-vector product against their affinity vector plus a few vectorized
+terms, with no per-request joins. Ranked IDs are cached per user, and pages
+are sliced from that ranking.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import timezone
+from typing import Any, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..db.session import AsyncSessionLocal
+from ..models.content import ContentProfile
+from ..models.media import CreatorFollower, Video, VideoLike
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Weights of the score terms; relevance is a cosine similarity in [0, 1]
+AFFINITY_WEIGHT = 2.0
+FOLLOW_WEIGHT = 1.5
+POPULARITY_WEIGHT = 0.15
+GUARDIAN_APPROVED_BOOST = 0.4
+HOUSEHOLD_PRACTICE_PENALTY = -0.2
+
+# Weight of one liked video's profile against an explicit preference
+LIKED_PROFILE_WEIGHT = 0.5
+EXPLICIT_PREFERENCE_WEIGHT = 2.0
+MAX_LIKED_PROFILES = 200
+
+
+def profile_features(
+    cultural_families: Iterable[str] = (),
+    regions: Iterable[str] = (),
+    languages: Iterable[str] = (),
+    topics: Iterable[str] = (),
+    energy: Optional[str] = None,
+) -> list[str]:
+    """
+    Name the features of a content profile, e.g. ``family:tuareg``.
+
+    Args:
+        cultural_families: Cultural families
+        regions: Geographic regions
+        languages: Languages
+        topics: Topics
+        energy: Energy level
+
+    Returns:
+        Feature names (lowercased, so spelling variants match)
+    """
+    features = [f"family:{value}" for value in cultural_families]
+    features += [f"region:{value}" for value in regions]
+    features += [f"language:{value}" for value in languages]
+    features += [f"topic:{value}" for value in topics]
+    if energy:
+        features.append(f"energy:{energy}")
+    return [feature.strip().lower() for feature in features]
+
+
+@dataclass
+class CandidatePool:
+    """Recent videos as column arrays, shared by every user's ranking."""
+
+    video_ids: list[str]
+    feature_index: dict[str, int]
+    # (candidates, features), rows L2-normalized
+    features: np.ndarray
+    creator_index: dict[str, int]
+    # Index into creator_index per candidate
+    creators: np.ndarray
+    popularity: np.ndarray
+    boosts: np.ndarray
+    # Unix timestamps
+    created_at: np.ndarray
+    expires_at: float
+
+
+@dataclass
+class UserAffinity:
+    """What one user is drawn to: weighted features and followed creators."""
+
+    weights: dict[str, float]
+    followed: frozenset[str]
+
+
+def build_candidate_pool(rows: Iterable[Any], ttl: float) -> CandidatePool:
+    """
+    Turn candidate rows into a CandidatePool.
+
+    Args:
+        rows: Rows with ``id``, ``creator_handle``, ``likes``, ``comments``,
+            ``shares``, ``created_at`` and the content profile columns (None
+            for videos without a profile), newest first
+        ttl: Seconds before the pool is reloaded
+
+    Returns:
+        CandidatePool
+    """
+    video_ids: list[str] = []
+    feature_index: dict[str, int] = {}
+    creator_index: dict[str, int] = {}
+    cells: list[tuple[int, int]] = []
+    creators, popularity, boosts, created_at = [], [], [], []
+
+    for row in rows:
+        position = len(video_ids)
+        video_ids.append(row.id)
+        for feature in set(
+            profile_features(
+                row.cultural_families or (),
+                row.regions or (),
+                row.languages or (),
+                row.topics or (),
+                row.energy,
+            )
+        ):
+            cells.append((position, feature_index.setdefault(feature, len(feature_index))))
+
+        creators.append(creator_index.setdefault(row.creator_handle, len(creator_index)))
+        # Same engagement mix as the app's on-device ranking
+        popularity.append(math.log1p(row.likes * 0.6 + row.shares * 1.1 + row.comments * 0.4))
+        if row.is_guardian_approved:
+            boosts.append(GUARDIAN_APPROVED_BOOST)
+        elif row.sacred_level == "household_practice":
+            boosts.append(HOUSEHOLD_PRACTICE_PENALTY)
+        else:
+            boosts.append(0.0)
+        # Video timestamps are stored naive, in UTC
+        timestamp = row.created_at
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        created_at.append(timestamp.timestamp())
+
+    features = np.zeros((len(video_ids), max(len(feature_index), 1)), dtype=np.float32)
+    if cells:
+        positions, columns = np.array(cells, dtype=np.int64).T
+        features[positions, columns] = 1.0
+        norms = np.linalg.norm(features, axis=1, keepdims=True)
+        np.divide(features, norms, out=features, where=norms > 0)
+
+    return CandidatePool(
+        video_ids=video_ids,
+        feature_index=feature_index,
+        features=features,
+        creator_index=creator_index,
+        creators=np.array(creators, dtype=np.int32),
+        popularity=np.array(popularity, dtype=np.float32),
+        boosts=np.array(boosts, dtype=np.float32),
+        created_at=np.array(created_at, dtype=np.float64),
+        expires_at=time.monotonic() + ttl,
+    )
+
+
+def score_candidates(
+    pool: CandidatePool,
+    affinity: UserAffinity,
+    now: float,
+    half_life_hours: float,
+) -> np.ndarray:
+    """
+    Score every candidate for one user.
+
+    ``(affinity + follow + popularity + guardian boost) * freshness``, where
+    affinity is the cosine similarity between the candidate's profile and the
+    user's affinity vector, and freshness halves every ``half_life_hours``.
+
+    Args:
+        pool: Candidates
+        affinity: User's affinity
+        now: Current Unix timestamp
+        half_life_hours: Age at which a video's score is halved
+
+    Returns:
+        One score per candidate
+    """
+    vector = np.zeros(pool.features.shape[1], dtype=np.float32)
+    for feature, weight in affinity.weights.items():
+        column = pool.feature_index.get(feature)
+        if column is not None:
+            vector[column] += weight
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+
+    followed = [pool.creator_index[handle] for handle in affinity.followed if handle in pool.creator_index]
+
+    scores = AFFINITY_WEIGHT * (pool.features @ vector)
+    if followed:
+        scores += FOLLOW_WEIGHT * np.isin(pool.creators, followed)
+    scores += POPULARITY_WEIGHT * pool.popularity
+    scores += pool.boosts
+
+    age_hours = np.maximum(now - pool.created_at, 0.0) / 3600.0
+    return scores * np.exp2(-age_hours / half_life_hours)
+
+
+def explicit_preferences(profile: dict[str, Any]) -> list[str]:
+    """
+    Read the features a user chose themselves from their profile data.
+
+    Understands the onboarding answers (``culturalFamily``, ``country``) and
+    list-valued ``cultural_families``, ``regions``, ``languages`` and ``topics``.
+
+    Args:
+        profile: ``User.profile`` JSON
+
+    Returns:
+        Feature names
+    """
+
+    def as_list(*keys: str) -> list[str]:
+        values: list[str] = []
+        for key in keys:
+            value = profile.get(key)
+            if isinstance(value, str) and value:
+                values.append(value)
+            elif isinstance(value, list):
+                values.extend(item for item in value if isinstance(item, str) and item)
+        return values
+
+    return profile_features(
+        cultural_families=as_list("culturalFamily", "cultural_families"),
+        regions=as_list("country", "regions"),
+        languages=as_list("languages"),
+        topics=as_list("topics"),
+    )
+
+
+class FeedRanker:
+    """Ranks the candidate pool per user, caching pools and rankings."""
+
+    def __init__(
+        self,
+        pool_size: int = settings.feed_candidate_pool_size,
+        pool_ttl: float = settings.feed_candidate_refresh_seconds,
+        max_results: int = settings.feed_ranking_max_results,
+        cache_size: int = settings.feed_ranking_cache_size,
+        cache_ttl: float = settings.feed_ranking_cache_ttl_seconds,
+        half_life_hours: float = settings.feed_freshness_half_life_hours,
+    ):
+        """
+        Initialize the ranker.
+
+        Args:
+            pool_size: Number of most recent videos considered
+            pool_ttl: Seconds before the candidate pool is reloaded
+            max_results: Length of a user's ranked feed
+            cache_size: Number of users whose ranking is kept
+            cache_ttl: Seconds a user's ranking is reused
+            half_life_hours: Age at which a video's score is halved
+        """
+        self.pool_size = pool_size
+        self.pool_ttl = pool_ttl
+        self.max_results = max_results
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.half_life_hours = half_life_hours
+        self._pool: Optional[CandidatePool] = None
+        self._pool_lock = asyncio.Lock()
+        self._refresh: Optional[asyncio.Task[None]] = None
+        self._rankings: OrderedDict[UUID, tuple[list[str], float]] = OrderedDict()
+
+    async def rank(self, session: AsyncSession, user: User) -> list[str]:
+        """
+        Get a user's ranked feed, computing it if no fresh ranking is cached.
+
+        Args:
+            session: Database session
+            user: User to rank for
+
+        Returns:
+            Video IDs, best first
+        """
+        now = time.monotonic()
+        cached = self._rankings.get(user.id)
+        if cached is not None and cached[1] > now:
+            self._rankings.move_to_end(user.id)
+            return cached[0]
+
+        pool = await self._get_pool(session)
+        affinity = await self._load_affinity(session, user)
+
+        started = time.perf_counter()
+        scores = score_candidates(pool, affinity, time.time(), self.half_life_hours)
+        count = min(self.max_results, len(scores))
+        # Partial selection of the top candidates, then a stable sort of those only;
+        # the pool is newest first, so ties go to the newer video
+        top = np.argpartition(-scores, count - 1)[:count] if 0 < count < len(scores) else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        ranking = [pool.video_ids[i] for i in top]
+        logger.debug(f"Ranked {len(scores)} candidates in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+        self._rankings[user.id] = (ranking, now + self.cache_ttl)
+        self._rankings.move_to_end(user.id)
+        while len(self._rankings) > self.cache_size:
+            self._rankings.popitem(last=False)
+        return ranking
+
+    def forget(self, user_id: UUID) -> None:
+        """Drop a user's cached ranking, e.g. after they follow someone."""
+        self._rankings.pop(user_id, None)
+
+    async def _get_pool(self, session: AsyncSession) -> CandidatePool:
+        """Get the candidate pool; an expired pool is served while it reloads in the background."""
+        if self._pool is None:
+            async with self._pool_lock:
+                # Another request may have loaded it while we waited
+                if self._pool is None:
+                    self._pool = await self._load_pool(session)
+            return self._pool
+
+        if self._pool.expires_at <= time.monotonic() and self._refresh is None:
+            self._refresh = asyncio.create_task(self._refresh_pool())
+        return self._pool
+
+    async def _refresh_pool(self) -> None:
+        try:
+            async with AsyncSessionLocal() as session:
+                self._pool = await self._load_pool(session)
+        except Exception as exc:
+            logger.warning(f"Feed candidate pool reload failed, keeping the previous one: {exc}")
+        finally:
+            self._refresh = None
+
+    async def _load_pool(self, session: AsyncSession) -> CandidatePool:
+        """Load the most recent videos and their content profiles."""
+        result = await session.execute(
+            select(
+                Video.id,
+                Video.creator_handle,
+                Video.likes,
+                Video.comments,
+                Video.shares,
+                Video.created_at,
+                ContentProfile.cultural_families,
+                ContentProfile.regions,
+                ContentProfile.languages,
+                ContentProfile.topics,
+                ContentProfile.energy,
+                ContentProfile.sacred_level,
+                ContentProfile.is_guardian_approved,
+            )
+            .outerjoin(ContentProfile, ContentProfile.content_id == Video.id)
+            .order_by(Video.created_at.desc(), Video.id.desc())
+            .limit(self.pool_size)
+        )
+        # Building the arrays is pure CPU work: keep it off the event loop
+        return await asyncio.to_thread(build_candidate_pool, result.all(), self.pool_ttl)
+
+    async def _load_affinity(self, session: AsyncSession, user: User) -> UserAffinity:
+        """Build a user's affinity from their preferences, likes and follows."""
+        weights: dict[str, float] = {}
+        for feature in explicit_preferences(user.profile or {}):
+            weights[feature] = weights.get(feature, 0.0) + EXPLICIT_PREFERENCE_WEIGHT
+
+        liked = await session.execute(
+            select(
+                ContentProfile.cultural_families,
+                ContentProfile.regions,
+                ContentProfile.languages,
+                ContentProfile.topics,
+                ContentProfile.energy,
+            )
+            .join(VideoLike, VideoLike.video_id == ContentProfile.content_id)
+            .where(VideoLike.user_id == user.id)
+            .order_by(VideoLike.created_at.desc())
+            .limit(MAX_LIKED_PROFILES)
+        )
+        for row in liked:
+            for feature in profile_features(*row):
+                weights[feature] = weights.get(feature, 0.0) + LIKED_PROFILE_WEIGHT
+
+        followed = await session.scalars(
+            select(CreatorFollower.creator_handle).where(CreatorFollower.user_id == user.id)
+        )
+        return UserAffinity(weights=weights, followed=frozenset(followed.all()))
+
+
+_feed_ranker: Optional[FeedRanker] = None
+
+
+def get_feed_ranker() -> FeedRanker:
+    """
+    Return the process-wide feed ranker, creating it on first use.
+
+    Returns:
+        Shared FeedRanker
+    """
+    global _feed_ranker
+    if _feed_ranker is None:
+        _feed_ranker = FeedRanker()
+    return _feed_ranker
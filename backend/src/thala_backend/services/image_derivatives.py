@@ -0,0 +1,244 @@
+"""Resized WebP/AVIF derivatives of uploaded images."""
+import asyncio
+import io
+import logging
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from PIL import Image, ImageOps, features
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..db.session import AsyncSessionLocal
+from ..models.upload import ImageVariantSet
+from ..schemas.image import ImageVariants, ImageVariantsMixin
+from .presigned_urls import get_presigned_url_cache
+from .storage_service import (
+    StorageService,
+    object_key_from_url,
+    open_storage_client,
+    public_url,
+    variant_prefix,
+)
+
+logger = logging.getLogger(__name__)
+
+# Widths every derivative is rendered at; narrower originals are not upscaled
+IMAGE_VARIANT_WIDTHS: tuple[int, ...] = (320, 640, 1080)
+
+# Extensions of originals that get derivatives (animated GIFs and SVGs do not)
+IMAGE_VARIANT_SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+_SAVE_OPTIONS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "avif": {"format": "AVIF", "quality": 55, "speed": 6},
+}
+
+# Lifetime of presigned variant URLs when the bucket is not publicly readable
+_VARIANT_URL_EXPIRATION_SECONDS = 3600
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+@lru_cache(maxsize=1)
+def image_variant_formats() -> tuple[str, ...]:
+    """Formats derivatives are produced in; AVIF only when Pillow was built with it."""
+    formats = ["webp"]
+    try:
+        if features.check("avif"):
+            formats.append("avif")
+    except ValueError:
+        pass
+    return tuple(formats)
+
+
+def variant_key(object_key: str, width: int, image_format: str) -> str:
+    """
+    Deterministic key of a derivative, derived from the original's key.
+
+    For example ``images/u1/photo.jpg`` at 640px WebP is
+    ``variants/images/u1/photo/w640.webp``.
+    """
+    return f"{variant_prefix(object_key)}/w{width}.{image_format}"
+
+
+def image_variant_urls(object_key: str, variants: dict[str, list[int]]) -> ImageVariants:
+    """
+    Build the URLs of an image's recorded derivatives.
+
+    Args:
+        object_key: S3 object key of the original image
+        variants: Widths rendered per format, as stored on its ImageVariantSet
+
+    Returns:
+        URL by width, keyed by format; presigned unless the bucket is public
+    """
+    if settings.s3_public_read:
+        resolve = public_url
+    else:
+        cache = get_presigned_url_cache()
+
+        def resolve(key: str) -> str:
+            return cache.get(key, _VARIANT_URL_EXPIRATION_SECONDS)
+
+    return {
+        image_format: {width: resolve(variant_key(object_key, width, image_format)) for width in widths}
+        for image_format, widths in variants.items()
+    }
+
+
+def _variant_holders(items: Sequence[BaseModel]) -> Iterator[ImageVariantsMixin]:
+    """Yield every response model, including nested ones, that exposes image variants."""
+    for item in items:
+        if isinstance(item, ImageVariantsMixin):
+            yield item
+        for name in type(item).model_fields:
+            value = getattr(item, name)
+            if isinstance(value, BaseModel):
+                yield from _variant_holders([value])
+            elif isinstance(value, list):
+                yield from _variant_holders([entry for entry in value if isinstance(entry, BaseModel)])
+
+
+async def attach_image_variants(session: AsyncSession, items: Sequence[BaseModel]) -> None:
+    """
+    Look up the derivatives of the images in responses and fill their variant fields.
+
+    Only derivatives recorded as generated are attached, with one query for
+    the whole page. Responses this is not called on expose no variants.
+
+    Args:
+        session: Database session
+        items: Response models, possibly nesting other response models
+    """
+    holders = list(_variant_holders(items))
+    object_keys = {
+        object_key_from_url(getattr(holder, url_field))
+        for holder in holders
+        for url_field in holder.image_variant_fields
+    }
+    object_keys.discard(None)
+    if not object_keys:
+        return
+
+    result = await session.execute(select(ImageVariantSet).where(ImageVariantSet.object_key.in_(object_keys)))
+    urls_by_key = {row.object_key: image_variant_urls(row.object_key, row.variants) for row in result.scalars()}
+
+    for holder in holders:
+        for url_field, variants_field in holder.image_variant_fields.items():
+            object_key = object_key_from_url(getattr(holder, url_field))
+            if object_key in urls_by_key:
+                setattr(holder, variants_field, urls_by_key[object_key])
+
+
+def render_image_variants(source: bytes, output_dir: str, formats: tuple[str, ...]) -> list[str]:
+    """
+    Write every width/format derivative of an image to ``output_dir``.
+
+    Runs in a worker process.
+
+    Args:
+        source: Original image bytes
+        output_dir: Directory receiving ``w{width}.{format}`` files
+        formats: Output formats
+
+    Returns:
+        Names of the written files
+    """
+    with Image.open(io.BytesIO(source)) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+
+        written = []
+        for width in IMAGE_VARIANT_WIDTHS:
+            if image.width > width:
+                resized = image.resize(
+                    (width, max(1, round(image.height * width / image.width))),
+                    Image.Resampling.LANCZOS,
+                )
+            else:
+                resized = image
+            for image_format in formats:
+                filename = f"w{width}.{image_format}"
+                resized.save(os.path.join(output_dir, filename), **_SAVE_OPTIONS[image_format])
+                written.append(filename)
+        return written
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.image_worker_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def shutdown_image_pool() -> None:
+    """Shut the derivative process pool down (called at application shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def generate_image_variants(object_key: str) -> list[str]:
+    """
+    Render and store the derivatives of an image already in S3.
+
+    Args:
+        object_key: S3 object key of the original image
+
+    Returns:
+        S3 object keys of the stored derivatives
+    """
+    s3_client = await open_storage_client()
+    response = await s3_client.get_object(Bucket=settings.aws_s3_bucket, Key=object_key)
+    async with response["Body"] as body:
+        source = await body.read()
+
+    formats = image_variant_formats()
+    with tempfile.TemporaryDirectory(prefix="thala-image-") as output_dir:
+        loop = asyncio.get_running_loop()
+        written = await loop.run_in_executor(_get_pool(), render_image_variants, source, output_dir, formats)
+        keys = await StorageService().upload_directory(output_dir, variant_prefix(object_key))
+
+    variants: dict[str, list[int]] = {}
+    for filename in written:
+        width, image_format = os.path.splitext(filename)
+        variants.setdefault(image_format[1:], []).append(int(width[1:]))
+    await _record_image_variants(object_key, variants)
+
+    logger.info(f"Generated {len(keys)} image variants for {object_key}")
+    return keys
+
+
+async def _record_image_variants(object_key: str, variants: dict[str, list[int]]) -> None:
+    """Record the derivatives stored for an image, replacing an earlier record."""
+    stmt = insert(ImageVariantSet).values(object_key=object_key, variants=variants)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ImageVariantSet.object_key],
+        set_={"variants": stmt.excluded.variants},
+    )
+    async with AsyncSessionLocal() as session:
+        await session.execute(stmt)
+        await session.commit()
+
+
+async def generate_image_variants_safely(object_key: str) -> None:
+    """Generate derivatives as a background task, logging instead of raising."""
+    if os.path.splitext(object_key)[1].lower() not in IMAGE_VARIANT_SOURCE_EXTENSIONS:
+        return
+    try:
+        await generate_image_variants(object_key)
+    except Exception as exc:
+        logger.warning(f"Image variant generation failed for {object_key}: {exc}")
@@ -0,0 +1,297 @@
+"""Background pipeline processing uploaded videos and audio with ffmpeg."""
+import asyncio
+import logging
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..db.session import AsyncSessionLocal
+from ..models.media import MediaJob, MusicTrack, Video
+from .audio_processor import process_audio
+from .image_derivatives import generate_image_variants_safely
+from .media_processor import process_video
+from .response_cache import CACHE_TAG_MUSIC, CACHE_TAG_VIDEOS, invalidate_cached_responses, video_cache_tag
+from .storage_service import StorageService, object_key_from_url
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_video_processing(session: AsyncSession, video: Video) -> None:
+    """
+    Queue a video for thumbnail extraction, probing and HLS encoding.
+
+    Call this before committing the video, so the job is part of the same
+    transaction. Only network videos stored in our bucket are processed, and
+    only when media processing is enabled; external URLs are served as-is.
+
+    Args:
+        session: Session holding the pending video
+        video: Video to process
+    """
+    if not settings.media_processing_enabled:
+        return
+    if video.media_kind != "video" or video.video_source != "network":
+        return
+    if object_key_from_url(video.video_url) is None:
+        return
+    video.processing_status = "pending"
+    session.add(MediaJob(video_id=video.id, source_url=video.video_url))
+
+
+def enqueue_audio_processing(session: AsyncSession, track: MusicTrack) -> None:
+    """
+    Queue a music track's uploaded audio for transcoding and waveform extraction.
+
+    Call this before committing the track, so the job is part of the same
+    transaction. Tracks without audio stored in our bucket are left alone.
+
+    Args:
+        session: Session holding the pending track
+        track: Music track to process
+    """
+    if not settings.media_processing_enabled or object_key_from_url(track.audio_url) is None:
+        return
+    track.processing_status = "pending"
+    session.add(MediaJob(music_track_id=track.id, source_url=track.audio_url))
+
+
+class MediaJobWorker:
+    """Background task running media jobs on a pool of worker processes."""
+
+    def __init__(
+        self,
+        processes: int = settings.media_worker_processes,
+        poll_interval: float = settings.media_job_poll_interval_seconds,
+        job_timeout: float = settings.media_job_timeout_seconds,
+        stale_after: float = settings.media_job_stale_after_seconds,
+        max_attempts: int = settings.media_job_max_attempts,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            processes: Number of worker processes, and of jobs run at once
+            poll_interval: Seconds to wait when no job is pending
+            job_timeout: Seconds each ffprobe/ffmpeg call of a job may run
+            stale_after: Seconds after which a running job is considered
+                abandoned and reclaimed; a job makes several ffmpeg calls and
+                uploads its outputs, so this must exceed job_timeout several times over
+            max_attempts: Attempts before a job is marked failed
+        """
+        self.processes = processes
+        self.poll_interval = poll_interval
+        self.job_timeout = job_timeout
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        """Start the process pool and one job loop per process."""
+        if self._pool is not None:
+            return
+        # Spawned (not forked) children do not inherit the event loop or open connections
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.processes)]
+
+    async def stop(self) -> None:
+        """Stop the job loops and shut the process pool down."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                ran = await self.run_once()
+            except Exception as exc:
+                logger.warning(f"Media job loop failed, will retry: {exc}")
+                ran = False
+
+            if not ran:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _claim_job(self) -> Optional[MediaJob]:
+        """
+        Lock the oldest runnable job and mark it running.
+
+        A stuck job that has used up its attempts is marked failed instead of
+        being run again, so a job that takes the worker down with it is not
+        retried forever.
+        """
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as session:
+            while True:
+                result = await session.execute(
+                    select(MediaJob)
+                    .where(
+                        or_(
+                            MediaJob.status == "pending",
+                            # Reclaim jobs whose worker died mid-run
+                            and_(
+                                MediaJob.status == "running",
+                                MediaJob.started_at < now - timedelta(seconds=self.stale_after),
+                            ),
+                        )
+                    )
+                    .order_by(MediaJob.id)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+                job = result.scalar_one_or_none()
+                if job is None:
+                    return None
+
+                target = await self._get_target(session, job)
+                if job.status == "running" and job.attempts >= self.max_attempts:
+                    logger.warning(f"Media job {job.id} never finished in {job.attempts} attempts, giving up")
+                    job.status = "failed"
+                    job.finished_at = now
+                    job.error = job.error or "Job did not finish within its timeout"
+                    if target is not None:
+                        target.processing_status = "failed"
+                    await session.commit()
+                    continue
+
+                job.status = "running"
+                job.attempts += 1
+                job.started_at = now
+                if target is not None:
+                    target.processing_status = "processing"
+                await session.commit()
+                return job
+
+    async def _get_target(self, session: AsyncSession, job: MediaJob) -> Video | MusicTrack | None:
+        """Load the video or music track a job processes."""
+        if job.music_track_id is not None:
+            return await session.get(MusicTrack, job.music_track_id)
+        return await session.get(Video, job.video_id)
+
+    async def run_once(self) -> bool:
+        """
+        Claim and run one job.
+
+        The ffmpeg work runs in the process pool; outputs are uploaded to S3
+        and the results written back to the video or music track.
+
+        Returns:
+            True if a job was run (successfully or not), False if none was pending
+        """
+        job = await self._claim_job()
+        if job is None:
+            return False
+
+        if job.music_track_id is not None:
+            await self._run_audio_job(job)
+        else:
+            await self._run_video_job(job)
+        return True
+
+    async def _run_video_job(self, job: MediaJob) -> None:
+        try:
+            storage = StorageService()
+            source_url = await self._source_url(storage, job.source_url)
+            with tempfile.TemporaryDirectory(prefix="thala-media-") as output_dir:
+                loop = asyncio.get_running_loop()
+                processed = await loop.run_in_executor(
+                    self._pool, process_video, source_url, output_dir, self.job_timeout
+                )
+                prefix = f"processed/videos/{job.video_id}/{job.id}"
+                await storage.upload_directory(output_dir, prefix)
+        except Exception as exc:
+            logger.warning(f"Media job {job.id} for video {job.video_id} failed: {exc}")
+            await self._finish_job(job.id, error=str(exc) or type(exc).__name__)
+            return
+
+        async with AsyncSessionLocal() as session:
+            video = await session.get(Video, job.video_id)
+            if video is not None:
+                video.duration_seconds = processed.duration_seconds
+                video.aspect_ratio = processed.aspect_ratio
+                video.hls_url = storage.get_public_url(f"{prefix}/{processed.master_playlist_path}")
+                # Keep a cover the creator picked themselves
+                if not video.thumbnail_url:
+                    video.thumbnail_url = storage.get_public_url(f"{prefix}/{processed.thumbnail_path}")
+                video.processing_status = "ready"
+            await session.commit()
+        await invalidate_cached_responses(CACHE_TAG_VIDEOS, video_cache_tag(job.video_id))
+
+        await generate_image_variants_safely(f"{prefix}/{processed.thumbnail_path}")
+
+        await self._finish_job(job.id)
+        logger.info(f"Media job {job.id} processed video {job.video_id}")
+
+    async def _run_audio_job(self, job: MediaJob) -> None:
+        try:
+            storage = StorageService()
+            source_url = await self._source_url(storage, job.source_url)
+            with tempfile.TemporaryDirectory(prefix="thala-media-") as output_dir:
+                loop = asyncio.get_running_loop()
+                processed = await loop.run_in_executor(
+                    self._pool, process_audio, source_url, output_dir, self.job_timeout
+                )
+                prefix = f"processed/music/{job.music_track_id}/{job.id}"
+                await storage.upload_directory(output_dir, prefix)
+        except Exception as exc:
+            logger.warning(f"Media job {job.id} for music track {job.music_track_id} failed: {exc}")
+            await self._finish_job(job.id, error=str(exc) or type(exc).__name__)
+            return
+
+        async with AsyncSessionLocal() as session:
+            track = await session.get(MusicTrack, job.music_track_id)
+            if track is not None:
+                track.duration_seconds = round(processed.duration_seconds)
+                track.preview_url = storage.get_public_url(f"{prefix}/{processed.preview_aac_path}")
+                track.preview_opus_url = storage.get_public_url(f"{prefix}/{processed.preview_opus_path}")
+                track.waveform_peaks = processed.waveform_peaks
+                track.processing_status = "ready"
+            await session.commit()
+        await invalidate_cached_responses(CACHE_TAG_MUSIC)
+
+        await self._finish_job(job.id)
+        logger.info(f"Media job {job.id} processed music track {job.music_track_id}")
+
+    async def _finish_job(self, job_id: int, error: Optional[str] = None) -> None:
+        """Record a job's outcome; failed jobs are retried until max_attempts."""
+        async with AsyncSessionLocal() as session:
+            job = await session.get(MediaJob, job_id)
+            if job is None:
+                return
+            job.finished_at = datetime.now(timezone.utc)
+            job.error = error
+            if error is None:
+                job.status = "succeeded"
+            elif job.attempts < self.max_attempts:
+                job.status = "pending"
+            else:
+                job.status = "failed"
+                target = await self._get_target(session, job)
+                if target is not None:
+                    target.processing_status = "failed"
+            await session.commit()
+
+    async def _source_url(self, storage: StorageService, url: str) -> str:
+        """
+        Give ffmpeg a presigned URL for an object in our (possibly private) bucket.
+
+        Raises:
+            ValueError: If the URL does not point into the bucket; ffmpeg is
+                never given client-supplied URLs
+        """
+        object_key = object_key_from_url(url)
+        if not object_key:
+            raise ValueError("Media source is not an object in the media bucket")
+        return await storage.generate_presigned_url(object_key)
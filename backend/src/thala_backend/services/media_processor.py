@@ -0,0 +1,221 @@
+"""ffmpeg-based video processing, run in worker processes.
+
+Everything here is synchronous and CPU-bound; it only uses the standard
+library so it can run in a process pool without touching the event loop.
+"""
+import json
+import os
+import subprocess
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+# Adaptive bitrate ladder: (short side in pixels, video bitrate, audio bitrate)
+HLS_RENDITIONS: list[tuple[int, str, str]] = [
+    (1080, "5000k", "128k"),
+    (720, "2800k", "128k"),
+    (480, "1400k", "96k"),
+    (360, "800k", "64k"),
+]
+
+HLS_SEGMENT_SECONDS = 4
+THUMBNAIL_MAX_WIDTH = 720
+
+THUMBNAIL_FILENAME = "thumbnail.jpg"
+MASTER_PLAYLIST_FILENAME = "master.m3u8"
+
+
+def source_input_args(source: str) -> list[str]:
+    """
+    Input arguments for ffmpeg/ffprobe reading a (presigned) bucket URL.
+
+    The source is passed as the value of ``-i`` so it can never be read as an
+    option, and a protocol whitelist keeps ffmpeg (including any playlist it
+    opens) from reading local files or other protocols.
+
+    Args:
+        source: HTTP(S) URL of the media
+
+    Returns:
+        Arguments to put before the output options
+
+    Raises:
+        ValueError: If the source is not an HTTP(S) URL
+    """
+    scheme = urlsplit(source).scheme
+    if scheme == "https":
+        protocols = "https,tls,tcp"
+    elif scheme == "http":
+        # Local S3-compatible endpoints (MinIO) are served over plain HTTP
+        protocols = "http,tcp"
+    else:
+        raise ValueError("Media source must be an HTTP(S) URL")
+    return ["-protocol_whitelist", protocols, "-i", source]
+
+
+@dataclass
+class ProcessedVideo:
+    """Results of processing one video; paths are relative to the output directory."""
+
+    duration_seconds: float
+    aspect_ratio: float
+    thumbnail_path: str
+    master_playlist_path: str
+
+
+def probe_video(source: str, timeout: float) -> dict[str, Any]:
+    """
+    Read duration, display size and audio presence with ffprobe.
+
+    Args:
+        source: HTTP(S) URL of the video
+        timeout: Seconds before ffprobe is killed
+
+    Returns:
+        Dict with ``duration``, ``width``, ``height`` and ``has_audio``
+
+    Raises:
+        ValueError: If the source is not an HTTP(S) URL or has no video stream
+        subprocess.SubprocessError: If ffprobe fails or times out
+    """
+    output = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-print_format", "json",
+            "-show_format", "-show_streams",
+            *source_input_args(source),
+        ],
+        check=True,
+        capture_output=True,
+        timeout=timeout,
+    ).stdout
+    info = json.loads(output)
+
+    streams = info.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    if video is None:
+        raise ValueError("Source has no video stream")
+
+    width, height = int(video["width"]), int(video["height"])
+
+    # Phone footage is often stored landscape with a rotation flag
+    rotation = video.get("tags", {}).get("rotate")
+    for side_data in video.get("side_data_list", []):
+        rotation = side_data.get("rotation", rotation)
+    if rotation is not None and abs(int(float(rotation))) % 180 == 90:
+        width, height = height, width
+
+    duration = float(info.get("format", {}).get("duration") or video.get("duration") or 0)
+
+    return {
+        "duration": duration,
+        "width": width,
+        "height": height,
+        "has_audio": any(s.get("codec_type") == "audio" for s in streams),
+    }
+
+
+def _extract_thumbnail(source: str, output_path: str, at_seconds: float, timeout: float) -> None:
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            "-ss", f"{at_seconds:.3f}",
+            *source_input_args(source),
+            "-frames:v", "1",
+            "-vf", f"scale='min({THUMBNAIL_MAX_WIDTH},iw)':-2",
+            "-q:v", "3",
+            output_path,
+        ],
+        check=True,
+        capture_output=True,
+        timeout=timeout,
+    )
+
+
+def _renditions_for(short_side: int) -> list[tuple[int, str, str]]:
+    """Renditions no larger than the source, keeping at least the smallest one."""
+    renditions = [r for r in HLS_RENDITIONS if r[0] <= short_side]
+    return renditions or [(short_side - short_side % 2, *HLS_RENDITIONS[-1][1:])]
+
+
+def _transcode_hls(
+    source: str,
+    output_dir: str,
+    width: int,
+    height: int,
+    has_audio: bool,
+    timeout: float,
+) -> None:
+    """Encode every rendition in a single ffmpeg pass, with aligned keyframes."""
+    renditions = _renditions_for(min(width, height))
+    portrait = height > width
+
+    splits = "".join(f"[v{i}]" for i in range(len(renditions)))
+    filters = [f"[0:v]split={len(renditions)}{splits}"]
+    for i, (short_side, _, _) in enumerate(renditions):
+        scale = f"{short_side}:-2" if portrait else f"-2:{short_side}"
+        filters.append(f"[v{i}]scale={scale}[v{i}out]")
+
+    command = [
+        "ffmpeg", "-v", "error", "-y",
+        *source_input_args(source),
+        "-filter_complex", ";".join(filters),
+    ]
+    stream_map = []
+    for i, (_, video_bitrate, audio_bitrate) in enumerate(renditions):
+        command += [
+            "-map", f"[v{i}out]",
+            f"-c:v:{i}", "libx264",
+            f"-b:v:{i}", video_bitrate,
+            f"-maxrate:v:{i}", video_bitrate,
+            f"-bufsize:v:{i}", video_bitrate,
+        ]
+        if has_audio:
+            command += ["-map", "a:0", f"-c:a:{i}", "aac", f"-b:a:{i}", audio_bitrate]
+            stream_map.append(f"v:{i},a:{i}")
+        else:
+            stream_map.append(f"v:{i}")
+
+    command += [
+        "-preset", "veryfast",
+        "-force_key_frames", f"expr:gte(t,n_forced*{HLS_SEGMENT_SECONDS})",
+        "-f", "hls",
+        "-hls_time", str(HLS_SEGMENT_SECONDS),
+        "-hls_playlist_type", "vod",
+        "-hls_segment_filename", os.path.join(output_dir, "v%v", "segment_%04d.ts"),
+        "-master_pl_name", MASTER_PLAYLIST_FILENAME,
+        "-var_stream_map", " ".join(stream_map),
+        os.path.join(output_dir, "v%v", "index.m3u8"),
+    ]
+    subprocess.run(command, check=True, capture_output=True, timeout=timeout)
+
+
+def process_video(source: str, output_dir: str, timeout: float) -> ProcessedVideo:
+    """
+    Probe a video, extract a thumbnail and encode its HLS renditions.
+
+    Args:
+        source: HTTP(S) URL of the uploaded video
+        output_dir: Empty directory receiving the thumbnail and HLS files
+        timeout: Seconds allowed for each ffmpeg/ffprobe invocation
+
+    Returns:
+        Probed metadata and the paths of the generated files
+
+    Raises:
+        ValueError: If the source is not an HTTP(S) URL or has no video stream
+        subprocess.SubprocessError: If ffmpeg fails or times out
+    """
+    info = probe_video(source, timeout)
+
+    thumbnail_path = os.path.join(output_dir, THUMBNAIL_FILENAME)
+    _extract_thumbnail(source, thumbnail_path, min(1.0, info["duration"] / 2), timeout)
+
+    _transcode_hls(source, output_dir, info["width"], info["height"], info["has_audio"], timeout)
+
+    return ProcessedVideo(
+        duration_seconds=round(info["duration"], 3),
+        aspect_ratio=round(info["width"] / info["height"], 3),
+        thumbnail_path=THUMBNAIL_FILENAME,
+        master_playlist_path=MASTER_PLAYLIST_FILENAME,
+    )
@@ -0,0 +1,201 @@
+"""Local SigV4 signing and caching of presigned S3 URLs."""
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import quote, urlsplit
+
+from ..core.config import settings
+
+_ALGORITHM = "AWS4-HMAC-SHA256"
+
+
+def _uri_encode(value: str, safe: str = "") -> str:
+    """Percent-encode as SigV4 expects (RFC 3986 unreserved characters kept)."""
+    return quote(value, safe="-_.~" + safe)
+
+
+class PresignedURLSigner:
+    """
+    Query-string SigV4 signer for S3 objects.
+
+    Produces the same URLs as botocore's ``generate_presigned_url`` without a
+    client, request object or endpoint resolution per URL: one signature is a
+    few HMACs. The day's signing key is derived once and reused.
+    """
+
+    def __init__(
+        self,
+        access_key_id: str,
+        secret_access_key: str,
+        region: str,
+        bucket: str,
+        endpoint_url: Optional[str] = None,
+    ):
+        """
+        Initialize the signer.
+
+        Args:
+            access_key_id: AWS access key ID
+            secret_access_key: AWS secret access key
+            region: Bucket region
+            bucket: Bucket name
+            endpoint_url: Custom S3-compatible endpoint, addressed path-style
+        """
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
+        self.region = region
+
+        if endpoint_url:
+            parts = urlsplit(endpoint_url)
+            self._scheme, self._host = parts.scheme, parts.netloc
+            self._path_prefix = f"{parts.path.rstrip('/')}/{_uri_encode(bucket)}"
+        else:
+            self._scheme, self._host = "https", f"{bucket}.s3.{region}.amazonaws.com"
+            self._path_prefix = ""
+
+        self._signing_key_date: Optional[str] = None
+        self._signing_key = b""
+
+    def _get_signing_key(self, date_stamp: str) -> bytes:
+        if self._signing_key_date != date_stamp:
+            key = f"AWS4{self.secret_access_key}".encode()
+            for part in (date_stamp, self.region, "s3", "aws4_request"):
+                key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+            self._signing_key, self._signing_key_date = key, date_stamp
+        return self._signing_key
+
+    def sign(
+        self,
+        object_key: str,
+        expires_in: int,
+        method: str = "GET",
+        params: Optional[dict[str, str]] = None,
+        now: Optional[datetime] = None,
+    ) -> str:
+        """
+        Presign a request on an object.
+
+        Args:
+            object_key: S3 object key (path)
+            expires_in: Seconds the URL stays valid
+            method: HTTP method the URL is for
+            params: Extra query parameters to sign (e.g. ``uploadId``)
+            now: Signing time (defaults to now)
+
+        Returns:
+            Presigned URL
+        """
+        now = now or datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+        scope = f"{date_stamp}/{self.region}/s3/aws4_request"
+
+        query = {
+            **(params or {}),
+            "X-Amz-Algorithm": _ALGORITHM,
+            "X-Amz-Credential": f"{self.access_key_id}/{scope}",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(expires_in),
+            "X-Amz-SignedHeaders": "host",
+        }
+        canonical_query = "&".join(
+            f"{_uri_encode(name)}={_uri_encode(value)}" for name, value in sorted(query.items())
+        )
+        path = f"{self._path_prefix}/{_uri_encode(object_key, safe='/')}"
+
+        canonical_request = "\n".join(
+            [method, path, canonical_query, f"host:{self._host}", "", "host", "UNSIGNED-PAYLOAD"]
+        )
+        string_to_sign = "\n".join(
+            [_ALGORITHM, amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest()]
+        )
+        signature = hmac.new(
+            self._get_signing_key(date_stamp), string_to_sign.encode(), hashlib.sha256
+        ).hexdigest()
+
+        return f"{self._scheme}://{self._host}{path}?{canonical_query}&X-Amz-Signature={signature}"
+
+
+class PresignedURLCache:
+    """
+    In-process LRU cache of presigned GET URLs.
+
+    A URL is reused until ``reuse_margin`` seconds before it expires, so every
+    URL handed out stays valid for at least that long.
+    """
+
+    def __init__(self, signer: PresignedURLSigner, max_entries: int, reuse_margin: float):
+        """
+        Initialize the cache.
+
+        Args:
+            signer: Signer producing the URLs
+            max_entries: Maximum number of URLs kept
+            reuse_margin: Seconds before expiry a URL stops being reused
+        """
+        self.signer = signer
+        self.max_entries = max_entries
+        self.reuse_margin = reuse_margin
+        self._entries: OrderedDict[tuple[str, int], tuple[str, float]] = OrderedDict()
+
+    def get(self, object_key: str, expires_in: int) -> str:
+        """
+        Get a presigned GET URL, signing it only if no reusable one is cached.
+
+        Args:
+            object_key: S3 object key (path)
+            expires_in: Seconds a freshly signed URL stays valid
+
+        Returns:
+            Presigned URL
+        """
+        cache_key = (object_key, expires_in)
+        now = time.monotonic()
+
+        entry = self._entries.get(cache_key)
+        if entry is not None and entry[1] > now:
+            self._entries.move_to_end(cache_key)
+            return entry[0]
+
+        url = self.signer.sign(object_key, expires_in)
+        reusable_for = expires_in - self.reuse_margin
+        if reusable_for > 0:
+            self._entries[cache_key] = (url, now + reusable_for)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return url
+
+    def clear(self) -> None:
+        """Drop every cached URL."""
+        self._entries.clear()
+
+
+_cache: Optional[PresignedURLCache] = None
+
+
+def get_presigned_url_cache() -> PresignedURLCache:
+    """
+    Return the process-wide presigned URL cache, creating it on first use.
+
+    Returns:
+        Shared PresignedURLCache
+    """
+    global _cache
+    if _cache is None:
+        signer = PresignedURLSigner(
+            access_key_id=settings.aws_access_key_id or "",
+            secret_access_key=settings.aws_secret_access_key or "",
+            region=settings.aws_region or "",
+            bucket=settings.aws_s3_bucket or "",
+            endpoint_url=settings.s3_endpoint_url,
+        )
+        _cache = PresignedURLCache(
+            signer,
+            max_entries=settings.s3_presigned_url_cache_size,
+            reuse_margin=settings.s3_presigned_url_reuse_margin_seconds,
+        )
+    return _cache
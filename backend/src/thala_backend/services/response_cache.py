@@ -0,0 +1,348 @@
+"""Tiered cache for the responses of hot read endpoints.
+
+Responses are cached as JSON bytes in an in-process LRU and, when
+``RESPONSE_CACHE_URL`` is set, in a shared Redis-compatible tier. Entries are
+tagged (e.g. ``videos``, ``video:<id>``); every tag has a version number that
+is part of the entry key, so invalidating a tag is a single increment and
+stale entries simply stop being looked up until they expire.
+
+Tag versions live in the shared tier when there is one, which keeps every
+process consistent. Without it they are per-process, and other processes see
+writes once their entries expire.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Optional, Protocol
+
+import pydantic_core
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Tags shared by the read routes and the write paths invalidating them
+CACHE_TAG_VIDEOS = "videos"
+CACHE_TAG_MUSIC = "music"
+CACHE_TAG_VIDEO_EFFECTS = "video_effects"
+CACHE_TAG_COMMUNITY_PROFILES = "community_profiles"
+CACHE_TAG_ARCHIVE = "archive"
+
+CACHE_STATUS_HEADER = "X-Cache"
+
+
+def video_cache_tag(video_id: str) -> str:
+    """Tag of the cached responses showing one video."""
+    return f"video:{video_id}"
+
+
+@dataclass
+class CachedResponse:
+    """JSON body and headers of a cached response."""
+
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_content(cls, content: Any, headers: Optional[dict[str, str]] = None) -> "CachedResponse":
+        """
+        Serialize response content (Pydantic models, lists, dicts) to JSON.
+
+        Args:
+            content: Content to serialize
+            headers: Headers to send along with the body
+
+        Returns:
+            CachedResponse holding the serialized content
+        """
+        return cls(body=pydantic_core.to_json(content), headers=headers or {})
+
+    def dumps(self) -> bytes:
+        """Encode for the shared tier: a JSON header line, then the body."""
+        return json.dumps(self.headers).encode() + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CachedResponse":
+        """Decode an entry read from the shared tier."""
+        headers, body = data.split(b"\n", 1)
+        return cls(body=body, headers=json.loads(headers))
+
+    def to_response(self, cache_status: str) -> Response:
+        """Build the HTTP response, reporting whether it was a cache hit."""
+        return Response(
+            content=self.body,
+            media_type="application/json",
+            headers={**self.headers, CACHE_STATUS_HEADER: cache_status},
+        )
+
+
+# Builds a response from a database session owned by the cache
+ResponseBuilder = Callable[[AsyncSession], Awaitable[CachedResponse]]
+
+
+class SharedCacheBackend(Protocol):
+    """Operations the shared tier must support (a subset of Redis)."""
+
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes, ex: int) -> Any: ...
+
+    async def mget(self, keys: list[str]) -> list[Optional[bytes]]: ...
+
+    async def incr(self, key: str) -> int: ...
+
+    async def aclose(self) -> None: ...
+
+
+class MemorySharedCache:
+    """
+    In-process stand-in for the shared tier (``RESPONSE_CACHE_URL=memory://``).
+
+    Implements the same commands as the Redis client, for local development
+    and tests without a Redis server.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[bytes, Optional[float]]] = {}
+
+    def _get(self, key: str) -> Optional[bytes]:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._values[key]
+            return None
+        return value
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._get(key)
+
+    async def set(self, key: str, value: bytes, ex: int) -> bool:
+        self._values[key] = (value, time.monotonic() + ex)
+        return True
+
+    async def mget(self, keys: list[str]) -> list[Optional[bytes]]:
+        return [self._get(key) for key in keys]
+
+    async def incr(self, key: str) -> int:
+        value = int(self._get(key) or 0) + 1
+        self._values[key] = (str(value).encode(), None)
+        return value
+
+    async def aclose(self) -> None:
+        self._values.clear()
+
+
+class ResponseCache:
+    """Two-tier response cache with tag invalidation and request coalescing."""
+
+    def __init__(
+        self,
+        max_entries: int = settings.response_cache_max_entries,
+        default_ttl: float = settings.response_cache_ttl_seconds,
+        shared: Optional[SharedCacheBackend] = None,
+        key_prefix: str = settings.response_cache_key_prefix,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept in process
+            default_ttl: Seconds a response is cached when the route sets no TTL
+            shared: Shared tier, or None for an in-process cache only
+            key_prefix: Prefix of every key written to the shared tier
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.shared = shared
+        self.key_prefix = key_prefix
+        self._entries: OrderedDict[str, tuple[CachedResponse, float]] = OrderedDict()
+        self._tag_versions: dict[str, int] = {}
+        self._inflight: dict[str, asyncio.Task[tuple[CachedResponse, str]]] = {}
+
+    async def get_or_build(
+        self,
+        name: str,
+        params: dict[str, Any],
+        tags: Iterable[str],
+        build: ResponseBuilder,
+        ttl: Optional[float] = None,
+    ) -> Response:
+        """
+        Serve a response from the cache, building and caching it on a miss.
+
+        Concurrent misses on the same key share one ``build`` call. It gets a
+        session opened by the cache rather than the request's: the shared
+        fill outlives a disconnecting client, whose request-scoped session is
+        closed at teardown. Errors raised by ``build`` (e.g. a 404) are not
+        cached.
+
+        Args:
+            name: Name of the cached route
+            params: Parameters the response depends on
+            tags: Tags invalidating the response
+            build: Coroutine function producing the response from a session
+            ttl: Seconds to cache the response (defaults to ``default_ttl``)
+
+        Returns:
+            JSON response, with an ``X-Cache`` header of ``hit``, ``shared-hit`` or ``miss``
+        """
+        tags = sorted(set(tags))
+        versions = await self._get_tag_versions(tags)
+        key = ":".join(
+            [
+                name,
+                json.dumps(params, sort_keys=True, separators=(",", ":"), default=str),
+                ",".join(f"{tag}={version}" for tag, version in zip(tags, versions)),
+            ]
+        )
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry[0].to_response("hit")
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fill(key, build, self.default_ttl if ttl is None else ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so a disconnecting client does not cancel the shared fill
+        cached, cache_status = await asyncio.shield(task)
+        return cached.to_response(cache_status)
+
+    async def _fill(self, key: str, build: ResponseBuilder, ttl: float) -> tuple[CachedResponse, str]:
+        """Look the key up in the shared tier, else build the response; store it in both tiers."""
+        cached = None
+        if self.shared is not None:
+            try:
+                data = await self.shared.get(self.key_prefix + key)
+                if data is not None:
+                    cached = CachedResponse.loads(data)
+            except Exception as exc:
+                logger.warning(f"Shared response cache read failed: {exc}")
+
+        cache_status = "shared-hit"
+        if cached is None:
+            cache_status = "miss"
+            cached = await _build(build)
+            if self.shared is not None:
+                try:
+                    await self.shared.set(self.key_prefix + key, cached.dumps(), ex=max(1, round(ttl)))
+                except Exception as exc:
+                    logger.warning(f"Shared response cache write failed: {exc}")
+
+        self._entries[key] = (cached, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return cached, cache_status
+
+    async def _get_tag_versions(self, tags: list[str]) -> list[int]:
+        if self.shared is not None:
+            try:
+                values = await self.shared.mget([f"{self.key_prefix}tag:{tag}" for tag in tags])
+                return [int(value or 0) for value in values]
+            except Exception as exc:
+                logger.warning(f"Shared response cache read failed: {exc}")
+        return [self._tag_versions.get(tag, 0) for tag in tags]
+
+    async def invalidate(self, *tags: str) -> None:
+        """
+        Invalidate every cached response carrying any of these tags.
+
+        Call this after the write is committed.
+
+        Args:
+            tags: Tags to invalidate
+        """
+        for tag in tags:
+            self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+            if self.shared is not None:
+                try:
+                    await self.shared.incr(f"{self.key_prefix}tag:{tag}")
+                except Exception as exc:
+                    logger.warning(f"Shared response cache invalidation of {tag!r} failed: {exc}")
+
+    def clear(self) -> None:
+        """Drop every response cached in process."""
+        self._entries.clear()
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def _create_shared_backend(url: str) -> Optional[SharedCacheBackend]:
+    """Connect the shared tier named by ``RESPONSE_CACHE_URL``."""
+    if url.startswith("memory://"):
+        return MemorySharedCache()
+    try:
+        import redis.asyncio as redis
+    except ImportError:
+        logger.warning("RESPONSE_CACHE_URL is set but the redis package is not installed; using the local tier only")
+        return None
+    return redis.from_url(
+        url,
+        socket_timeout=settings.response_cache_timeout_seconds,
+        socket_connect_timeout=settings.response_cache_timeout_seconds,
+    )
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Return the process-wide response cache, creating it on first use.
+
+    Returns:
+        Shared ResponseCache
+    """
+    global _response_cache
+    if _response_cache is None:
+        shared = _create_shared_backend(settings.response_cache_url) if settings.response_cache_url else None
+        _response_cache = ResponseCache(shared=shared)
+    return _response_cache
+
+
+async def close_response_cache() -> None:
+    """Close the shared tier connection (called at application shutdown)."""
+    global _response_cache
+    if _response_cache is not None and _response_cache.shared is not None:
+        await _response_cache.shared.aclose()
+    _response_cache = None
+
+
+async def _build(build: ResponseBuilder) -> CachedResponse:
+    """Run a response builder in its own session."""
+    async with AsyncSessionLocal() as session:
+        return await build(session)
+
+
+async def cached_response(
+    name: str,
+    params: dict[str, Any],
+    tags: Iterable[str],
+    build: ResponseBuilder,
+    ttl: Optional[float] = None,
+) -> Response:
+    """
+    Serve a read route through the response cache (see ``ResponseCache.get_or_build``).
+
+    With ``RESPONSE_CACHE_ENABLED=false`` the response is built on every call.
+    """
+    if not settings.response_cache_enabled:
+        return (await _build(build)).to_response("bypass")
+    return await get_response_cache().get_or_build(name, params, tags, build, ttl)
+
+
+async def invalidate_cached_responses(*tags: str) -> None:
+    """Invalidate cached responses by tag (see ``ResponseCache.invalidate``)."""
+    if settings.response_cache_enabled:
+        await get_response_cache().invalidate(*tags)
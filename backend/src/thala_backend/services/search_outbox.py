@@ -0,0 +1,118 @@
+"""Transactional outbox that keeps MeiliSearch in step with database writes."""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..db.session import AsyncSessionLocal
+from ..models.search import SearchOutboxEntry
+from .search_service import get_search_service
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_search_refresh(session: AsyncSession, index_type: str, document_id: str) -> None:
+    """
+    Record that a document needs re-indexing.
+
+    Call this before committing the change itself, so the outbox entry is part
+    of the same transaction. The worker re-reads the row when draining, so the
+    same call covers creates, updates and deletes.
+
+    Args:
+        session: Session holding the pending change
+        index_type: Index type (videos, music, events, communities)
+        document_id: ID of the changed row
+    """
+    if not settings.meilisearch_host:
+        return
+    session.add(SearchOutboxEntry(index_type=index_type, document_id=document_id))
+
+
+class SearchOutboxWorker:
+    """Background task draining the search outbox into MeiliSearch."""
+
+    def __init__(
+        self,
+        poll_interval: float = settings.search_outbox_poll_interval_seconds,
+        batch_size: int = settings.search_outbox_batch_size,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            poll_interval: Seconds to wait when the outbox is empty
+            batch_size: Maximum number of outbox entries handled per drain
+        """
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """Start draining in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                drained = await self.drain_once()
+            except Exception as exc:
+                logger.warning(f"Search outbox drain failed, will retry: {exc}")
+                drained = 0
+
+            # Keep going without pause while there is a backlog
+            if drained < self.batch_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def drain_once(self) -> int:
+        """
+        Push one batch of outbox entries to MeiliSearch.
+
+        Entries are locked with SKIP LOCKED, so several app processes can drain
+        concurrently, and coalesced so a document changed many times is sent
+        once. They are deleted only after MeiliSearch accepted the batch.
+
+        Returns:
+            Number of outbox entries handled
+        """
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(SearchOutboxEntry)
+                .order_by(SearchOutboxEntry.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            entries = result.scalars().all()
+            if not entries:
+                return 0
+
+            pending: dict[str, set[str]] = defaultdict(set)
+            for entry in entries:
+                pending[entry.index_type].add(entry.document_id)
+
+            search_service = get_search_service(session)
+            for index_type, document_ids in pending.items():
+                await search_service.refresh_documents(index_type, document_ids)
+
+            await session.execute(
+                delete(SearchOutboxEntry).where(SearchOutboxEntry.id.in_([entry.id for entry in entries]))
+            )
+            await session.commit()
+
+            return len(entries)
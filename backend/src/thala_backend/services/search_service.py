@@ -1,9 +1,14 @@
 """MeiliSearch integration service for Thala backend."""
-from typing import Any, Dict, List, Optional
+import asyncio
+import importlib.util
+import inspect
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 
 import meilisearch_python_sdk
 from fastapi import HTTPException, status
 from meilisearch_python_sdk import AsyncClient
+from meilisearch_python_sdk.models.search import SearchParams
 from meilisearch_python_sdk.models.settings import MeilisearchSettings
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,6 +17,47 @@ from ..core.config import settings
 from ..models.community import CommunityProfile
 from ..models.event import CulturalEvent
 from ..models.media import MusicTrack, Video
+from ..models.search import SearchSyncWatermark, utcnow
+
+T = TypeVar("T")
+
+# Process-wide client, so searches reuse pooled keep-alive connections instead
+# of paying TCP and TLS setup on every request.
+_client: Optional[AsyncClient] = None
+_client_slots: Optional[asyncio.Semaphore] = None
+
+# Incremental syncs restart this far before the previous sync began, so rows
+# written by transactions that committed during that sync are not skipped.
+_WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def open_search_client() -> AsyncClient:
+    """
+    Return the shared MeiliSearch client, creating it on first use.
+
+    The application lifespan opens it at startup and closes it at shutdown;
+    scripts get it lazily. HTTP/2 is used when the ``h2`` package is installed.
+
+    Returns:
+        Shared AsyncClient instance
+    """
+    global _client, _client_slots
+    if _client is None:
+        _client = AsyncClient(
+            url=settings.meilisearch_host,
+            api_key=settings.meilisearch_api_key,
+            http2=importlib.util.find_spec("h2") is not None,
+        )
+        _client_slots = asyncio.Semaphore(settings.meilisearch_max_concurrency)
+    return _client
+
+
+async def close_search_client() -> None:
+    """Close the shared MeiliSearch client and its connection pool."""
+    global _client, _client_slots
+    if _client is not None:
+        client, _client, _client_slots = _client, None, None
+        await client.aclose()
 
 
 class SearchService:
@@ -32,10 +78,18 @@ class SearchService:
         """
         self.db = db
         self._validate_configuration()
-        self.client = AsyncClient(
-            url=settings.meilisearch_host,
-            api_key=settings.meilisearch_api_key,
-        )
+        self.client = open_search_client()
+        self._slots = _client_slots
+
+    async def _call(self, request: Awaitable[T]) -> T:
+        """Await a MeiliSearch request, bounded by the shared concurrency limit."""
+        try:
+            async with self._slots:
+                return await request
+        finally:
+            # Cancelled while waiting for a slot: discard the unstarted request
+            if inspect.iscoroutine(request):
+                request.close()
 
     def _validate_configuration(self) -> None:
         """
@@ -145,11 +199,13 @@ class SearchService:
             index = self.client.index(index_name)
 
             # Update settings
-            await index.update_settings(
-                MeilisearchSettings(
-                    searchable_attributes=searchable_attributes,
-                    filterable_attributes=filterable_attributes,
-                    sortable_attributes=sortable_attributes,
+            await self._call(
+                index.update_settings(
+                    MeilisearchSettings(
+                        searchable_attributes=searchable_attributes,
+                        filterable_attributes=filterable_attributes,
+                        sortable_attributes=sortable_attributes,
+                    )
                 )
             )
         except Exception as exc:
@@ -178,12 +234,14 @@ class SearchService:
             Search results dict with hits, total, and metadata
         """
         index = self.client.index(self._get_index_name(self.INDEX_VIDEOS))
-        return await index.search(
-            query=query,
-            filter=filters,
-            limit=limit,
-            offset=offset,
-            sort=sort,
+        return await self._call(
+            index.search(
+                query=query,
+                filter=filters,
+                limit=limit,
+                offset=offset,
+                sort=sort,
+            )
         )
 
     async def search_music(
@@ -206,11 +264,13 @@ class SearchService:
             Search results dict
         """
         index = self.client.index(self._get_index_name(self.INDEX_MUSIC))
-        return await index.search(
-            query=query,
-            filter=filters,
-            limit=limit,
-            offset=offset,
+        return await self._call(
+            index.search(
+                query=query,
+                filter=filters,
+                limit=limit,
+                offset=offset,
+            )
         )
 
     async def search_events(
@@ -235,12 +295,14 @@ class SearchService:
             Search results dict
         """
         index = self.client.index(self._get_index_name(self.INDEX_EVENTS))
-        return await index.search(
-            query=query,
-            filter=filters,
-            limit=limit,
-            offset=offset,
-            sort=sort,
+        return await self._call(
+            index.search(
+                query=query,
+                filter=filters,
+                limit=limit,
+                offset=offset,
+                sort=sort,
+            )
         )
 
     async def search_communities(
@@ -263,119 +325,302 @@ class SearchService:
             Search results dict
         """
         index = self.client.index(self._get_index_name(self.INDEX_COMMUNITIES))
-        return await index.search(
-            query=query,
-            filter=filters,
-            limit=limit,
-            offset=offset,
+        return await self._call(
+            index.search(
+                query=query,
+                filter=filters,
+                limit=limit,
+                offset=offset,
+            )
         )
 
-    async def sync_videos(self, batch_size: int = 100) -> int:
+    async def multi_search(self, query: str, limit: int = 20) -> Dict[str, List[str]]:
         """
-        Sync all videos from database to search index.
+        Search videos, music, events and communities in a single request.
 
         Args:
-            batch_size: Number of documents to index per batch
+            query: Search query string
+            limit: Maximum number of results per index
 
         Returns:
-            Number of videos synced
+            Ranked document IDs keyed by index type (videos, music, events, communities)
+        """
+        index_types = [
+            self.INDEX_VIDEOS,
+            self.INDEX_MUSIC,
+            self.INDEX_EVENTS,
+            self.INDEX_COMMUNITIES,
+        ]
+        results = await self._call(
+            self.client.multi_search(
+                [
+                    SearchParams(
+                        index_uid=self._get_index_name(index_type),
+                        query=query,
+                        limit=limit,
+                        attributes_to_retrieve=["id"],
+                    )
+                    for index_type in index_types
+                ]
+            )
+        )
+        return {
+            index_type: [hit["id"] for hit in result.hits]
+            for index_type, result in zip(index_types, results)
+        }
+
+    async def _stream_to_index(
+        self,
+        index_type: str,
+        model: Any,
+        to_doc: Callable[[Any], Dict[str, Any]],
+        batch_size: int,
+        since: Optional[datetime],
+        max_in_flight: int,
+    ) -> int:
         """
-        index = self.client.index(self._get_index_name(self.INDEX_VIDEOS))
+        Stream rows of ``model`` into an index without loading the whole table.
 
-        # Fetch all videos from database
-        stmt = select(Video)
-        result = await self.db.execute(stmt)
-        videos = result.scalars().all()
+        Rows are read through a server-side cursor ``batch_size`` at a time, and
+        up to ``max_in_flight`` ``add_documents`` batches are sent concurrently.
 
-        # Convert to search documents
-        documents = [self._video_to_search_doc(video) for video in videos]
+        Args:
+            index_type: Index type (videos, music, events, communities)
+            model: ORM model to read
+            to_doc: Converter from a model instance to a search document
+            batch_size: Number of rows fetched and documents sent per batch
+            since: Only sync rows changed at or after this watermark
+            max_in_flight: Maximum number of batches awaiting MeiliSearch
 
-        # Add to index in batches
+        Returns:
+            Number of documents synced
+        """
+        index = self.client.index(self._get_index_name(index_type))
+
+        stmt = select(model)
+        if since is not None:
+            stmt = stmt.where(model.updated_at >= since)
+
+        result = await self.db.stream(stmt.execution_options(yield_per=batch_size))
+
+        in_flight: set[asyncio.Task[Any]] = set()
         total_synced = 0
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            await index.add_documents(batch)
-            total_synced += len(batch)
+        try:
+            async for rows in result.scalars().partitions():
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+
+                documents = [to_doc(row) for row in rows]
+                in_flight.add(asyncio.create_task(self._call(index.add_documents(documents))))
+                total_synced += len(documents)
+
+            await asyncio.gather(*in_flight)
+        except BaseException:
+            for task in in_flight:
+                task.cancel()
+            raise
+        finally:
+            await result.close()
 
         return total_synced
 
-    async def sync_music(self, batch_size: int = 100) -> int:
+    async def sync_videos(
+        self,
+        batch_size: int = 500,
+        since: Optional[datetime] = None,
+        max_in_flight: int = 4,
+    ) -> int:
+        """
+        Sync videos from database to search index.
+
+        Args:
+            batch_size: Number of documents to index per batch
+            since: Incremental mode: only sync videos updated at or after this time
+            max_in_flight: Maximum number of batches sent concurrently
+
+        Returns:
+            Number of videos synced
+        """
+        return await self._stream_to_index(
+            self.INDEX_VIDEOS, Video, self._video_to_search_doc, batch_size, since, max_in_flight
+        )
+
+    async def sync_music(
+        self,
+        batch_size: int = 500,
+        since: Optional[datetime] = None,
+        max_in_flight: int = 4,
+    ) -> int:
         """
-        Sync all music tracks from database to search index.
+        Sync music tracks from database to search index.
 
         Args:
             batch_size: Number of documents to index per batch
+            since: Incremental mode: only sync tracks updated at or after this time
+            max_in_flight: Maximum number of batches sent concurrently
 
         Returns:
             Number of tracks synced
         """
-        index = self.client.index(self._get_index_name(self.INDEX_MUSIC))
+        return await self._stream_to_index(
+            self.INDEX_MUSIC, MusicTrack, self._music_to_search_doc, batch_size, since, max_in_flight
+        )
 
-        stmt = select(MusicTrack)
-        result = await self.db.execute(stmt)
-        tracks = result.scalars().all()
+    async def sync_events(
+        self,
+        batch_size: int = 500,
+        since: Optional[datetime] = None,
+        max_in_flight: int = 4,
+    ) -> int:
+        """
+        Sync cultural events from database to search index.
 
-        documents = [self._music_to_search_doc(track) for track in tracks]
+        Args:
+            batch_size: Number of documents to index per batch
+            since: Incremental mode: only sync events updated at or after this time
+            max_in_flight: Maximum number of batches sent concurrently
 
-        total_synced = 0
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            await index.add_documents(batch)
-            total_synced += len(batch)
+        Returns:
+            Number of events synced
+        """
+        return await self._stream_to_index(
+            self.INDEX_EVENTS, CulturalEvent, self._event_to_search_doc, batch_size, since, max_in_flight
+        )
 
-        return total_synced
+    async def sync_communities(
+        self,
+        batch_size: int = 500,
+        since: Optional[datetime] = None,
+        max_in_flight: int = 4,
+    ) -> int:
+        """
+        Sync community profiles from database to search index.
+
+        Args:
+            batch_size: Number of documents to index per batch
+            since: Incremental mode: only sync communities updated at or after this time
+            max_in_flight: Maximum number of batches sent concurrently
+
+        Returns:
+            Number of communities synced
+        """
+        return await self._stream_to_index(
+            self.INDEX_COMMUNITIES,
+            CommunityProfile,
+            self._community_to_search_doc,
+            batch_size,
+            since,
+            max_in_flight,
+        )
 
-    async def sync_events(self, batch_size: int = 100) -> int:
+    async def sync_index(
+        self,
+        index_type: str,
+        full: bool = False,
+        batch_size: int = 500,
+        max_in_flight: int = 4,
+    ) -> int:
         """
-        Sync all cultural events from database to search index.
+        Sync an index from the database, incrementally when possible.
+
+        Without ``full``, only rows updated since the stored watermark of the
+        index are sent. A full sync (or the first sync of an index) re-sends
+        every row and deletes documents whose row no longer exists. The
+        watermark is committed once the sync has finished.
 
         Args:
+            index_type: Index type (videos, music, events, communities)
+            full: Re-send every row and prune deleted ones
             batch_size: Number of documents to index per batch
+            max_in_flight: Maximum number of batches sent concurrently
 
         Returns:
-            Number of events synced
+            Number of documents synced
         """
-        index = self.client.index(self._get_index_name(self.INDEX_EVENTS))
+        model, to_doc = self._index_sources()[index_type]
+        started = utcnow() - _WATERMARK_OVERLAP
 
-        stmt = select(CulturalEvent)
-        result = await self.db.execute(stmt)
-        events = result.scalars().all()
+        watermark = await self.db.get(SearchSyncWatermark, index_type)
+        since = None if full or watermark is None else watermark.synced_at
 
-        documents = [self._event_to_search_doc(event) for event in events]
+        total_synced = await self._stream_to_index(index_type, model, to_doc, batch_size, since, max_in_flight)
+        if since is None:
+            await self.prune_index(index_type)
 
-        total_synced = 0
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            await index.add_documents(batch)
-            total_synced += len(batch)
+        if watermark is None:
+            self.db.add(SearchSyncWatermark(index_type=index_type, synced_at=started))
+        else:
+            watermark.synced_at = started
+        await self.db.commit()
 
         return total_synced
 
-    async def sync_communities(self, batch_size: int = 100) -> int:
+    async def prune_index(self, index_type: str, batch_size: int = 1000) -> int:
         """
-        Sync all community profiles from database to search index.
+        Delete documents whose database row no longer exists.
 
         Args:
-            batch_size: Number of documents to index per batch
+            index_type: Index type (videos, music, events, communities)
+            batch_size: Number of document IDs read from the index per page
 
         Returns:
-            Number of communities synced
+            Number of documents deleted
         """
-        index = self.client.index(self._get_index_name(self.INDEX_COMMUNITIES))
+        model, _ = self._index_sources()[index_type]
+        index = self.client.index(self._get_index_name(index_type))
 
-        stmt = select(CommunityProfile)
-        result = await self.db.execute(stmt)
-        communities = result.scalars().all()
+        stale: list[str] = []
+        offset = 0
+        while True:
+            page = await self._call(index.get_documents(offset=offset, limit=batch_size, fields=["id"]))
+            ids = [document["id"] for document in page.results]
+            if not ids:
+                break
+            result = await self.db.execute(select(model.id).where(model.id.in_(ids)))
+            stale.extend(set(ids) - set(result.scalars().all()))
+            offset += len(ids)
 
-        documents = [self._community_to_search_doc(community) for community in communities]
+        # Deleting while paging would shift the offsets, so delete afterwards
+        for start in range(0, len(stale), batch_size):
+            await self._call(index.delete_documents(stale[start:start + batch_size]))
 
-        total_synced = 0
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            await index.add_documents(batch)
-            total_synced += len(batch)
+        return len(stale)
 
-        return total_synced
+    async def refresh_documents(self, index_type: str, document_ids: Iterable[str]) -> None:
+        """
+        Bring documents in an index in line with their current database rows.
+
+        Rows that still exist are re-indexed; IDs with no row left are deleted
+        from the index.
+
+        Args:
+            index_type: Index type (videos, music, events, communities)
+            document_ids: IDs of the documents to refresh
+        """
+        model, to_doc = self._index_sources()[index_type]
+        ids = set(document_ids)
+
+        result = await self.db.execute(select(model).where(model.id.in_(ids)))
+        rows = result.scalars().all()
+
+        index = self.client.index(self._get_index_name(index_type))
+        if rows:
+            await self._call(index.add_documents([to_doc(row) for row in rows]))
+
+        missing = ids - {row.id for row in rows}
+        if missing:
+            await self._call(index.delete_documents(sorted(missing)))
+
+    def _index_sources(self) -> Dict[str, Tuple[Any, Callable[[Any], Dict[str, Any]]]]:
+        """Map each index type to its ORM model and document converter."""
+        return {
+            self.INDEX_VIDEOS: (Video, self._video_to_search_doc),
+            self.INDEX_MUSIC: (MusicTrack, self._music_to_search_doc),
+            self.INDEX_EVENTS: (CulturalEvent, self._event_to_search_doc),
+            self.INDEX_COMMUNITIES: (CommunityProfile, self._community_to_search_doc),
+        }
 
     async def index_video(self, video: Video) -> None:
         """
@@ -386,7 +631,7 @@ class SearchService:
         """
         index = self.client.index(self._get_index_name(self.INDEX_VIDEOS))
         doc = self._video_to_search_doc(video)
-        await index.add_documents([doc])
+        await self._call(index.add_documents([doc]))
 
     async def delete_video(self, video_id: str) -> None:
         """
@@ -396,7 +641,7 @@ class SearchService:
             video_id: Video ID to delete
         """
         index = self.client.index(self._get_index_name(self.INDEX_VIDEOS))
-        await index.delete_document(video_id)
+        await self._call(index.delete_document(video_id))
 
     def _video_to_search_doc(self, video: Video) -> Dict[str, Any]:
         """
@@ -1,13 +1,123 @@
 """S3 storage service for Thala backend."""
+import asyncio
+import hashlib
+import logging
 import mimetypes
+import os
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import timedelta
-from typing import BinaryIO, Optional
+from typing import Any, BinaryIO, Iterable, Optional
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from fastapi import HTTPException, UploadFile, status
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.config import settings
+from ..db.session import AsyncSessionLocal
+from ..models.upload import ImageVariantSet, MediaBlob
+from .presigned_urls import get_presigned_url_cache
+
+logger = logging.getLogger(__name__)
+
+# Process-wide S3 client: one aiohttp connection pool reused by every request
+# instead of a new session, client and handshake per call.
+_s3_client: Any = None
+_s3_client_stack: Optional[AsyncExitStack] = None
+_s3_client_lock = asyncio.Lock()
+
+
+async def open_storage_client() -> Any:
+    """
+    Return the shared S3 client, creating it on first use.
+
+    The application lifespan opens it at startup and closes it at shutdown;
+    scripts get it lazily.
+
+    Returns:
+        Shared aiobotocore S3 client
+    """
+    global _s3_client, _s3_client_stack
+    async with _s3_client_lock:
+        if _s3_client is None:
+            session = aioboto3.Session(
+                aws_access_key_id=settings.aws_access_key_id,
+                aws_secret_access_key=settings.aws_secret_access_key,
+                region_name=settings.aws_region,
+            )
+            stack = AsyncExitStack()
+            _s3_client = await stack.enter_async_context(
+                session.client(
+                    "s3",
+                    endpoint_url=settings.s3_endpoint_url,
+                    config=AioConfig(
+                        max_pool_connections=settings.s3_max_pool_connections,
+                        tcp_keepalive=True,
+                        signature_version="s3v4",
+                    ),
+                )
+            )
+            _s3_client_stack = stack
+    return _s3_client
+
+
+async def close_storage_client() -> None:
+    """Close the shared S3 client and its connection pool."""
+    global _s3_client, _s3_client_stack
+    async with _s3_client_lock:
+        if _s3_client_stack is not None:
+            stack, _s3_client, _s3_client_stack = _s3_client_stack, None, None
+            await stack.aclose()
+
+
+def public_url(object_key: str) -> str:
+    """
+    Get the public URL for an S3 object (if bucket is public).
+
+    Args:
+        object_key: S3 object key (path)
+
+    Returns:
+        Public URL string
+    """
+    if settings.s3_endpoint_url:
+        # Custom S3-compatible endpoint
+        return f"{settings.s3_endpoint_url}/{settings.aws_s3_bucket}/{object_key}"
+    else:
+        # Standard AWS S3 URL
+        return f"https://{settings.aws_s3_bucket}.s3.{settings.aws_region}.amazonaws.com/{object_key}"
+
+
+def object_key_from_url(url: str | None) -> str | None:
+    """
+    Get the S3 object key behind a public URL of our bucket.
+
+    Args:
+        url: Public URL, possibly of another host
+
+    Returns:
+        Object key, or None if the URL does not point into the bucket
+    """
+    if not url or not settings.aws_s3_bucket:
+        return None
+    prefix = public_url("")
+    if not url.startswith(prefix):
+        return None
+    return url[len(prefix):].split("?", 1)[0] or None
+
+
+def variant_prefix(object_key: str) -> str:
+    """
+    Key prefix of the resized derivatives of an image.
+
+    For example ``images/u1/photo.jpg`` has its derivatives under
+    ``variants/images/u1/photo``.
+    """
+    return f"variants/{os.path.splitext(object_key)[0]}"
 
 
 class StorageService:
@@ -39,14 +149,17 @@ class StorageService:
         "audio/aac",
     }
 
+    # Types mimetypes does not know (or gets wrong) for processed media
+    CONTENT_TYPES_BY_EXTENSION = {
+        ".m3u8": "application/vnd.apple.mpegurl",
+        ".ts": "video/mp2t",
+        ".m4a": "audio/mp4",
+        ".opus": "audio/ogg",
+    }
+
     def __init__(self):
         """Initialize the storage service."""
         self._validate_configuration()
-        self.session = aioboto3.Session(
-            aws_access_key_id=settings.aws_access_key_id,
-            aws_secret_access_key=settings.aws_secret_access_key,
-            region_name=settings.aws_region,
-        )
 
     def _validate_configuration(self) -> None:
         """
@@ -74,15 +187,28 @@ class StorageService:
         folder: str,
         allowed_types: set[str] | None = None,
         max_size_mb: int | None = None,
+        deduplicate: bool = True,
+        session: AsyncSession | None = None,
     ) -> str:
         """
         Upload a file to S3 storage.
 
+        The content is hashed while it streams. With ``deduplicate``, a file
+        whose SHA-256 matches one already stored in the same folder resolves
+        to the existing object (see ``media_blobs``): files that fit in one
+        part are then not uploaded at all, larger ones are uploaded and the
+        copy dropped. Folders are per user, so objects are never shared
+        between owners.
+
         Args:
             file: FastAPI UploadFile instance
             folder: Folder path in S3 bucket (e.g., "videos", "images/avatars")
             allowed_types: Set of allowed MIME types (None allows all)
             max_size_mb: Maximum file size in MB (None for no limit)
+            deduplicate: Reuse the stored object of identical content
+            session: Session of the request the upload belongs to; the
+                reference on the stored object is then only taken if the
+                caller commits it. Without one it is committed right away.
 
         Returns:
             S3 object key (path) of the uploaded file
@@ -97,44 +223,271 @@ class StorageService:
                 detail=f"Unsupported file type: {file.content_type}. Allowed types: {allowed_types}",
             )
 
-        # Read file content
-        content = await file.read()
+        max_size_bytes = max_size_mb * 1024 * 1024 if max_size_mb else None
 
-        # Validate file size
-        if max_size_mb:
-            max_size_bytes = max_size_mb * 1024 * 1024
-            if len(content) > max_size_bytes:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"File size exceeds maximum of {max_size_mb}MB",
-                )
+        # Reject early when the declared size is already too large
+        if max_size_bytes and file.size is not None and file.size > max_size_bytes:
+            raise self._size_exceeded(max_size_mb)
 
         # Generate unique filename
         file_extension = self._get_file_extension(file.filename, file.content_type)
         unique_filename = f"{uuid.uuid4()}{file_extension}"
         object_key = f"{folder.strip('/')}/{unique_filename}"
 
-        # Upload to S3
-        try:
-            async with self.session.client(
-                "s3", endpoint_url=settings.s3_endpoint_url
-            ) as s3_client:
+        content_type = file.content_type or "application/octet-stream"
+        metadata = {
+            "original-filename": file.filename or "unknown",
+        }
+        part_size = settings.s3_multipart_part_size_mb * 1024 * 1024
+
+        first_part = await file.read(part_size)
+        if max_size_bytes and len(first_part) > max_size_bytes:
+            raise self._size_exceeded(max_size_mb)
+
+        digest = hashlib.sha256()
+
+        if len(first_part) == part_size:
+            # Larger than one part: stream the rest through a multipart upload
+            size_bytes = await self._upload_multipart(
+                file, object_key, content_type, metadata, first_part, part_size, max_size_mb, digest
+            )
+        else:
+            digest.update(first_part)
+            size_bytes = len(first_part)
+            if deduplicate:
+                existing_key = await self._reuse_blob(digest.hexdigest(), folder, session)
+                if existing_key:
+                    return existing_key
+
+            # Upload to S3
+            try:
+                s3_client = await open_storage_client()
                 await s3_client.put_object(
                     Bucket=settings.aws_s3_bucket,
                     Key=object_key,
-                    Body=content,
-                    ContentType=file.content_type or "application/octet-stream",
-                    Metadata={
-                        "original-filename": file.filename or "unknown",
-                    },
+                    Body=first_part,
+                    ContentType=content_type,
+                    Metadata=metadata,
                 )
+            except Exception as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"Failed to upload file: {str(exc)}",
+                ) from exc
+
+        if not deduplicate:
+            return object_key
+        return await self._register_blob(
+            digest.hexdigest(), folder, object_key, size_bytes, content_type, session
+        )
+
+    @asynccontextmanager
+    async def _blob_session(self, session: AsyncSession | None) -> AsyncIterator[AsyncSession]:
+        """Use the caller's session (which the caller commits), or a session committed here."""
+        if session is not None:
+            yield session
+            return
+        async with AsyncSessionLocal() as own_session:
+            yield own_session
+            await own_session.commit()
+
+    async def _reuse_blob(self, sha256: str, folder: str, session: AsyncSession | None = None) -> str | None:
+        """
+        Take a reference on the object stored in a folder with this content, if any.
+
+        Args:
+            sha256: Hex SHA-256 of the content
+            folder: Upload folder the content is being uploaded to
+            session: Session to take the reference in, committed by the caller
+
+        Returns:
+            S3 object key of the existing object, or None
+        """
+        async with self._blob_session(session) as blob_session:
+            result = await blob_session.execute(
+                update(MediaBlob)
+                .where(MediaBlob.folder == folder.strip("/"), MediaBlob.sha256 == sha256)
+                .values(ref_count=MediaBlob.ref_count + 1)
+                .returning(MediaBlob.object_key)
+            )
+            existing_key = result.scalar_one_or_none()
+
+        if existing_key:
+            logger.info(f"Upload deduplicated to existing object {existing_key}")
+        return existing_key
+
+    async def _register_blob(
+        self,
+        sha256: str,
+        folder: str,
+        object_key: str,
+        size_bytes: int,
+        content_type: str,
+        session: AsyncSession | None = None,
+    ) -> str:
+        """
+        Record a freshly uploaded object, or resolve it to an identical one.
+
+        Concurrent uploads of the same content to a folder race on the
+        ``(folder, sha256)`` key: whichever registers first is kept and the
+        others' copies are deleted.
+
+        Args:
+            sha256: Hex SHA-256 of the content
+            folder: Upload folder the content was uploaded to
+            object_key: S3 object key the content was uploaded to
+            size_bytes: Content size in bytes
+            content_type: MIME type of the content
+            session: Session to record the reference in, committed by the caller
+
+        Returns:
+            S3 object key to use for the content
+        """
+        stmt = insert(MediaBlob).values(
+            folder=folder.strip("/"),
+            sha256=sha256,
+            object_key=object_key,
+            size_bytes=size_bytes,
+            content_type=content_type,
+            ref_count=1,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MediaBlob.folder, MediaBlob.sha256],
+            set_={"ref_count": MediaBlob.ref_count + 1},
+        ).returning(MediaBlob.object_key)
+
+        async with self._blob_session(session) as blob_session:
+            result = await blob_session.execute(stmt)
+            stored_key = result.scalar_one()
+
+        if stored_key != object_key:
+            logger.info(f"Upload deduplicated to existing object {stored_key}")
+            try:
+                s3_client = await open_storage_client()
+                await s3_client.delete_object(Bucket=settings.aws_s3_bucket, Key=object_key)
+            except Exception as exc:
+                logger.warning(f"Failed to delete duplicate object {object_key}: {exc}")
+        return stored_key
+
+    async def _upload_multipart(
+        self,
+        file: UploadFile,
+        object_key: str,
+        content_type: str,
+        metadata: dict[str, str],
+        first_part: bytes,
+        part_size: int,
+        max_size_mb: int | None,
+        digest: Any,
+    ) -> int:
+        """
+        Stream a file to S3 as a multipart upload, part by part.
+
+        Parts are read as they are needed and up to ``s3_multipart_concurrency``
+        of them are uploaded concurrently, so memory stays bounded by a few
+        parts whatever the file size. The upload is aborted as soon as the size
+        limit is crossed or any part fails.
+
+        Args:
+            file: FastAPI UploadFile instance, positioned after ``first_part``
+            object_key: S3 object key to upload to
+            content_type: MIME type stored on the object
+            metadata: S3 object metadata
+            first_part: First part, already read from ``file``
+            part_size: Size of each part in bytes
+            max_size_mb: Maximum file size in MB (None for no limit)
+            digest: hashlib hash object fed every part, in order
+
+        Returns:
+            Total size of the file in bytes
+
+        Raises:
+            HTTPException: If the file is too large or the upload fails
+        """
+        max_size_bytes = max_size_mb * 1024 * 1024 if max_size_mb else None
+
+        try:
+            s3_client = await open_storage_client()
+            upload = await s3_client.create_multipart_upload(
+                Bucket=settings.aws_s3_bucket,
+                Key=object_key,
+                ContentType=content_type,
+                Metadata=metadata,
+            )
         except Exception as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to upload file: {str(exc)}",
             ) from exc
+        upload_id = upload["UploadId"]
+
+        parts: list[dict[str, Any]] = []
+
+        async def upload_part(part_number: int, body: bytes) -> None:
+            response = await s3_client.upload_part(
+                Bucket=settings.aws_s3_bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+
+        in_flight: set[asyncio.Task[None]] = set()
+        try:
+            chunk = first_part
+            part_number = 1
+            total_size = 0
+            while chunk:
+                total_size += len(chunk)
+                if max_size_bytes and total_size > max_size_bytes:
+                    raise self._size_exceeded(max_size_mb)
+
+                if len(in_flight) >= settings.s3_multipart_concurrency:
+                    done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+
+                in_flight.add(asyncio.create_task(upload_part(part_number, chunk)))
+                # hashlib releases the GIL on large buffers
+                await asyncio.to_thread(digest.update, chunk)
+                part_number += 1
+                chunk = await file.read(part_size)
+
+            await asyncio.gather(*in_flight)
+            await s3_client.complete_multipart_upload(
+                Bucket=settings.aws_s3_bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": sorted(parts, key=lambda part: part["PartNumber"])},
+            )
+            return total_size
+        except BaseException as exc:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            try:
+                await s3_client.abort_multipart_upload(
+                    Bucket=settings.aws_s3_bucket,
+                    Key=object_key,
+                    UploadId=upload_id,
+                )
+            except Exception as abort_exc:
+                logger.warning(f"Failed to abort multipart upload {upload_id}: {abort_exc}")
+
+            if isinstance(exc, HTTPException) or not isinstance(exc, Exception):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to upload file: {str(exc)}",
+            ) from exc
 
-        return object_key
+    def _size_exceeded(self, max_size_mb: int | None) -> HTTPException:
+        """Build the error raised when an upload is over its size limit."""
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File size exceeds maximum of {max_size_mb}MB",
+        )
 
     async def upload_video(self, file: UploadFile, max_size_mb: int = 500) -> str:
         """
@@ -199,12 +552,75 @@ class StorageService:
             max_size_mb=max_size_mb,
         )
 
+    async def upload_directory(self, local_dir: str, prefix: str, max_concurrency: int = 8) -> list[str]:
+        """
+        Upload every file under a local directory, keeping relative paths.
+
+        Args:
+            local_dir: Directory to upload
+            prefix: Key prefix the relative paths are appended to
+            max_concurrency: Maximum number of files uploaded at once
+
+        Returns:
+            S3 object keys of the uploaded files
+
+        Raises:
+            HTTPException: If any upload fails
+        """
+        paths = [
+            os.path.join(root, name)
+            for root, _, names in os.walk(local_dir)
+            for name in names
+        ]
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def upload(path: str) -> str:
+            object_key = f"{prefix.strip('/')}/{os.path.relpath(path, local_dir).replace(os.sep, '/')}"
+            async with slots:
+                with open(path, "rb") as f:
+                    body = f.read()
+                s3_client = await open_storage_client()
+                await s3_client.put_object(
+                    Bucket=settings.aws_s3_bucket,
+                    Key=object_key,
+                    Body=body,
+                    ContentType=self._get_content_type(path),
+                )
+            return object_key
+
+        try:
+            return list(await asyncio.gather(*(upload(path) for path in paths)))
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to upload file: {str(exc)}",
+            ) from exc
+
+    def _get_content_type(self, path: str) -> str:
+        """
+        Determine the content type of a local file from its name.
+
+        Args:
+            path: Local file path
+
+        Returns:
+            MIME type (e.g., "video/mp2t")
+        """
+        return (
+            self.CONTENT_TYPES_BY_EXTENSION.get(os.path.splitext(path)[1].lower())
+            or mimetypes.guess_type(path)[0]
+            or "application/octet-stream"
+        )
+
     async def generate_presigned_url(
         self, object_key: str, expiration_minutes: int = 60
     ) -> str:
         """
         Generate a presigned URL for downloading a file from S3.
 
+        URLs are signed locally and cached: the same URL is handed out until
+        a safety margin before it expires (see ``PresignedURLCache``).
+
         Args:
             object_key: S3 object key (path)
             expiration_minutes: URL expiration time in minutes (default: 60)
@@ -212,31 +628,293 @@ class StorageService:
         Returns:
             Presigned URL string
 
+        Raises:
+            HTTPException: If URL generation fails
+        """
+        urls = await self.generate_presigned_urls([object_key], expiration_minutes)
+        return urls[object_key]
+
+    async def generate_presigned_urls(
+        self, object_keys: Iterable[str], expiration_minutes: int = 60
+    ) -> dict[str, str]:
+        """
+        Generate presigned download URLs for many files at once.
+
+        Meant for pages presigning every item: each URL is a cache lookup or a
+        local signature, with no request or client setup per URL.
+
+        Args:
+            object_keys: S3 object keys (paths)
+            expiration_minutes: URL expiration time in minutes (default: 60)
+
+        Returns:
+            Presigned URL keyed by object key
+
+        Raises:
+            HTTPException: If URL generation fails
+        """
+        try:
+            cache = get_presigned_url_cache()
+            return {
+                object_key: cache.get(object_key, expiration_minutes * 60)
+                for object_key in object_keys
+            }
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to generate presigned URL: {str(exc)}",
+            ) from exc
+
+    async def generate_presigned_post(
+        self,
+        object_key: str,
+        content_type: str,
+        max_size_mb: int,
+        expiration_minutes: int = 60,
+    ) -> dict[str, Any]:
+        """
+        Generate a presigned POST for uploading a file straight to S3.
+
+        The policy pins the key and content type and enforces the size limit,
+        so S3 itself rejects anything else.
+
+        Args:
+            object_key: S3 object key (path) to upload to
+            content_type: MIME type the client must send
+            max_size_mb: Maximum file size in MB
+            expiration_minutes: Policy expiration time in minutes (default: 60)
+
+        Returns:
+            Dict with the form ``url`` and the ``fields`` to post along with the file
+
+        Raises:
+            HTTPException: If generation fails
+        """
+        try:
+            s3_client = await open_storage_client()
+            return await s3_client.generate_presigned_post(
+                settings.aws_s3_bucket,
+                object_key,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, max_size_mb * 1024 * 1024],
+                ],
+                ExpiresIn=expiration_minutes * 60,
+            )
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to generate presigned POST: {str(exc)}",
+            ) from exc
+
+    async def generate_presigned_put_url(
+        self,
+        object_key: str,
+        content_type: str,
+        size_bytes: int,
+        expiration_minutes: int = 60,
+    ) -> str:
+        """
+        Generate a presigned URL for uploading a file straight to S3 with PUT.
+
+        Content type and length are part of the signature, so the client must
+        send exactly the declared size.
+
+        Args:
+            object_key: S3 object key (path) to upload to
+            content_type: MIME type the client must send
+            size_bytes: Exact file size in bytes
+            expiration_minutes: URL expiration time in minutes (default: 60)
+
+        Returns:
+            Presigned URL string
+
+        Raises:
+            HTTPException: If URL generation fails
+        """
+        try:
+            s3_client = await open_storage_client()
+            return await s3_client.generate_presigned_url(
+                "put_object",
+                Params={
+                    "Bucket": settings.aws_s3_bucket,
+                    "Key": object_key,
+                    "ContentType": content_type,
+                    "ContentLength": size_bytes,
+                },
+                ExpiresIn=expiration_minutes * 60,
+            )
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to generate presigned URL: {str(exc)}",
+            ) from exc
+
+    async def create_multipart_upload(self, object_key: str, content_type: str) -> str:
+        """
+        Start a multipart upload whose parts the client sends straight to S3.
+
+        Args:
+            object_key: S3 object key (path) to upload to
+            content_type: MIME type stored on the object
+
+        Returns:
+            S3 multipart upload ID
+
+        Raises:
+            HTTPException: If the upload cannot be started
+        """
+        try:
+            s3_client = await open_storage_client()
+            upload = await s3_client.create_multipart_upload(
+                Bucket=settings.aws_s3_bucket,
+                Key=object_key,
+                ContentType=content_type,
+            )
+            return upload["UploadId"]
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to start multipart upload: {str(exc)}",
+            ) from exc
+
+    async def generate_presigned_part_urls(
+        self,
+        object_key: str,
+        upload_id: str,
+        part_numbers: Iterable[int],
+        expiration_minutes: int = 60,
+    ) -> dict[int, str]:
+        """
+        Generate presigned PUT URLs for parts of a multipart upload.
+
+        Signing is local, so this makes no request to S3.
+
+        Args:
+            object_key: S3 object key (path) of the upload
+            upload_id: S3 multipart upload ID
+            part_numbers: Part numbers to sign (1-based)
+            expiration_minutes: URL expiration time in minutes (default: 60)
+
+        Returns:
+            Presigned URL keyed by part number
+
         Raises:
             HTTPException: If URL generation fails
         """
         try:
-            async with self.session.client(
-                "s3", endpoint_url=settings.s3_endpoint_url
-            ) as s3_client:
-                url = await s3_client.generate_presigned_url(
-                    "get_object",
-                    Params={
-                        "Bucket": settings.aws_s3_bucket,
-                        "Key": object_key,
-                    },
-                    ExpiresIn=expiration_minutes * 60,
+            signer = get_presigned_url_cache().signer
+            return {
+                part_number: signer.sign(
+                    object_key,
+                    expiration_minutes * 60,
+                    method="PUT",
+                    params={"partNumber": str(part_number), "uploadId": upload_id},
                 )
-                return url
+                for part_number in part_numbers
+            }
         except Exception as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to generate presigned URL: {str(exc)}",
             ) from exc
 
+    async def upload_part(self, object_key: str, upload_id: str, part_number: int, body: bytes) -> str:
+        """
+        Upload one part of a multipart upload.
+
+        Args:
+            object_key: S3 object key (path) of the upload
+            upload_id: S3 multipart upload ID
+            part_number: 1-based part number
+            body: Part content
+
+        Returns:
+            ETag of the uploaded part
+
+        Raises:
+            HTTPException: If the upload fails
+        """
+        try:
+            s3_client = await open_storage_client()
+            response = await s3_client.upload_part(
+                Bucket=settings.aws_s3_bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            return response["ETag"]
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to upload part: {str(exc)}",
+            ) from exc
+
+    async def complete_multipart_upload(
+        self, object_key: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        """
+        Assemble the uploaded parts of a multipart upload into the final object.
+
+        Args:
+            object_key: S3 object key (path) of the upload
+            upload_id: S3 multipart upload ID
+            parts: (part number, ETag) of every uploaded part
+
+        Raises:
+            HTTPException: If S3 rejects the parts
+        """
+        try:
+            s3_client = await open_storage_client()
+            await s3_client.complete_multipart_upload(
+                Bucket=settings.aws_s3_bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    "Parts": [
+                        {"PartNumber": part_number, "ETag": etag}
+                        for part_number, etag in sorted(parts)
+                    ]
+                },
+            )
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to complete multipart upload: {str(exc)}",
+            ) from exc
+
+    async def abort_multipart_upload(self, object_key: str, upload_id: str) -> None:
+        """
+        Abort a multipart upload and discard its uploaded parts.
+
+        Args:
+            object_key: S3 object key (path) of the upload
+            upload_id: S3 multipart upload ID
+
+        Raises:
+            HTTPException: If the abort fails
+        """
+        try:
+            s3_client = await open_storage_client()
+            await s3_client.abort_multipart_upload(
+                Bucket=settings.aws_s3_bucket,
+                Key=object_key,
+                UploadId=upload_id,
+            )
+        except Exception as exc:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to abort multipart upload: {str(exc)}",
+            ) from exc
+
     async def delete_file(self, object_key: str) -> None:
         """
-        Delete a file from S3 storage.
+        Delete a file from S3 storage, along with its image derivatives.
+
+        Deduplicated objects are shared: this drops one reference and only
+        deletes the object once no upload refers to it anymore.
 
         Args:
             object_key: S3 object key (path) to delete
@@ -244,14 +922,35 @@ class StorageService:
         Raises:
             HTTPException: If deletion fails
         """
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                update(MediaBlob)
+                .where(MediaBlob.object_key == object_key)
+                .values(ref_count=MediaBlob.ref_count - 1)
+                .returning(MediaBlob.ref_count)
+            )
+            ref_count = result.scalar_one_or_none()
+            if ref_count is None or ref_count <= 0:
+                # Still holding the row lock, so no upload took a new reference
+                await session.execute(delete(MediaBlob).where(MediaBlob.object_key == object_key))
+                await session.execute(delete(ImageVariantSet).where(ImageVariantSet.object_key == object_key))
+            await session.commit()
+
+        if ref_count is not None and ref_count > 0:
+            logger.info(f"Kept shared object {object_key} ({ref_count} references left)")
+            return
+
         try:
-            async with self.session.client(
-                "s3", endpoint_url=settings.s3_endpoint_url
-            ) as s3_client:
-                await s3_client.delete_object(
-                    Bucket=settings.aws_s3_bucket,
-                    Key=object_key,
-                )
+            s3_client = await open_storage_client()
+            listing = await s3_client.list_objects_v2(
+                Bucket=settings.aws_s3_bucket,
+                Prefix=f"{variant_prefix(object_key)}/",
+            )
+            keys = [object_key, *(item["Key"] for item in listing.get("Contents", []))]
+            await s3_client.delete_objects(
+                Bucket=settings.aws_s3_bucket,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
         except Exception as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -269,17 +968,38 @@ class StorageService:
             True if file exists, False otherwise
         """
         try:
-            async with self.session.client(
-                "s3", endpoint_url=settings.s3_endpoint_url
-            ) as s3_client:
-                await s3_client.head_object(
-                    Bucket=settings.aws_s3_bucket,
-                    Key=object_key,
-                )
-                return True
+            s3_client = await open_storage_client()
+            await s3_client.head_object(
+                Bucket=settings.aws_s3_bucket,
+                Key=object_key,
+            )
+            return True
         except Exception:
             return False
 
+    async def get_file_metadata(self, object_key: str) -> dict[str, Any] | None:
+        """
+        Read the size and content type S3 recorded for a file.
+
+        Args:
+            object_key: S3 object key (path) to inspect
+
+        Returns:
+            Dict with content_length and content_type, or None if the file does not exist
+        """
+        try:
+            s3_client = await open_storage_client()
+            response = await s3_client.head_object(
+                Bucket=settings.aws_s3_bucket,
+                Key=object_key,
+            )
+        except Exception:
+            return None
+        return {
+            "content_length": response.get("ContentLength"),
+            "content_type": response.get("ContentType"),
+        }
+
     def _get_file_extension(self, filename: str | None, content_type: str | None) -> str:
         """
         Determine file extension from filename or content type.
@@ -314,12 +1034,7 @@ class StorageService:
         Returns:
             Public URL string
         """
-        if settings.s3_endpoint_url:
-            # Custom S3-compatible endpoint
-            return f"{settings.s3_endpoint_url}/{settings.aws_s3_bucket}/{object_key}"
-        else:
-            # Standard AWS S3 URL
-            return f"https://{settings.aws_s3_bucket}.s3.{settings.aws_region}.amazonaws.com/{object_key}"
+        return public_url(object_key)
 
 
 def get_storage_service() -> StorageService:
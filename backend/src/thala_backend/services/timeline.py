@@ -0,0 +1,277 @@
+"""Materialized "following" timelines, filled by fan-out on write.
+
+When a video is created, a fan-out job is queued in the same transaction; a
+background worker copies the video into each follower's ``timeline_entries``
+in batches. Reading the timeline is then one range scan of
+``(user_id, created_at, video_id)``.
+
+Creators with more than ``TIMELINE_FANOUT_MAX_FOLLOWERS`` followers are not
+fanned out to (one video would mean that many inserts); they are recorded in
+``timeline_pull_creators`` and their videos are pulled from ``videos`` at read
+time and merged in.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..db.session import AsyncSessionLocal
+from ..models.media import CreatorFollower, Video
+from ..models.timeline import TimelineEntry, TimelineFanoutJob, TimelinePullCreator
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_timeline_fanout(session: AsyncSession, video: Video) -> None:
+    """
+    Queue a new video for fan-out to its creator's followers.
+
+    Call this before committing the video, so the job is part of the same
+    transaction.
+
+    Args:
+        session: Session holding the pending video
+        video: Newly created video
+    """
+    if not settings.timeline_fanout_enabled:
+        return
+    session.add(TimelineFanoutJob(video_id=video.id))
+
+
+async def backfill_timeline(session: AsyncSession, user_id: UUID, creator_handle: str) -> None:
+    """
+    Copy a creator's recent videos into a user's timeline after they follow them.
+
+    Pull creators are skipped: their videos are read from ``videos`` anyway.
+    The caller commits.
+
+    Args:
+        session: Database session
+        user_id: New follower
+        creator_handle: Followed creator
+    """
+    is_pull_creator = await session.scalar(
+        select(TimelinePullCreator.creator_handle).where(TimelinePullCreator.creator_handle == creator_handle)
+    )
+    if is_pull_creator is not None:
+        return
+
+    recent = (
+        select(
+            literal(user_id, PGUUID(as_uuid=True)),
+            Video.id,
+            Video.creator_handle,
+            Video.created_at,
+        )
+        .where(Video.creator_handle == creator_handle)
+        .order_by(Video.created_at.desc(), Video.id.desc())
+        .limit(settings.timeline_backfill_size)
+    )
+    await session.execute(
+        insert(TimelineEntry)
+        .from_select(["user_id", "video_id", "creator_handle", "created_at"], recent)
+        .on_conflict_do_nothing()
+    )
+
+
+async def remove_from_timeline(session: AsyncSession, user_id: UUID, creator_handle: str) -> None:
+    """
+    Remove a creator's videos from a user's timeline after they unfollow them.
+
+    The caller commits.
+
+    Args:
+        session: Database session
+        user_id: Former follower
+        creator_handle: Unfollowed creator
+    """
+    await session.execute(
+        delete(TimelineEntry).where(
+            TimelineEntry.user_id == user_id,
+            TimelineEntry.creator_handle == creator_handle,
+        )
+    )
+
+
+async def get_timeline_page(
+    session: AsyncSession,
+    user_id: UUID,
+    limit: int,
+    after: Optional[tuple[datetime, str]] = None,
+) -> list[tuple[datetime, str]]:
+    """
+    Read one page of a user's following timeline, newest first.
+
+    Merges the materialized entries with the latest videos of the pull
+    creators the user follows.
+
+    Args:
+        session: Database session
+        user_id: Timeline owner
+        limit: Page size
+        after: ``(created_at, video_id)`` of the previous page's last video
+
+    Returns:
+        ``(created_at, video_id)`` of the page's videos
+    """
+    stmt = select(TimelineEntry.created_at, TimelineEntry.video_id).where(TimelineEntry.user_id == user_id)
+    if after:
+        stmt = stmt.where(tuple_(TimelineEntry.created_at, TimelineEntry.video_id) < tuple_(*after))
+    stmt = stmt.order_by(TimelineEntry.created_at.desc(), TimelineEntry.video_id.desc()).limit(limit)
+    rows: list[tuple[datetime, str]] = [tuple(row) for row in await session.execute(stmt)]
+
+    pull_handles = list(
+        await session.scalars(
+            select(CreatorFollower.creator_handle)
+            .join(TimelinePullCreator, TimelinePullCreator.creator_handle == CreatorFollower.creator_handle)
+            .where(CreatorFollower.user_id == user_id)
+        )
+    )
+    if pull_handles:
+        pull = select(Video.created_at, Video.id).where(Video.creator_handle.in_(pull_handles))
+        if after:
+            pull = pull.where(tuple_(Video.created_at, Video.id) < tuple_(*after))
+        pull = pull.order_by(Video.created_at.desc(), Video.id.desc()).limit(limit)
+        # Videos fanned out before their creator became a pull creator appear in both
+        rows = sorted(set(rows) | {tuple(row) for row in await session.execute(pull)}, reverse=True)[:limit]
+
+    return rows
+
+
+class TimelineFanoutWorker:
+    """Background task copying new videos into followers' timelines."""
+
+    def __init__(
+        self,
+        poll_interval: float = settings.timeline_fanout_poll_interval_seconds,
+        batch_size: int = settings.timeline_fanout_batch_size,
+        max_followers: int = settings.timeline_fanout_max_followers,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            poll_interval: Seconds to wait when no job is pending
+            batch_size: Followers written per transaction
+            max_followers: Follower count above which a creator is pulled instead
+        """
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.max_followers = max_followers
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """Start fanning out in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                ran = await self.run_once()
+            except Exception as exc:
+                logger.warning(f"Timeline fan-out failed, will retry: {exc}")
+                ran = False
+
+            if not ran:
+                await asyncio.sleep(self.poll_interval)
+
+    async def run_once(self) -> bool:
+        """
+        Fan one batch of followers out for the oldest pending job.
+
+        Jobs are locked with SKIP LOCKED, so several app processes can work
+        concurrently; a large job commits after every batch and resumes from
+        the last follower written.
+
+        Returns:
+            True if a batch was processed, False if no job was pending
+        """
+        async with AsyncSessionLocal() as session:
+            job = await session.scalar(
+                select(TimelineFanoutJob)
+                .order_by(TimelineFanoutJob.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            if job is None:
+                return False
+
+            video = await session.get(Video, job.video_id)
+            if video is None:
+                await session.delete(job)
+                await session.commit()
+                return True
+
+            if job.last_user_id is None and await self._is_pull_creator(session, video.creator_handle):
+                logger.info(f"Video {video.id} not fanned out: {video.creator_handle} is a pull creator")
+                await session.delete(job)
+                await session.commit()
+                return True
+
+            followers = select(CreatorFollower.user_id).where(CreatorFollower.creator_handle == video.creator_handle)
+            if job.last_user_id is not None:
+                followers = followers.where(CreatorFollower.user_id > job.last_user_id)
+            user_ids = list(await session.scalars(followers.order_by(CreatorFollower.user_id).limit(self.batch_size)))
+
+            if user_ids:
+                await session.execute(
+                    insert(TimelineEntry)
+                    .values(
+                        [
+                            {
+                                "user_id": user_id,
+                                "video_id": video.id,
+                                "creator_handle": video.creator_handle,
+                                "created_at": video.created_at,
+                            }
+                            for user_id in user_ids
+                        ]
+                    )
+                    .on_conflict_do_nothing()
+                )
+
+            if len(user_ids) < self.batch_size:
+                await session.delete(job)
+            else:
+                job.last_user_id = user_ids[-1]
+            await session.commit()
+            return True
+
+    async def _is_pull_creator(self, session: AsyncSession, creator_handle: str) -> bool:
+        """Check whether a creator is pulled, recording them if they just crossed the threshold."""
+        known = await session.scalar(
+            select(TimelinePullCreator.creator_handle).where(TimelinePullCreator.creator_handle == creator_handle)
+        )
+        if known is not None:
+            return True
+
+        follower_count = await session.scalar(
+            select(func.count()).select_from(CreatorFollower).where(CreatorFollower.creator_handle == creator_handle)
+        )
+        if follower_count <= self.max_followers:
+            return False
+
+        await session.execute(
+            insert(TimelinePullCreator)
+            .values(creator_handle=creator_handle, follower_count=follower_count)
+            .on_conflict_do_nothing()
+        )
+        return True
@@ -0,0 +1,117 @@
+"""Time-decayed trending scores.
+
+An item's trending score is its weighted engagement, each interaction
+decaying with a half-life of ``TRENDING_HALF_LIFE_HOURS``:
+
+    score(t) = sum(weight * delta * 2 ** -((t - t_delta) / half_life))
+
+Decaying every row on a schedule would rewrite the whole table each time.
+Instead the stored ``trending_score`` is the log of the same sum measured
+against a fixed epoch, ``ln(sum(weight * delta * e ** (rate * (t_delta - epoch))))``.
+It differs from ``ln(score(t))`` by ``rate * (t - epoch)``, the same amount
+for every row, so ordering by the stored value orders by the current decayed
+score and a row only changes when it gets new engagement. The update is folded
+into the engagement counter flush, which already writes exactly those rows.
+
+Stored scores are only comparable under a single rate, so the half-life is a
+constant rather than a setting: changing it means rescoring every row, and
+the migration seeding the scores uses the same value.
+"""
+import math
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import Float, case, func, literal
+from sqlalchemy.sql.expression import ColumnElement, FromClause
+
+from ..models.event import CulturalEvent
+from ..models.media import Video
+
+TRENDING_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+TRENDING_HALF_LIFE_HOURS = 24.0
+
+# Decay rate per second
+_DECAY_RATE = math.log(2) / (TRENDING_HALF_LIFE_HOURS * 3600)
+
+# Weight of each counter in the score; the video mix matches the app's popularity sort
+TRENDING_WEIGHTS: dict[type, dict[str, float]] = {
+    Video: {"likes": 0.6, "comments": 0.4, "shares": 1.1},
+    CulturalEvent: {"interested_count": 1.0},
+}
+
+# Postgres raises on exp() underflow; beyond this the smaller term is negligible anyway
+_MAX_EXP_ARGUMENT = 700.0
+
+
+def epoch_offset(now: datetime) -> float:
+    """
+    Log-space offset of a moment from the epoch.
+
+    Subtracting it from a stored score gives ``ln(score(now))``.
+
+    Args:
+        now: Timezone-aware moment
+
+    Returns:
+        ``rate * (now - epoch)``
+    """
+    return _DECAY_RATE * (now - TRENDING_EPOCH).total_seconds()
+
+
+def trending_score_expression(
+    current: ColumnElement[float],
+    gain: ColumnElement[float],
+    now: datetime,
+) -> ColumnElement[float]:
+    """
+    Build the score of a row after adding weighted engagement to it.
+
+    Adds ``gain`` recorded at ``now`` to the stored score with a log-sum-exp,
+    so it stays finite however far ``now`` is from the epoch. Rows whose gain
+    is not positive (unlikes, withdrawn interest) keep their score: decay
+    already takes engagement away over time.
+
+    Args:
+        current: Stored ``trending_score`` column
+        gain: Weighted engagement delta of the row
+        now: Time the engagement is credited to
+
+    Returns:
+        Expression for the new score
+    """
+    # greatest() keeps ln() defined; the CASE below discards the value then
+    added = func.ln(func.greatest(gain, 1e-9)) + literal(epoch_offset(now), Float)
+    merged = func.greatest(current, added) + func.ln(
+        1 + func.exp(-func.least(func.abs(current - added), _MAX_EXP_ARGUMENT))
+    )
+    return case(
+        (gain <= 0, current),
+        (current.is_(None), added),
+        else_=merged,
+    )
+
+
+def trending_score_update(
+    model: type,
+    deltas: FromClause,
+    columns: list[str],
+    now: datetime,
+) -> Optional[ColumnElement[float]]:
+    """
+    Build the ``SET trending_score = ...`` clause of an engagement counter flush.
+
+    Args:
+        model: Table being updated
+        deltas: ``VALUES`` clause of the flush, with one column per counter
+        columns: Counter columns present in ``deltas``
+        now: Time the deltas are credited to
+
+    Returns:
+        Expression for the new score, or None if the table or the columns do
+        not contribute to trending
+    """
+    weights = TRENDING_WEIGHTS.get(model, {})
+    terms = [deltas.c[key] * literal(weights[key], Float) for key in columns if key in weights]
+    if not terms:
+        return None
+    return trending_score_expression(model.trending_score, sum(terms[1:], terms[0]), now)
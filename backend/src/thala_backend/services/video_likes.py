@@ -0,0 +1,91 @@
+"""Per-user video likes.
+
+Each like is a ``video_likes`` row keyed by ``(video_id, user_id)``, toggled
+with single-statement inserts and deletes so concurrent toggles never let a
+user like twice. The ``Video.likes`` counter follows through the engagement
+counter aggregator.
+"""
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete, literal, select
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.media import Video, VideoLike
+
+
+async def toggle_video_like(session: AsyncSession, video_id: str, user_id: UUID) -> Optional[int]:
+    """
+    Like a video, or remove the like if the user already liked it.
+
+    The like row is inserted with ``ON CONFLICT DO NOTHING``; if it already
+    existed it is deleted instead. The caller commits, then applies the
+    returned delta to ``Video.likes`` through the engagement counters.
+
+    Args:
+        session: Database session
+        video_id: Video to like or unlike
+        user_id: User toggling the like
+
+    Returns:
+        1 if the video is now liked, -1 if the like was removed, 0 if a
+        concurrent request already removed it, or None if the video does not
+        exist
+    """
+    # INSERT ... SELECT so a missing video inserts nothing instead of failing the FK
+    inserted = await session.scalar(
+        insert(VideoLike)
+        .from_select(
+            ["video_id", "user_id", "created_at"],
+            select(
+                Video.id,
+                literal(user_id, PGUUID(as_uuid=True)),
+                literal(datetime.now(timezone.utc)),
+            ).where(Video.id == video_id),
+        )
+        .on_conflict_do_nothing(index_elements=["video_id", "user_id"])
+        .returning(VideoLike.video_id)
+    )
+    if inserted is not None:
+        return 1
+
+    deleted = await session.scalar(
+        delete(VideoLike)
+        .where(VideoLike.video_id == video_id, VideoLike.user_id == user_id)
+        .returning(VideoLike.video_id)
+    )
+    if deleted is not None:
+        return -1
+
+    # Neither inserted nor deleted: the video does not exist, or a concurrent
+    # unlike won the race
+    exists = await session.scalar(select(Video.id).where(Video.id == video_id))
+    return None if exists is None else 0
+
+
+async def get_liked_video_ids(session: AsyncSession, user_id: UUID, video_ids: Iterable[str]) -> set[str]:
+    """
+    Find which of a page of videos a user has liked, in one query.
+
+    Args:
+        session: Database session
+        user_id: Viewing user
+        video_ids: Videos on the page
+
+    Returns:
+        IDs of the videos the user liked
+    """
+    video_ids = list(set(video_ids))
+    if not video_ids:
+        return set()
+
+    result = await session.scalars(
+        select(VideoLike.video_id).where(
+            VideoLike.user_id == user_id,
+            VideoLike.video_id.in_(video_ids),
+        )
+    )
+    return set(result.all())